@@ -1,22 +1,28 @@
 """
 Enhanced Icon class for CuteWindow with automatic high-DPI support.
 
-This class extends QIcon to provide automatic high-DPI icon loading
-by selecting appropriate @2x.png files when needed.
+This class extends QIcon to provide automatic high-DPI icon loading. All
+available density variants of an icon file (@2x.png, @3x.png) are registered
+once, and Qt picks the right one for each screen. Icons created from a path
+are shared through the process-wide icon cache.
 """
 
 from typing import Optional, Union
 
 from PySide6.QtCore import QSize
-from PySide6.QtGui import QGuiApplication, QIcon, QPixmap
+from PySide6.QtGui import QIcon, QPixmap
+
+from cutewindow.icon_cache import addResolutionVariants, icon_cache
 
 
 class Icon(QIcon):
     """
     Enhanced QIcon with automatic high-DPI support.
 
-    This class automatically detects the screen's pixel ratio and loads
-    appropriate high-resolution icons (@2x.png) when available.
+    This class registers the high-resolution variants of an icon file
+    (@2x.png, @3x.png) next to the file itself, so windows on screens of any
+    pixel ratio get an unscaled pixmap without reloading the icon. Icons
+    created from the same path share their decoded pixmaps.
 
     Args:
         icon_path: Path to icon file or QPixmap object. If None, creates empty icon.
@@ -26,36 +32,15 @@ class Icon(QIcon):
     """
 
     def __init__(self, icon_path: Union[str, QPixmap, None] = None) -> None:
-        super().__init__()
-
         if icon_path is None:
-            return
+            super().__init__()
         elif isinstance(icon_path, str):
-            processed_path = self._process_icon_path(icon_path)
-            super().__init__(processed_path)
+            super().__init__(icon_cache.icon(icon_path))
         elif isinstance(icon_path, QPixmap):
             super().__init__(icon_path)
         else:
             raise ValueError(f"Expected str or QPixmap, got {type(icon_path).__name__}")
 
-    def _process_icon_path(self, icon_path: str) -> str:
-        """
-        Process icon path for high-DPI displays.
-
-        Args:
-            icon_path: Original icon path.
-
-        Returns:
-            Processed icon path with @2x suffix if needed.
-        """
-        if not hasattr(QGuiApplication, "primaryScreen"):
-            return icon_path
-
-        screen = QGuiApplication.primaryScreen()
-        if screen and 1 < screen.devicePixelRatio() < 2:
-            return icon_path.replace(".png", "@2x.png")
-        return icon_path
-
     def addFile(
         self,
         fileName: str,
@@ -64,7 +49,7 @@ class Icon(QIcon):
         state: Optional[QIcon.State] = None,
     ) -> None:
         """
-        Add an icon file with automatic high-DPI processing.
+        Add an icon file together with its high-DPI variants.
 
         Args:
             fileName: Path to the icon file.
@@ -72,10 +57,10 @@ class Icon(QIcon):
             mode: Mode of the icon (optional).
             state: State of the icon (optional).
         """
-        processed_file = self._process_icon_path(fileName)
-        super().addFile(
-            processed_file,
-            QSize() if size is None else size,
+        addResolutionVariants(
+            self,
+            fileName,
+            size,
             QIcon.Normal if mode is None else mode,
             QIcon.Off if state is None else state,
         )
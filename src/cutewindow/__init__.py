@@ -4,9 +4,16 @@ and customization.
 
 This package provides a unified interface for creating customizable windows
 with native window controls and behaviors across different platforms.
+
+The public classes are imported on first access, so ``import cutewindow`` does
+not load a platform backend or Qt until a window class is used.
 """
 
-from .platforms import CuteDialog, CuteMainWindow, CuteWindow, TitleBar
+from importlib import import_module
+from typing import TYPE_CHECKING, Any, List
+
+if TYPE_CHECKING:
+    from .platforms import CuteDialog, CuteMainWindow, CuteWindow, TitleBar
 
 __version__ = "0.1.0"
 __author__ = "Parham Oyan"
@@ -14,3 +21,14 @@ __email__ = "parhamoyan@yahoo.com"
 __license__ = "MIT"
 
 __all__ = ["CuteWindow", "CuteMainWindow", "CuteDialog", "TitleBar"]
+
+
+def __getattr__(name: str) -> Any:
+    if name not in __all__:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    # Not stored in the module, so the backend registry stays the only cache
+    return getattr(import_module(".platforms", __name__), name)
+
+
+def __dir__() -> List[str]:
+    return sorted(set(globals()) | set(__all__))
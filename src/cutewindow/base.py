@@ -9,11 +9,14 @@ specificity.
 """
 
 from abc import abstractmethod
-from typing import Optional
+from typing import Callable, List, Optional
 
+from PySide6.QtCore import QEvent, Qt
 from PySide6.QtGui import QResizeEvent, QShowEvent
 from PySide6.QtWidgets import QWidget
 
+from cutewindow.window_shape import WindowShape
+
 
 class BaseCuteWindow(QWidget):
     """
@@ -127,6 +130,15 @@ class CuteWindowMixin:
         the standard Qt widget interface including update(), showEvent(),
         resizeEvent(), width(), and winId() methods.
 
+    Window state changes are delivered to listeners registered with
+    :meth:`addWindowStateListener`, such as the title bar, from the window's
+    own ``changeEvent``. Listeners therefore see no other events of the window
+    and add no cost to them, unlike an event filter on the window.
+
+    A window shape set with :meth:`setWindowShape` is applied natively where
+    the platform supports it, and otherwise as a mask taken from the shape's
+    cache on every resize. Maximized and fullscreen windows are not masked.
+
     Attributes:
         _title_bar (Optional[QWidget]): The title bar widget instance.
     """
@@ -139,6 +151,10 @@ class CuteWindowMixin:
             *args: Variable length argument list passed to parent class.
             **kwargs: Arbitrary keyword arguments passed to parent class.
         """
+        self._window_state_listeners: List[Callable[[Qt.WindowStates], None]] = []
+        self._window_shape: Optional[WindowShape] = None
+        self._native_window_shape = False
+        self._masked = False
         super().__init__(*args, **kwargs)
         self._title_bar: Optional[QWidget] = None
 
@@ -162,6 +178,91 @@ class CuteWindowMixin:
         if hasattr(self, "update"):
             self.update()  # type: ignore
 
+    def addWindowStateListener(
+        self, listener: Callable[[Qt.WindowStates], None]
+    ) -> None:
+        """
+        Call a function with the new window state whenever it changes.
+
+        Args:
+            listener (Callable[[Qt.WindowStates], None]): The function to call.
+        """
+        self._window_state_listeners.append(listener)
+
+    def removeWindowStateListener(
+        self, listener: Callable[[Qt.WindowStates], None]
+    ) -> None:
+        """
+        Stop calling a function added with :meth:`addWindowStateListener`.
+
+        Args:
+            listener (Callable[[Qt.WindowStates], None]): The function to remove.
+        """
+        if listener in self._window_state_listeners:
+            self._window_state_listeners.remove(listener)
+
+    def changeEvent(self, event: QEvent) -> None:
+        """Handle change events to notify window state listeners."""
+        if hasattr(super(), "changeEvent"):
+            super().changeEvent(event)  # type: ignore
+        if event.type() == QEvent.WindowStateChange:  # type: ignore
+            state = self.windowState()  # type: ignore[attr-defined]
+            for listener in tuple(self._window_state_listeners):
+                listener(state)
+            if self._window_shape is not None:
+                self._applyWindowShape()
+
+    def windowShape(self) -> Optional[WindowShape]:
+        """
+        Get the shape of the window.
+
+        Returns:
+            Optional[WindowShape]: The shape, or None for a rectangular window.
+        """
+        return self._window_shape
+
+    def setWindowShape(self, shape: Optional[WindowShape]) -> None:
+        """
+        Set the shape of the window, such as rounded corners.
+
+        Args:
+            shape (Optional[WindowShape]): The shape, or None for a
+                rectangular window.
+        """
+        self._window_shape = shape
+        self._native_window_shape = self.applyNativeWindowShape(shape)
+        self._applyWindowShape()
+
+    def applyNativeWindowShape(self, shape: Optional[WindowShape]) -> bool:
+        """
+        Apply a window shape through the platform, without a mask.
+
+        Platforms that can shape windows natively override this method.
+
+        Args:
+            shape (Optional[WindowShape]): The shape to apply, or None to
+                restore the platform's default shape.
+
+        Returns:
+            bool: True if the platform applied the shape, False to use a mask.
+        """
+        return False
+
+    def _applyWindowShape(self) -> None:
+        shape = self._window_shape
+        if (
+            shape is None
+            or self._native_window_shape
+            or self.isMaximized()  # type: ignore[attr-defined]
+            or self.isFullScreen()  # type: ignore[attr-defined]
+        ):
+            if self._masked:
+                self.clearMask()  # type: ignore[attr-defined]
+                self._masked = False
+            return
+        self.setMask(shape.region(self.size()))  # type: ignore[attr-defined]
+        self._masked = True
+
     def showEvent(self, event: QShowEvent) -> None:
         """Handle show event to raise title bar."""
         if hasattr(self, "_title_bar") and self._title_bar:
@@ -177,6 +278,8 @@ class CuteWindowMixin:
             self._title_bar.resize(
                 self.width(), self._title_bar.height()  # type: ignore
             )
+        if self._window_shape is not None:
+            self._applyWindowShape()
 
     def setNonResizable(self) -> None:
         """Make the window non-resizable."""
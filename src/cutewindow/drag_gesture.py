@@ -0,0 +1,211 @@
+"""
+Title bar drag gestures for customizable windows.
+
+A window is moved by handing the drag over to the system, which then runs the
+move loop itself. :class:`DragGesture` makes sure that happens exactly once per
+gesture: a left press on the title bar arms the gesture, the first mouse move
+beyond the application's drag distance hands it over, and every later event of
+the gesture is ignored. Presses on interactive children, such as buttons or
+registered search fields, and double clicks never start a move, so clicks and
+double-click maximizing keep working.
+
+The handover goes through ``QWindow.startSystemMove()`` where the platform
+supports it, and otherwise through the platform's own move function.
+
+Example:
+    >>> gesture = DragGesture(title_bar, startSystemMove)
+    >>> # in TitleBar.mousePressEvent
+    >>> gesture.press(event)
+    >>> # in TitleBar.mouseMoveEvent
+    >>> gesture.move(event)
+"""
+
+from enum import IntEnum, auto
+from typing import Callable, Dict, Optional
+from weakref import ref
+
+from PySide6.QtCore import QPoint, Qt
+from PySide6.QtGui import QMouseEvent
+from PySide6.QtWidgets import QAbstractButton, QApplication, QWidget
+
+StartSystemMove = Callable[[QWidget, QPoint], None]
+IsInteractive = Callable[[QWidget, QPoint], bool]
+
+
+class DragState(IntEnum):
+    """
+    Enumeration of drag gesture states.
+
+    - IDLE: No gesture in progress
+    - PRESSED: The left button is down, the drag distance is not reached yet
+    - MOVING: The move was handed over to the system
+    """
+
+    IDLE = auto()
+    PRESSED = auto()
+    MOVING = auto()
+
+
+def isInteractiveChild(widget: QWidget, pos: QPoint) -> bool:
+    """
+    Check if a point of a widget lies on a child that takes mouse input.
+
+    Buttons and children that accept focus by clicking are interactive.
+
+    Args:
+        widget (QWidget): The widget, usually a title bar.
+        pos (QPoint): The point in widget coordinates.
+
+    Returns:
+        bool: True if the child under the point is interactive.
+    """
+    child = widget.childAt(pos)
+    while child is not None and child is not widget:
+        if isinstance(child, QAbstractButton):
+            return True
+        if child.focusPolicy() & Qt.ClickFocus:  # type: ignore
+            return True
+        child = child.parentWidget()
+    return False
+
+
+class DragGesture:
+    """
+    State machine handing each title bar drag over to the system once.
+
+    The gesture holds its widget weakly, so a title bar that owns its gesture
+    is freed by reference counting as soon as it is no longer used, and never
+    later by the cyclic garbage collector while Qt is busy with other widgets.
+    """
+
+    def __init__(
+        self,
+        widget: QWidget,
+        startSystemMove: StartSystemMove,
+        isInteractive: Optional[IsInteractive] = None,
+    ) -> None:
+        """
+        Initialize the drag gesture.
+
+        Args:
+            widget (QWidget): The widget the mouse events come from.
+            startSystemMove (StartSystemMove): The platform's move function,
+                used where ``QWindow.startSystemMove()`` is not supported.
+            isInteractive (Optional[IsInteractive]): Check if a point in
+                widget coordinates lies on an interactive child of the widget,
+                defaults to :func:`isInteractiveChild`. Pass an unbound method
+                rather than a bound one to keep the widget free of cycles.
+        """
+        self._widget = ref(widget)
+        self._start_system_move = startSystemMove
+        self._is_interactive = isInteractive or isInteractiveChild
+        self._state = DragState.IDLE
+        self._press_pos = QPoint()
+        self._gestures = 0
+        self._moves = 0
+        self._fallback_moves = 0
+
+    def widget(self) -> Optional[QWidget]:
+        """
+        Get the widget the mouse events come from.
+
+        Returns:
+            Optional[QWidget]: The widget, or None once it has been freed.
+        """
+        return self._widget()
+
+    def state(self) -> DragState:
+        """
+        Get the state of the gesture.
+
+        Returns:
+            DragState: The current state.
+        """
+        return self._state
+
+    def press(self, event: QMouseEvent) -> bool:
+        """
+        Arm the gesture on a left press outside interactive children.
+
+        Args:
+            event (QMouseEvent): The mouse press event.
+
+        Returns:
+            bool: True if the press armed the gesture.
+        """
+        self._state = DragState.IDLE
+        widget = self._widget()
+        if widget is None or event.button() != Qt.LeftButton:  # type: ignore
+            return False
+        if self._is_interactive(widget, event.position().toPoint()):
+            return False
+
+        self._state = DragState.PRESSED
+        self._press_pos = event.globalPosition().toPoint()
+        self._gestures += 1
+        return True
+
+    def move(self, event: QMouseEvent) -> bool:
+        """
+        Hand the move over to the system once the drag distance is reached.
+
+        Args:
+            event (QMouseEvent): The mouse move event.
+
+        Returns:
+            bool: True if this event started the system move.
+        """
+        widget = self._widget()
+        if self._state != DragState.PRESSED or widget is None:
+            return False
+        if not event.buttons() & Qt.LeftButton:  # type: ignore
+            # The release happened outside of the widget
+            self._state = DragState.IDLE
+            return False
+        pos = event.globalPosition().toPoint()
+        if (pos - self._press_pos).manhattanLength() < QApplication.startDragDistance():
+            return False
+
+        self._state = DragState.MOVING
+        self._moves += 1
+        window = widget.window()
+        handle = window.windowHandle()
+        if handle is None or not handle.startSystemMove():
+            self._fallback_moves += 1
+            self._start_system_move(window, pos)
+        return True
+
+    def release(self, event: Optional[QMouseEvent] = None) -> None:
+        """
+        End the gesture.
+
+        The system may swallow the release of a move it ran itself, so a new
+        press ends a previous gesture as well.
+
+        Args:
+            event (Optional[QMouseEvent]): The mouse release event.
+        """
+        self._state = DragState.IDLE
+
+    def doubleClick(self, event: Optional[QMouseEvent] = None) -> None:
+        """
+        Cancel the gesture, as the press belongs to a double click.
+
+        Args:
+            event (Optional[QMouseEvent]): The mouse double-click event.
+        """
+        self._state = DragState.IDLE
+
+    def statistics(self) -> Dict[str, int]:
+        """
+        Get how many gestures were armed and how many became system moves.
+
+        Returns:
+            Dict[str, int]: The number of armed "gestures", of system "moves"
+            and of moves that used the platform "fallback".
+        """
+        return {
+            "gestures": self._gestures,
+            "moves": self._moves,
+            "fallback": self._fallback_moves,
+        }
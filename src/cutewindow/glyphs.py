@@ -0,0 +1,146 @@
+"""
+Procedurally drawn window control glyphs.
+
+The close, maximize, minimize and restore glyphs are drawn with QPainter
+directly in device pixels, with stroke widths rounded to whole device pixels,
+so they are crisp at every scale factor, including fractional ones such as
+1.25 or 1.75. Each combination of glyph, logical size, device pixel ratio,
+state and color is drawn once per process and cached.
+
+They are used instead of the bundled PNG icons when the title bar theme sets
+``procedural_glyphs``.
+"""
+
+from enum import Enum, IntEnum, auto
+from functools import lru_cache
+from typing import Dict
+
+from PySide6.QtCore import QPointF, QRectF, QSize, Qt
+from PySide6.QtGui import QColor, QPainter, QPen, QPixmap
+
+#: Logical size of the square the glyph strokes fit in
+GLYPH_EXTENT = 10
+
+
+class Glyph(str, Enum):
+    """
+    Enumeration of window control glyphs.
+
+    The values match the names of the bundled icon files.
+    """
+
+    CLOSE = "close"
+    MAXIMIZE = "maximize"
+    MINIMIZE = "minimize"
+    RESTORE = "restore"
+
+
+class GlyphState(IntEnum):
+    """
+    Enumeration of the button states a glyph is drawn for.
+
+    - NORMAL: The button is idle
+    - HOVER: The button is hovered
+    - PRESSED: The button is pressed
+    """
+
+    NORMAL = auto()
+    HOVER = auto()
+    PRESSED = auto()
+
+
+def glyphPixmap(
+    glyph: Glyph,
+    size: QSize,
+    device_pixel_ratio: float,
+    state: GlyphState,
+    color: QColor,
+) -> QPixmap:
+    """
+    Get a glyph drawn at the exact device pixel size, drawing it on first use.
+
+    Args:
+        glyph (Glyph): The glyph to draw.
+        size (QSize): The logical size of the pixmap; the glyph is centered.
+        device_pixel_ratio (float): The device pixel ratio to draw for.
+        state (GlyphState): The state of the button showing the glyph.
+        color (QColor): The stroke color.
+
+    Returns:
+        QPixmap: The cached pixmap, tagged with the device pixel ratio.
+    """
+    return _drawGlyph(
+        glyph, size.width(), size.height(), device_pixel_ratio, state, color.rgba()
+    )
+
+
+def glyphCacheStatistics() -> Dict[str, int]:
+    """
+    Get how often cached glyphs were reused versus drawn.
+
+    Returns:
+        Dict[str, int]: The number of "hits" and "misses" and the cache "size".
+    """
+    info = _drawGlyph.cache_info()
+    return {"hits": info.hits, "misses": info.misses, "size": info.currsize}
+
+
+@lru_cache(maxsize=256)
+def _drawGlyph(
+    glyph: Glyph,
+    width: int,
+    height: int,
+    device_pixel_ratio: float,
+    state: GlyphState,
+    rgba: int,
+) -> QPixmap:
+    device_width = round(width * device_pixel_ratio)
+    device_height = round(height * device_pixel_ratio)
+    pixmap = QPixmap(device_width, device_height)
+    pixmap.fill(Qt.transparent)  # type: ignore
+
+    # Everything below is in device pixels, strokes are whole pixels wide
+    stroke = max(1, round(device_pixel_ratio))
+    extent = round(GLYPH_EXTENT * device_pixel_ratio)
+    left = (device_width - extent) // 2
+    top = (device_height - extent) // 2
+    half = stroke / 2
+
+    pen = QPen(QColor.fromRgba(rgba))
+    pen.setWidth(stroke)
+    pen.setCapStyle(Qt.FlatCap)  # type: ignore
+    pen.setJoinStyle(Qt.MiterJoin)  # type: ignore
+    painter = QPainter(pixmap)
+    painter.setPen(pen)
+
+    if glyph == Glyph.MINIMIZE:
+        y = top + extent // 2 + half
+        painter.drawLine(QPointF(left, y), QPointF(left + extent, y))
+    elif glyph == Glyph.MAXIMIZE:
+        painter.drawRect(
+            QRectF(left + half, top + half, extent - stroke, extent - stroke)
+        )
+    elif glyph == Glyph.RESTORE:
+        offset = round(2 * device_pixel_ratio)
+        front = extent - offset
+        painter.drawRect(
+            QRectF(left + half, top + offset + half, front - stroke, front - stroke)
+        )
+        right = left + extent - half
+        painter.drawPolyline(
+            [
+                QPointF(left + offset + half, top + offset),
+                QPointF(left + offset + half, top + half),
+                QPointF(right, top + half),
+                QPointF(right, top + front - half),
+                QPointF(left + front, top + front - half),
+            ]
+        )
+    elif glyph == Glyph.CLOSE:
+        painter.setRenderHint(QPainter.Antialiasing)  # type: ignore
+        painter.drawLine(QPointF(left, top), QPointF(left + extent, top + extent))
+        painter.drawLine(QPointF(left + extent, top), QPointF(left, top + extent))
+
+    painter.end()
+    pixmap.setDevicePixelRatio(device_pixel_ratio)
+    return pixmap
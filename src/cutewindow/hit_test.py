@@ -0,0 +1,261 @@
+"""
+Precomputed hit-test regions for customizable windows.
+
+Native hit testing runs on every mouse move over a window, so it must not walk
+the widget tree. This module provides an index of the title bar's interactive
+rectangles and caption area, together with the window's resize borders. The
+rectangles are gathered once and only gathered again after the title bar's
+geometry or layout changes, which turns each hit test into a binary search over
+a handful of rectangles.
+
+Buttons inside the title bar are always interactive. Other widgets that need
+mouse input, such as search fields or tabs, are registered explicitly. The index
+is platform-agnostic: it answers with :class:`HitRegion` values that each
+platform maps to its own native codes.
+
+Example:
+    >>> index = HitTestIndex(title_bar)
+    >>> index.addInteractiveWidget(search_field)
+    >>> index.setResizeBorders(8, 8)
+    >>> index.hitTest(120, 10)
+    <HitRegion.CAPTION: 2>
+"""
+
+from bisect import bisect_right
+from enum import IntEnum, auto
+from typing import Dict, List, Optional, Tuple
+
+from PySide6.QtCore import QEvent, QObject, QPoint
+from PySide6.QtWidgets import QAbstractButton, QWidget
+from shiboken6 import isValid
+
+
+class HitRegion(IntEnum):
+    """
+    Enumeration of the regions a window point can fall into.
+
+    - CLIENT: Regular client area handled by Qt
+    - CAPTION: Draggable title bar area
+    - INTERACTIVE: Interactive title bar widget (buttons, fields, tabs...)
+    - MAXIMIZE_BUTTON: The title bar's maximize/restore button
+    - LEFT, RIGHT, TOP, BOTTOM and the corners: Resize borders
+    """
+
+    CLIENT = auto()
+    CAPTION = auto()
+    INTERACTIVE = auto()
+    MAXIMIZE_BUTTON = auto()
+    LEFT = auto()
+    RIGHT = auto()
+    TOP = auto()
+    BOTTOM = auto()
+    TOP_LEFT = auto()
+    TOP_RIGHT = auto()
+    BOTTOM_LEFT = auto()
+    BOTTOM_RIGHT = auto()
+
+
+# Title bar events after which the cached rectangles may be out of date
+_INVALIDATING_EVENTS = frozenset(
+    (
+        QEvent.Type.Resize,
+        QEvent.Type.Move,
+        QEvent.Type.Show,
+        QEvent.Type.Hide,
+        QEvent.Type.LayoutRequest,
+        QEvent.Type.ChildAdded,
+        QEvent.Type.ChildRemoved,
+    )
+)
+
+# (left, top, right, bottom, region), right and bottom exclusive
+_Entry = Tuple[int, int, int, int, HitRegion]
+
+
+class HitTestIndex(QObject):
+    """
+    Index of a title bar's hit-test regions in window coordinates.
+
+    The index watches the title bar for geometry and layout changes and marks
+    itself dirty; the rectangles are rebuilt lazily on the next query. Buttons
+    in the title bar and widgets registered with :meth:`addInteractiveWidget`
+    are reported as interactive instead of caption, so they receive mouse input
+    normally.
+
+    Attributes:
+        None (all state is private)
+
+    Example:
+        >>> index = HitTestIndex(title_bar)
+        >>> index.addInteractiveWidget(title_bar.close_button)
+    """
+
+    def __init__(self, title_bar: QWidget) -> None:
+        """
+        Initialize the hit-test index.
+
+        Args:
+            title_bar (QWidget): The title bar whose regions are indexed.
+        """
+        super().__init__(title_bar)
+
+        self._widgets: Dict[QWidget, HitRegion] = {}
+        self._border_width = 0
+        self._border_height = 0
+
+        self._dirty = True
+        self._caption = (0, 0, 0, 0)
+        self._lefts: List[int] = []
+        self._entries: List[_Entry] = []
+        self._max_rights: List[int] = []
+
+        title_bar.installEventFilter(self)
+
+    def addInteractiveWidget(
+        self, widget: QWidget, region: HitRegion = HitRegion.INTERACTIVE
+    ) -> None:
+        """
+        Register a title bar child that should receive mouse input.
+
+        Args:
+            widget (QWidget): A descendant of the title bar.
+            region (HitRegion): The region reported for the widget, defaults to
+                HitRegion.INTERACTIVE.
+        """
+        self._widgets[widget] = region
+        self._dirty = True
+
+    def removeInteractiveWidget(self, widget: QWidget) -> None:
+        """
+        Unregister a widget added with :meth:`addInteractiveWidget`.
+
+        Args:
+            widget (QWidget): The widget to unregister.
+        """
+        if self._widgets.pop(widget, None) is not None:
+            self._dirty = True
+
+    def setResizeBorders(self, width: int, height: int) -> None:
+        """
+        Set the thickness of the window's resize borders.
+
+        Args:
+            width (int): Width of the left and right borders.
+            height (int): Height of the top and bottom borders.
+        """
+        self._border_width = width
+        self._border_height = height
+
+    def invalidate(self) -> None:
+        """Mark the cached rectangles as stale so they are rebuilt on next use."""
+        self._dirty = True
+
+    def hitTest(self, x: int, y: int, resizable: bool = True) -> HitRegion:
+        """
+        Find the region under a point.
+
+        Args:
+            x (int): X coordinate in window coordinates.
+            y (int): Y coordinate in window coordinates.
+            resizable (bool): Whether the resize borders are active, defaults
+                to True.
+
+        Returns:
+            HitRegion: The region under the point.
+        """
+        if resizable:
+            region = self._borderAt(x, y)
+            if region is not None:
+                return region
+
+        if self._dirty:
+            self._rebuild()
+
+        i = bisect_right(self._lefts, x) - 1
+        max_rights = self._max_rights
+        entries = self._entries
+        while i >= 0 and max_rights[i] > x:
+            left, top, right, bottom, region = entries[i]
+            if x < right and top <= y < bottom:
+                return region
+            i -= 1
+
+        left, top, right, bottom = self._caption
+        if left <= x < right and max(top, self._border_height) < y < bottom:
+            return HitRegion.CAPTION
+        return HitRegion.CLIENT
+
+    def _borderAt(self, x: int, y: int) -> Optional[HitRegion]:
+        window = self.parent().window()  # type: ignore[attr-defined]
+        bw, bh = self._border_width, self._border_height
+        lx = x < bw
+        rx = x > window.width() - bw
+        ty = y < bh
+        by = y > window.height() - bh
+
+        if lx and ty:
+            return HitRegion.TOP_LEFT
+        if rx and by:
+            return HitRegion.BOTTOM_RIGHT
+        if rx and ty:
+            return HitRegion.TOP_RIGHT
+        if lx and by:
+            return HitRegion.BOTTOM_LEFT
+        if ty:
+            return HitRegion.TOP
+        if by:
+            return HitRegion.BOTTOM
+        if lx:
+            return HitRegion.LEFT
+        if rx:
+            return HitRegion.RIGHT
+        return None
+
+    def _rebuild(self) -> None:
+        title_bar: QWidget = self.parent()  # type: ignore[assignment]
+        window = title_bar.window()
+        origin = QPoint(0, 0)
+
+        pos = title_bar.mapTo(window, origin)
+        self._caption = (
+            pos.x(),
+            pos.y(),
+            pos.x() + title_bar.width(),
+            pos.y() + title_bar.height(),
+        )
+
+        # Forget registered widgets that have been deleted in the meantime
+        self._widgets = {w: r for w, r in self._widgets.items() if isValid(w)}
+
+        regions = dict.fromkeys(
+            title_bar.findChildren(QAbstractButton), HitRegion.INTERACTIVE
+        )
+        regions.update(self._widgets)
+
+        entries: List[_Entry] = []
+        for widget, region in regions.items():
+            if not widget.isVisibleTo(window):
+                continue
+            pos = widget.mapTo(window, origin)
+            left, top = pos.x(), pos.y()
+            entries.append(
+                (left, top, left + widget.width(), top + widget.height(), region)
+            )
+        entries.sort()
+
+        max_rights: List[int] = []
+        max_right = -1
+        for entry in entries:
+            max_right = max(max_right, entry[2])
+            max_rights.append(max_right)
+
+        self._entries = entries
+        self._lefts = [entry[0] for entry in entries]
+        self._max_rights = max_rights
+        self._dirty = False
+
+    def eventFilter(self, obj: QObject, event: QEvent) -> bool:
+        """Mark the index dirty when the title bar's geometry or layout changes."""
+        if event.type() in _INVALIDATING_EVENTS:
+            self._dirty = True
+        return False
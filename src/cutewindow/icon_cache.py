@@ -0,0 +1,161 @@
+"""
+Process-wide icon cache for CuteWindow.
+
+Title bar icons are requested for every button of every window and again on
+every maximize/restore. :class:`IconCache` keeps the icons keyed by path in a
+bounded LRU. Copies of a cached QIcon share its data, so the files are decoded
+once per process.
+
+Icons are multi-resolution: every density variant of a file that exists
+(``name.png``, ``name@2x.png``, ``name@3x.png``) is registered with its pixel
+ratio, and Qt picks the right one for the screen each time the icon is painted.
+Icons therefore do not depend on the screen and never need to be invalidated
+on DPI changes.
+
+Example:
+    >>> from cutewindow.icon_cache import icon_cache
+    >>> icon = icon_cache.icon(":/icons/title-bar/close.png")
+    >>> icon_cache.statistics()
+    {'hits': 0, 'misses': 1, 'evictions': 0, 'size': 1, 'capacity': 128}
+"""
+
+import os
+from collections import OrderedDict
+from typing import Dict, Optional, Tuple
+
+from PySide6.QtCore import QFile, QSize
+from PySide6.QtGui import QGuiApplication, QIcon, QPixmap
+
+# Density suffixes of icon files and their device pixel ratios
+_DENSITY_SUFFIXES = (("", 1), ("@2x", 2), ("@3x", 3))
+
+
+_variants: Dict[str, Tuple[Tuple[str, int], ...]] = {}
+
+
+def resolutionVariants(path: str) -> Tuple[Tuple[str, int], ...]:
+    """
+    Find the density variants of an icon file, once per path.
+
+    Paths without any existing variant are not remembered, as their resources
+    may still be registered later.
+
+    Args:
+        path (str): Path of the 1x icon file.
+
+    Returns:
+        Tuple[Tuple[str, int], ...]: Path and device pixel ratio of every
+        variant that exists, lowest density first.
+    """
+    variants = _variants.get(path)
+    if variants is None:
+        root, extension = os.path.splitext(path)
+        variants = tuple(
+            (f"{root}{suffix}{extension}", ratio)
+            for suffix, ratio in _DENSITY_SUFFIXES
+            if QFile.exists(f"{root}{suffix}{extension}")
+        )
+        if variants:
+            _variants[path] = variants
+    return variants
+
+
+def addResolutionVariants(
+    icon: QIcon,
+    path: str,
+    size: Optional[QSize] = None,
+    mode: QIcon.Mode = QIcon.Normal,  # type: ignore
+    state: QIcon.State = QIcon.Off,  # type: ignore
+) -> None:
+    """
+    Add every density variant of an icon file to an icon.
+
+    Each variant is decoded once and tagged with its device pixel ratio, so
+    Qt can pick it per screen without scaling. Without a QGuiApplication,
+    which pixmaps require, the files are added for lazy loading instead.
+
+    Args:
+        icon (QIcon): The icon to add the variants to.
+        path (str): Path of the 1x icon file.
+        size (Optional[QSize]): Size of the icon for lazy loading (optional).
+        mode (QIcon.Mode): Mode of the icon.
+        state (QIcon.State): State of the icon.
+    """
+    variants = resolutionVariants(path) or ((path, 1),)
+    lazy = QGuiApplication.instance() is None
+    for variant, ratio in variants:
+        if lazy:
+            icon.addFile(variant, QSize() if size is None else size, mode, state)
+            continue
+        pixmap = QPixmap(variant)
+        pixmap.setDevicePixelRatio(ratio)
+        icon.addPixmap(pixmap, mode, state)
+
+
+class IconCache:
+    """
+    Bounded LRU cache of icons.
+
+    Attributes:
+        capacity (int): Maximum number of cached icons.
+    """
+
+    def __init__(self, capacity: int = 128) -> None:
+        """
+        Initialize the cache.
+
+        Args:
+            capacity (int): Maximum number of cached icons, defaults to 128.
+        """
+        self.capacity = capacity
+        self._entries: "OrderedDict[str, QIcon]" = OrderedDict()
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+
+    def icon(self, path: str) -> QIcon:
+        """
+        Get the multi-resolution icon for a file, loading it on first use.
+
+        Args:
+            path (str): Path of the 1x icon file.
+
+        Returns:
+            QIcon: The cached icon. Copies share its data.
+        """
+        icon = self._entries.get(path)
+        if icon is not None:
+            self._hits += 1
+            self._entries.move_to_end(path)
+            return icon
+        self._misses += 1
+        icon = QIcon()
+        addResolutionVariants(icon, path)
+        self._entries[path] = icon
+        while len(self._entries) > self.capacity:
+            self._entries.popitem(last=False)
+            self._evictions += 1
+        return icon
+
+    def invalidate(self) -> None:
+        """Drop all cached icons."""
+        self._entries.clear()
+
+    def statistics(self) -> Dict[str, int]:
+        """
+        Get the hit, miss and eviction counts of the cache.
+
+        Returns:
+            Dict[str, int]: The "hits", "misses" and "evictions" so far, and
+            the current "size" and "capacity".
+        """
+        return {
+            "hits": self._hits,
+            "misses": self._misses,
+            "evictions": self._evictions,
+            "size": len(self._entries),
+            "capacity": self.capacity,
+        }
+
+
+icon_cache = IconCache()
@@ -6,27 +6,71 @@ implementations based on the current operating system. It abstracts away the
 platform detection and import logic, providing a unified interface for creating
 CuteWindow components regardless of the underlying platform.
 
+Backends are kept in a registry of backend name to module. The backend is
+resolved once per process, and its classes are cached after the first lookup,
+so the ``get_*_class()`` functions are dictionary lookups after the first call.
+
 Supported Platforms:
     - macOS (darwin): Uses native macOS window management and styling
     - Windows: Uses native Windows window management and styling
-    - Linux: Currently not supported (raises NotImplementedError)
+    - Linux: Frameless windows moved and resized by the window manager
+
+Other backends can be added by:
+    - Calling :func:`register_backend` with a backend name and module
+    - Declaring an entry point in the ``cutewindow.backends`` group, whose
+      name is the backend name and whose value is the backend module
+    - Setting ``CUTEWINDOW_BACKEND`` to a backend name to use it instead of
+      the backend of the current platform
+
+A backend module provides ``CuteWindow``, ``CuteMainWindow``, ``CuteDialog``
+and ``TitleBar``.
 
 Example:
     >>> from cutewindow.platform_factory import get_cute_window_class
     >>> CuteWindow = get_cute_window_class()
     >>> window = CuteWindow()
+
+Example of a third-party backend in ``pyproject.toml``:
+
+.. code-block:: toml
+
+    [project.entry-points."cutewindow.backends"]
+    headless = "my_package.headless_backend"
 """
 
+import os
 import platform
-from typing import Type
+from functools import lru_cache
+from importlib import import_module
+from importlib.metadata import entry_points
+from types import ModuleType
+from typing import Dict, Optional, Type, Union
 
 from .base import BaseCuteWindow, BaseTitleBar
 
+#: Environment variable forcing a backend by name
+BACKEND_ENV = "CUTEWINDOW_BACKEND"
 
+#: Entry point group of third-party backends
+ENTRY_POINT_GROUP = "cutewindow.backends"
+
+# Backend name to backend module, or its import path until first use
+_backends: Dict[str, Union[str, ModuleType]] = {
+    "linux": "cutewindow.platforms.linux",
+    "mac": "cutewindow.platforms.mac",
+    "windows": "cutewindow.platforms.windows",
+}
+_entry_points_loaded = False
+_classes: Dict[str, type] = {}
+
+
+@lru_cache(maxsize=None)
 def get_platform_name() -> str:
     """
     Get the current platform name in a standardized format.
 
+    The platform is detected once per process.
+
     Returns:
         str: The platform name ('mac', 'windows', or 'linux').
 
@@ -43,6 +87,91 @@ def get_platform_name() -> str:
         raise NotImplementedError(f"Platform {system} is not supported")
 
 
+def get_backend_name() -> str:
+    """
+    Get the name of the backend to use.
+
+    Returns:
+        str: The backend forced with ``CUTEWINDOW_BACKEND``, or the platform name.
+    """
+    return os.environ.get(BACKEND_ENV) or get_platform_name()
+
+
+def register_backend(name: str, module: Union[str, ModuleType]) -> None:
+    """
+    Register a backend, replacing any backend with the same name.
+
+    Args:
+        name (str): The backend name, as used by ``CUTEWINDOW_BACKEND``.
+        module (Union[str, ModuleType]): The backend module, or its import path
+            to import it on first use.
+    """
+    _backends[name] = module
+    _classes.clear()
+
+
+def get_backend(name: Optional[str] = None) -> ModuleType:
+    """
+    Get a backend module, importing it on first use.
+
+    Args:
+        name (Optional[str]): The backend name, defaults to
+            :func:`get_backend_name`.
+
+    Returns:
+        ModuleType: The backend module.
+
+    Raises:
+        NotImplementedError: If no backend with that name is registered.
+    """
+    if name is None:
+        name = get_backend_name()
+    if name not in _backends:
+        _load_entry_points()
+    try:
+        module = _backends[name]
+    except KeyError:
+        raise NotImplementedError(f"CuteWindow is not supported on {name}") from None
+    if isinstance(module, str):
+        module = _backends[name] = import_module(module)
+    return module
+
+
+def reset_backend_cache() -> None:
+    """Forget the cached classes, so the backend is resolved again on next use."""
+    _classes.clear()
+
+
+def _load_entry_points() -> None:
+    global _entry_points_loaded
+    if _entry_points_loaded:
+        return
+    _entry_points_loaded = True
+    found = entry_points()
+    if hasattr(found, "select"):
+        group = found.select(group=ENTRY_POINT_GROUP)
+    else:
+        # Python 3.9 returns a dict of groups
+        group = found.get(ENTRY_POINT_GROUP, ())  # type: ignore[attr-defined]
+    for entry_point in group:
+        # Backends registered in code take precedence
+        _backends.setdefault(entry_point.name, entry_point.value)
+
+
+def _backend_class(name: str) -> type:
+    cls = _classes.get(name)
+    if cls is None:
+        backend = get_backend()
+        try:
+            cls = getattr(backend, name)
+        except AttributeError:
+            raise NotImplementedError(
+                f"{name} is not provided by backend {backend.__name__}"
+            ) from None
+        _classes[name] = cls
+    return cls
+
+
 def get_cute_window_class() -> Type[BaseCuteWindow]:
     """
     Get the appropriate CuteWindow class for the current platform.
@@ -53,16 +182,7 @@ def get_cute_window_class() -> Type[BaseCuteWindow]:
     Raises:
         NotImplementedError: If the current platform is not supported.
     """
-    platform_name = get_platform_name()
-
-    if platform_name == "mac":
-        from .platforms.mac.CuteWindow import CuteWindow
-    elif platform_name == "windows":
-        from .platforms.windows.CuteWindow import CuteWindow
-    else:
-        raise NotImplementedError(f"CuteWindow is not supported on {platform_name}")
-
-    return CuteWindow  # type: ignore
+    return _backend_class("CuteWindow")  # type: ignore
 
 
 def get_cute_main_window_class() -> Type[BaseCuteWindow]:
@@ -75,16 +195,7 @@ def get_cute_main_window_class() -> Type[BaseCuteWindow]:
     Raises:
         NotImplementedError: If the current platform is not supported.
     """
-    platform_name = get_platform_name()
-
-    if platform_name == "mac":
-        from .platforms.mac.CuteMainWindow import CuteMainWindow
-    elif platform_name == "windows":
-        from .platforms.windows.CuteMainWindow import CuteMainWindow
-    else:
-        raise NotImplementedError(f"CuteMainWindow is not supported on {platform_name}")
-
-    return CuteMainWindow  # type: ignore
+    return _backend_class("CuteMainWindow")  # type: ignore
 
 
 def get_cute_dialog_class() -> Type[BaseCuteWindow]:
@@ -97,16 +208,7 @@ def get_cute_dialog_class() -> Type[BaseCuteWindow]:
     Raises:
         NotImplementedError: If the current platform is not supported.
     """
-    platform_name = get_platform_name()
-
-    if platform_name == "mac":
-        from .platforms.mac.CuteDialog import CuteDialog
-    elif platform_name == "windows":
-        from .platforms.windows.CuteDialog import CuteDialog
-    else:
-        raise NotImplementedError(f"CuteDialog is not supported on {platform_name}")
-
-    return CuteDialog  # type: ignore
+    return _backend_class("CuteDialog")  # type: ignore
 
 
 def get_title_bar_class() -> Type[BaseTitleBar]:
@@ -119,13 +221,4 @@ def get_title_bar_class() -> Type[BaseTitleBar]:
     Raises:
         NotImplementedError: If the current platform is not supported.
     """
-    platform_name = get_platform_name()
-
-    if platform_name == "mac":
-        from .platforms.mac.title_bar.TitleBar import TitleBar
-    elif platform_name == "windows":
-        from .platforms.windows.title_bar.TitleBar import TitleBar
-    else:
-        raise NotImplementedError(f"TitleBar is not supported on {platform_name}")
-
-    return TitleBar  # type: ignore
+    return _backend_class("TitleBar")  # type: ignore
@@ -1,6 +1,27 @@
-import platform
+"""
+Platform backends of CuteWindow.
 
-if platform.system() == "Darwin":
-    from .mac import CuteDialog, CuteMainWindow, CuteWindow, TitleBar
-else:
+The backend is resolved by :mod:`cutewindow.platform_factory` and imported on
+first access to one of its classes. The classes are looked up in the factory on
+every access, so :func:`~cutewindow.platform_factory.reset_backend_cache` and
+backends registered later take effect here too.
+"""
+
+from typing import TYPE_CHECKING, Any, List
+
+if TYPE_CHECKING:
     from .windows import CuteDialog, CuteMainWindow, CuteWindow, TitleBar
+
+__all__ = ["CuteDialog", "CuteMainWindow", "CuteWindow", "TitleBar"]
+
+
+def __getattr__(name: str) -> Any:
+    if name not in __all__:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    from cutewindow.platform_factory import _backend_class
+
+    return _backend_class(name)
+
+
+def __dir__() -> List[str]:
+    return sorted(set(globals()) | set(__all__))
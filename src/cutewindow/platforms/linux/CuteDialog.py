@@ -0,0 +1,83 @@
+"""
+Linux-specific CuteDialog implementation.
+
+This module provides the Linux-specific implementation of the CuteDialog class,
+a frameless dialog with a customizable title bar. Moving and resizing are
+delegated to the compositor or window manager through
+``QWindow.startSystemMove()`` and ``QWindow.startSystemResize()``, so no
+Python code runs per mouse move while the dialog is dragged.
+"""
+
+from typing import Optional
+
+from PySide6.QtCore import Qt
+from PySide6.QtGui import QShowEvent
+from PySide6.QtWidgets import QDialog, QWidget
+
+from cutewindow.base import CuteWindowMixin
+from cutewindow.platforms.linux.frame import FrameController
+from cutewindow.platforms.linux.title_bar.TitleBar import TitleBar
+
+
+class CuteDialog(CuteWindowMixin, QDialog):
+    """
+    Linux-specific customizable dialog implementation.
+
+    The dialog automatically handles:
+    - Frameless dialog with a custom title bar and window controls
+    - Moving by dragging the title bar, run by the window manager
+    - Resizing from the dialog edges and corners, run by the window manager
+    - Resize cursors over the edges, looked up in a cached edge model
+
+    Attributes:
+        _title_bar (TitleBar): The custom title bar widget.
+
+    Example:
+        >>> dialog = CuteDialog()
+        >>> dialog.setWindowTitle("Settings")
+        >>> result = dialog.exec()
+    """
+
+    def __init__(self, parent: Optional[QWidget] = None) -> None:
+        """
+        Initialize the Linux CuteDialog.
+
+        Args:
+            parent (Optional[QWidget]): The parent widget, defaults to None.
+        """
+        super().__init__(parent)
+
+        self.setWindowFlag(Qt.FramelessWindowHint)  # type: ignore
+        self._frame = FrameController(self)
+        self.addWindowStateListener(self._frame.windowStateChanged)
+        self._title_bar = TitleBar(self)
+        self.resize(800, 800)
+
+    def setNonResizable(self) -> None:
+        """Make the dialog non-resizable."""
+        self._frame.setResizable(False)
+        if hasattr(self._title_bar, "maximize_button"):
+            self._title_bar.maximize_button.hide()  # type: ignore
+
+    def isResizable(self) -> bool:
+        """
+        Check if the dialog is resizable.
+
+        Returns:
+            bool: True if the dialog is resizable, False otherwise.
+        """
+        return self._frame.isResizable()
+
+    def frameController(self) -> FrameController:
+        """
+        Get the controller of the dialog's resize borders.
+
+        Returns:
+            FrameController: The frame controller.
+        """
+        return self._frame
+
+    def showEvent(self, event: QShowEvent) -> None:
+        """Handle show event to attach the resize borders to the native window."""
+        self._frame.attach()
+        super().showEvent(event)
@@ -0,0 +1,83 @@
+"""
+Linux-specific CuteWindow implementation.
+
+This module provides the Linux-specific implementation of the CuteWindow class,
+a frameless window with a customizable title bar. Moving and resizing are
+delegated to the compositor or window manager through
+``QWindow.startSystemMove()`` and ``QWindow.startSystemResize()``, so no
+Python code runs per mouse move while the window is dragged.
+"""
+
+from typing import Optional
+
+from PySide6.QtCore import Qt
+from PySide6.QtGui import QShowEvent
+from PySide6.QtWidgets import QWidget
+
+from cutewindow.base import CuteWindowMixin
+from cutewindow.platforms.linux.frame import FrameController
+from cutewindow.platforms.linux.title_bar.TitleBar import TitleBar
+
+
+class CuteWindow(CuteWindowMixin, QWidget):
+    """
+    Linux-specific customizable window implementation.
+
+    The window automatically handles:
+    - Frameless window with a custom title bar and window controls
+    - Moving by dragging the title bar, run by the window manager
+    - Resizing from the window edges and corners, run by the window manager
+    - Resize cursors over the edges, looked up in a cached edge model
+
+    Attributes:
+        _title_bar (TitleBar): The custom title bar widget.
+
+    Example:
+        >>> window = CuteWindow()
+        >>> window.setWindowTitle("My Application")
+        >>> window.show()
+    """
+
+    def __init__(self, parent: Optional[QWidget] = None) -> None:
+        """
+        Initialize the Linux CuteWindow.
+
+        Args:
+            parent (Optional[QWidget]): The parent widget, defaults to None.
+        """
+        super().__init__(parent)
+
+        self.setWindowFlag(Qt.FramelessWindowHint)  # type: ignore
+        self._frame = FrameController(self)
+        self.addWindowStateListener(self._frame.windowStateChanged)
+        self._title_bar = TitleBar(self)
+        self.resize(800, 800)
+
+    def setNonResizable(self) -> None:
+        """Make the window non-resizable."""
+        self._frame.setResizable(False)
+        if hasattr(self._title_bar, "maximize_button"):
+            self._title_bar.maximize_button.hide()  # type: ignore
+
+    def isResizable(self) -> bool:
+        """
+        Check if the window is resizable.
+
+        Returns:
+            bool: True if the window is resizable, False otherwise.
+        """
+        return self._frame.isResizable()
+
+    def frameController(self) -> FrameController:
+        """
+        Get the controller of the window's resize borders.
+
+        Returns:
+            FrameController: The frame controller.
+        """
+        return self._frame
+
+    def showEvent(self, event: QShowEvent) -> None:
+        """Handle show event to attach the resize borders to the native window."""
+        self._frame.attach()
+        super().showEvent(event)
@@ -0,0 +1,6 @@
+from .CuteDialog import CuteDialog
+from .CuteMainWindow import CuteMainWindow
+from .CuteWindow import CuteWindow
+from .title_bar.TitleBar import TitleBar
+
+__all__ = ["CuteDialog", "CuteMainWindow", "CuteWindow", "TitleBar"]
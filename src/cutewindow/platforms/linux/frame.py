@@ -0,0 +1,233 @@
+"""
+Edge resizing of frameless windows on Linux.
+
+Frameless windows have no window manager frame to grab, so the outer pixels of
+the window act as resize borders. :class:`EdgeModel` keeps the window size and
+border width and answers which edges lie under a point with a few comparisons;
+it is only updated when the window is resized or its state changes.
+:class:`FrameController` filters the mouse events of the window's QWindow
+before they reach any widget: it shows the resize cursor over the borders and
+hands a press on a border to the compositor or window manager with
+``QWindow.startSystemResize()``. The cursor the application set on the window
+is restored when the mouse leaves the borders. The resize itself then runs outside of
+Python, as does moving the window by its title bar.
+"""
+
+from typing import Dict, Optional
+
+from PySide6.QtCore import QEvent, QObject, Qt
+from PySide6.QtGui import QCursor, QMouseEvent, QWindow
+from PySide6.QtWidgets import QWidget
+
+from cutewindow.platforms.linux.utils import startSystemResize
+
+#: Default width of the resize borders, in logical pixels
+RESIZE_BORDER = 6
+
+_NO_EDGES = Qt.Edge(0)
+
+_CURSORS = {
+    Qt.LeftEdge: Qt.SizeHorCursor,
+    Qt.RightEdge: Qt.SizeHorCursor,
+    Qt.TopEdge: Qt.SizeVerCursor,
+    Qt.BottomEdge: Qt.SizeVerCursor,
+    Qt.TopEdge | Qt.LeftEdge: Qt.SizeFDiagCursor,
+    Qt.BottomEdge | Qt.RightEdge: Qt.SizeFDiagCursor,
+    Qt.TopEdge | Qt.RightEdge: Qt.SizeBDiagCursor,
+    Qt.BottomEdge | Qt.LeftEdge: Qt.SizeBDiagCursor,
+}
+
+
+class EdgeModel:
+    """
+    Cached geometry of a window's resize borders.
+
+    Attributes:
+        border (int): Width of the resize borders.
+        enabled (bool): Whether the borders are active.
+    """
+
+    def __init__(self, border: int = RESIZE_BORDER) -> None:
+        """
+        Initialize the model for an empty window.
+
+        Args:
+            border (int): Width of the resize borders, defaults to
+                RESIZE_BORDER.
+        """
+        self.border = border
+        self.enabled = True
+        self._right = 0
+        self._bottom = 0
+
+    def resize(self, width: int, height: int) -> None:
+        """
+        Update the model to a new window size.
+
+        Args:
+            width (int): Width of the window.
+            height (int): Height of the window.
+        """
+        self._right = width - self.border
+        self._bottom = height - self.border
+
+    def edgesAt(self, x: float, y: float) -> Qt.Edges:
+        """
+        Find the edges under a point.
+
+        Args:
+            x (float): X coordinate in window coordinates.
+            y (float): Y coordinate in window coordinates.
+
+        Returns:
+            Qt.Edges: The edges under the point, empty for the interior.
+        """
+        if not self.enabled:
+            return _NO_EDGES
+        edges = _NO_EDGES
+        if x < self.border:
+            edges |= Qt.LeftEdge
+        elif x >= self._right:
+            edges |= Qt.RightEdge
+        if y < self.border:
+            edges |= Qt.TopEdge
+        elif y >= self._bottom:
+            edges |= Qt.BottomEdge
+        return edges
+
+
+class FrameController(QObject):
+    """
+    Resize borders of a frameless top-level widget.
+
+    The controller is attached to the widget's QWindow, which exists once the
+    widget has been shown or its native window has been created.
+
+    Attributes:
+        model (EdgeModel): The geometry of the resize borders.
+    """
+
+    def __init__(self, widget: QWidget, border: int = RESIZE_BORDER) -> None:
+        """
+        Initialize the controller.
+
+        Args:
+            widget (QWidget): The frameless top-level widget.
+            border (int): Width of the resize borders, defaults to
+                RESIZE_BORDER.
+        """
+        super().__init__(widget)
+        self._widget = widget
+        self._handle: Optional[QWindow] = None
+        self.model = EdgeModel(border)
+        self.model.resize(widget.width(), widget.height())
+        self._resizable = True
+        self._edges = _NO_EDGES
+        # The window's own cursor while a resize cursor is shown
+        self._window_cursor: Optional[QCursor] = None
+        self._resizes = 0
+        self._handed_over = 0
+
+    def attach(self) -> bool:
+        """
+        Start filtering the mouse events of the widget's QWindow, once.
+
+        Returns:
+            bool: True if the widget has a QWindow to attach to.
+        """
+        handle = self._widget.windowHandle()
+        if handle is None:
+            return False
+        if handle is not self._handle:
+            # The widget gets a new QWindow when it is recreated
+            handle.installEventFilter(self)
+            self._handle = handle
+            self.model.resize(self._widget.width(), self._widget.height())
+        return True
+
+    def setResizable(self, resizable: bool) -> None:
+        """
+        Enable or disable the resize borders.
+
+        Args:
+            resizable (bool): Whether the window can be resized.
+        """
+        self._resizable = resizable
+        self.windowStateChanged(self._widget.windowState())
+
+    def isResizable(self) -> bool:
+        """
+        Check if the resize borders are enabled.
+
+        Returns:
+            bool: True if the window can be resized.
+        """
+        return self._resizable
+
+    def windowStateChanged(self, state: Qt.WindowStates) -> None:
+        """
+        Disable the borders while the window is maximized or fullscreen.
+
+        Args:
+            state (Qt.WindowStates): The new state of the window.
+        """
+        fills_screen = state & (Qt.WindowMaximized | Qt.WindowFullScreen)
+        self.model.enabled = self._resizable and not fills_screen
+        self._setEdges(_NO_EDGES)
+
+    def statistics(self) -> Dict[str, int]:
+        """
+        Get how many resizes were started and handed over to the system.
+
+        Returns:
+            Dict[str, int]: The number of "resizes" started on a border and
+            of those "handed_over" to the window manager.
+        """
+        return {"resizes": self._resizes, "handed_over": self._handed_over}
+
+    def eventFilter(self, obj: QObject, event: QEvent) -> bool:
+        """Show resize cursors and start resizes on the borders."""
+        kind = event.type()
+        if kind == QEvent.MouseMove:  # type: ignore
+            if not event.buttons():  # type: ignore[attr-defined]
+                self._hover(event)  # type: ignore[arg-type]
+        elif kind == QEvent.MouseButtonPress:  # type: ignore
+            return self._press(event)  # type: ignore[arg-type]
+        elif kind == QEvent.Resize:  # type: ignore
+            size = event.size()  # type: ignore[attr-defined]
+            self.model.resize(size.width(), size.height())
+        elif kind == QEvent.Leave:  # type: ignore
+            self._setEdges(_NO_EDGES)
+        return False
+
+    def _hover(self, event: QMouseEvent) -> None:
+        pos = event.position()
+        self._setEdges(self.model.edgesAt(pos.x(), pos.y()))
+
+    def _press(self, event: QMouseEvent) -> bool:
+        if event.button() != Qt.LeftButton:  # type: ignore
+            return False
+        pos = event.position()
+        edges = self.model.edgesAt(pos.x(), pos.y())
+        if not edges:
+            return False
+        self._resizes += 1
+        if startSystemResize(self._widget, edges):
+            self._handed_over += 1
+        return True
+
+    def _setEdges(self, edges: Qt.Edges) -> None:
+        if edges == self._edges:
+            return
+        widget = self._widget
+        if not self._edges and widget.testAttribute(Qt.WA_SetCursor):  # type: ignore
+            self._window_cursor = widget.cursor()
+        self._edges = edges
+        cursor: Optional[Qt.CursorShape] = _CURSORS.get(edges)
+        if cursor is not None:
+            widget.setCursor(cursor)
+        elif self._window_cursor is not None:
+            widget.setCursor(self._window_cursor)
+            self._window_cursor = None
+        else:
+            widget.unsetCursor()
@@ -0,0 +1,59 @@
+"""
+Linux-specific TitleBar implementation.
+
+This module provides the Linux-specific implementation of the TitleBar class
+for frameless windows. Window managers draw no controls on frameless windows,
+so the title bar has the same window controls (close, minimize, maximize) as
+the Windows title bar, from :mod:`cutewindow.title_bar_common`. Dragging the
+title bar hands the move over to the compositor or window manager with
+``QWindow.startSystemMove()``.
+"""
+
+from typing import Optional
+
+from PySide6.QtGui import QMouseEvent
+from PySide6.QtWidgets import QWidget
+
+from cutewindow.platforms.linux.utils import startSystemMove
+from cutewindow.title_bar_common import WindowControlsTitleBar
+
+
+class TitleBar(WindowControlsTitleBar):
+    """
+    Linux-specific title bar implementation with custom window controls.
+
+    Features:
+    - Custom window controls (close, minimize, maximize/restore)
+    - Window dragging, handed over to the window manager once per gesture
+    - Double-click on the caption to maximize/restore the window
+
+    Example:
+        >>> title_bar = TitleBar(parent=window)
+        >>> window.setTitleBar(title_bar)
+    """
+
+    startSystemMove = staticmethod(startSystemMove)
+
+    def __init__(self, parent: Optional[QWidget] = None) -> None:
+        """
+        Initialize the Linux TitleBar.
+
+        Args:
+            parent (Optional[QWidget]): The parent widget (usually the window),
+                                       defaults to None.
+        """
+        super(TitleBar, self).__init__(parent)
+
+    def mouseDoubleClickEvent(self, event: QMouseEvent) -> None:
+        """
+        Handle mouse double-click events for window maximization.
+
+        Args:
+            event (QMouseEvent): The mouse double-click event object.
+        """
+        super().mouseDoubleClickEvent(event)
+        if self.isInteractiveAt(event.position().toPoint()):
+            return
+        if self.window().isFullScreen() or not self.maximize_button.isVisible():
+            return
+        self.on_maximize_button_clicked()
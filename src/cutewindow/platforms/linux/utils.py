@@ -0,0 +1,32 @@
+from PySide6.QtCore import QPoint, Qt
+from PySide6.QtWidgets import QWidget
+
+
+def startSystemMove(widget: QWidget, pos: QPoint) -> bool:
+    """
+    Let the window manager move a window interactively.
+
+    Args:
+        widget (QWidget): The top-level widget to move.
+        pos (QPoint): The global position of the mouse, unused.
+
+    Returns:
+        bool: True if the window manager took over the move.
+    """
+    handle = widget.windowHandle()
+    return handle is not None and handle.startSystemMove()
+
+
+def startSystemResize(widget: QWidget, edges: Qt.Edges) -> bool:
+    """
+    Let the window manager resize a window interactively.
+
+    Args:
+        widget (QWidget): The top-level widget to resize.
+        edges (Qt.Edges): The edges, or the two edges of a corner, to drag.
+
+    Returns:
+        bool: True if the window manager took over the resize.
+    """
+    handle = widget.windowHandle()
+    return handle is not None and handle.startSystemResize(edges)
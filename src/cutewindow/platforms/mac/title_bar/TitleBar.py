@@ -12,6 +12,7 @@ from typing import Optional
 from PySide6.QtGui import QMouseEvent
 from PySide6.QtWidgets import QFrame, QWidget
 
+from cutewindow.drag_gesture import DragGesture
 from cutewindow.platforms.mac.utils import isWindowResizable, startSystemMove
 
 
@@ -29,10 +30,9 @@ class TitleBar(QFrame):
     - Custom controls would break the native macOS user experience
 
     Features:
-    - Window dragging by clicking and dragging on the title bar
+    - Window dragging, handed over to the system once per drag gesture
     - Double-click to maximize/restore window (if resizable)
     - Automatic integration with macOS window management
-    - Proper event filtering for window state changes
 
     Attributes:
         None (minimal implementation with no custom widgets)
@@ -58,23 +58,50 @@ class TitleBar(QFrame):
         # Set standard title bar height (matches macOS title bar height)
         self.setFixedHeight(28)
 
-        # Install event filter to monitor window state changes
-        # This allows the title bar to respond to window events
-        self.window().installEventFilter(self)
+        # Hands dragging over to the system once the drag distance is reached
+        self._drag_gesture = DragGesture(self, startSystemMove)
+
+    def dragGesture(self) -> DragGesture:
+        """
+        Get the gesture that moves the window when the title bar is dragged.
+
+        Returns:
+            DragGesture: The title bar's drag gesture.
+        """
+        return self._drag_gesture
+
+    def mousePressEvent(self, event: QMouseEvent) -> None:
+        """
+        Handle mouse press events to arm the drag gesture.
+
+        Args:
+            event (QMouseEvent): The mouse press event object.
+        """
+        self._drag_gesture.press(event)
+        super().mousePressEvent(event)
 
     def mouseMoveEvent(self, event: QMouseEvent) -> None:
         """
         Handle mouse move events for window dragging.
 
-        This method enables window dragging when the user clicks and drags
-        on the title bar area. It uses the native macOS system move function
-        to provide smooth, native-feeling window movement.
+        Once the drag distance is reached, the move is handed over to the
+        system, which runs the native move loop; later move events of the
+        same gesture are ignored.
 
         Args:
             event (QMouseEvent): The mouse move event object.
         """
-        # Start system move operation with the current mouse position
-        startSystemMove(self.window(), event.globalPos())
+        self._drag_gesture.move(event)
+
+    def mouseReleaseEvent(self, event: QMouseEvent) -> None:
+        """
+        Handle mouse release events to end the drag gesture.
+
+        Args:
+            event (QMouseEvent): The mouse release event object.
+        """
+        self._drag_gesture.release(event)
+        super().mouseReleaseEvent(event)
 
     def mouseDoubleClickEvent(self, event: QMouseEvent) -> None:
         """
@@ -87,6 +114,9 @@ class TitleBar(QFrame):
         Args:
             event (QMouseEvent): The mouse double-click event object.
         """
+        # The second press of a double click never starts a move
+        self._drag_gesture.doubleClick(event)
+
         # Only handle double-click if window is not fullscreen and is resizable
         if not self.window().isFullScreen() and isWindowResizable(self.winId()):
             if self.window().isMaximized():
@@ -12,18 +12,11 @@ from typing import Optional
 from PySide6.QtCore import QByteArray
 from PySide6.QtWidgets import QDialog, QWidget
 
-from cutewindow.base import CuteWindowMixin
 from cutewindow.platforms.windows.native_event import _nativeEvent
-from cutewindow.platforms.windows.title_bar.TitleBar import TitleBar
-from cutewindow.platforms.windows.utils import (
-    addShadowEffect,
-    addWindowAnimation,
-    isWindowResizable,
-    setWindowNonResizable,
-)
+from cutewindow.platforms.windows.window_mixin import WindowsCuteWindowMixin
 
 
-class CuteDialog(CuteWindowMixin, QDialog):
+class CuteDialog(WindowsCuteWindowMixin, QDialog):
     """
     Windows-specific customizable dialog implementation.
 
@@ -41,7 +34,8 @@ class CuteDialog(CuteWindowMixin, QDialog):
     - Native event handling for window operations
 
     Attributes:
-        _title_bar (TitleBar): The custom title bar widget.
+        _title_bar (Optional[TitleBar]): The custom title bar widget, created
+            by :meth:`titleBar` or on the first show.
 
     Example:
         >>> dialog = CuteDialog()
@@ -59,34 +53,8 @@ class CuteDialog(CuteWindowMixin, QDialog):
             parent (Optional[QWidget]): The parent widget, defaults to None.
         """
         super().__init__(parent)
-
-        self._title_bar = TitleBar(self)
-        self.createWinId()
-        addShadowEffect(self.winId())
-        addWindowAnimation(self.winId())
         self.resize(800, 800)
 
-    def setNonResizable(self):
-        """
-        Make the dialog non-resizable.
-
-        This method disables dialog resizing functionality by modifying the
-        window style and hiding the maximize button from the title bar.
-        """
-        setWindowNonResizable(self.winId())
-        # Hide maximize button if it exists on the title bar
-        if hasattr(self._title_bar, "maximize_button"):
-            self._title_bar.maximize_button.hide()  # type: ignore
-
-    def isResizable(self) -> bool:
-        """
-        Check if the dialog is resizable.
-
-        Returns:
-            bool: True if the dialog is resizable, False otherwise.
-        """
-        return isWindowResizable(self.winId())
-
     def nativeEvent(self, event_type: QByteArray, message: int):  # type: ignore
         """
         Handle native Windows events.
@@ -12,18 +12,11 @@ from typing import Optional
 from PySide6.QtCore import QByteArray
 from PySide6.QtWidgets import QWidget
 
-from cutewindow.base import CuteWindowMixin
 from cutewindow.platforms.windows.native_event import _nativeEvent
-from cutewindow.platforms.windows.title_bar.TitleBar import TitleBar
-from cutewindow.platforms.windows.utils import (
-    addShadowEffect,
-    addWindowAnimation,
-    isWindowResizable,
-    setWindowNonResizable,
-)
+from cutewindow.platforms.windows.window_mixin import WindowsCuteWindowMixin
 
 
-class CuteWindow(CuteWindowMixin, QWidget):
+class CuteWindow(WindowsCuteWindowMixin, QWidget):
     """
     Windows-specific customizable window implementation.
 
@@ -39,7 +32,8 @@ class CuteWindow(CuteWindowMixin, QWidget):
     - Native event handling for window operations
 
     Attributes:
-        _title_bar (TitleBar): The custom title bar widget.
+        _title_bar (Optional[TitleBar]): The custom title bar widget, created
+            by :meth:`titleBar` or on the first show.
 
     Example:
         >>> window = CuteWindow()
@@ -55,27 +49,8 @@ class CuteWindow(CuteWindowMixin, QWidget):
             parent (Optional[QWidget]): The parent widget, defaults to None.
         """
         super(CuteWindow, self).__init__(parent)
-
-        self._title_bar = TitleBar(self)
-        addShadowEffect(self.winId())
-        addWindowAnimation(self.winId())
         self.resize(800, 800)
 
-    def setNonResizable(self):
-        """Make the window non-resizable."""
-        setWindowNonResizable(self.winId())
-        if hasattr(self._title_bar, "maximize_button"):
-            self._title_bar.maximize_button.hide()  # type: ignore
-
-    def isResizable(self) -> bool:
-        """
-        Check if the window is resizable.
-
-        Returns:
-            bool: True if the window is resizable, False otherwise.
-        """
-        return isWindowResizable(self.winId())
-
     def nativeEvent(self, event_type: QByteArray, message: int):  # type: ignore
         """
         Handle native Windows events.
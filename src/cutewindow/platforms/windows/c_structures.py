@@ -1,6 +1,6 @@
 # coding:utf-8
 from ctypes import POINTER, Structure, c_int
-from ctypes.wintypes import HWND, POINT, RECT, UINT
+from ctypes.wintypes import DWORD, HWND, POINT, RECT, UINT
 
 
 class MARGINS(Structure):
@@ -29,3 +29,31 @@ class NCCALCSIZE_PARAMS(Structure):
 
 
 LPNCCALCSIZE_PARAMS = POINTER(NCCALCSIZE_PARAMS)
+
+
+class STYLESTRUCT(Structure):
+    _fields_ = [("styleOld", DWORD), ("styleNew", DWORD)]
+
+
+LPSTYLESTRUCT = POINTER(STYLESTRUCT)
+LPWINDOWPOS = POINTER(PWINDOWPOS)
+
+
+class WINDOWPLACEMENT(Structure):
+    _fields_ = [
+        ("length", UINT),
+        ("flags", UINT),
+        ("showCmd", UINT),
+        ("ptMinPosition", POINT),
+        ("ptMaxPosition", POINT),
+        ("rcNormalPosition", RECT),
+    ]
+
+
+class MONITORINFO(Structure):
+    _fields_ = [
+        ("cbSize", DWORD),
+        ("rcMonitor", RECT),
+        ("rcWork", RECT),
+        ("dwFlags", DWORD),
+    ]
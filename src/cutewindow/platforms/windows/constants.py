@@ -0,0 +1,82 @@
+"""
+Win32 constants used by the Windows backend.
+
+The values are copied from the Windows SDK headers so the backend does not need
+to import ``win32con`` just for a few integers.
+"""
+
+# Window messages
+WM_MOVE = 0x0003
+WM_SIZE = 0x0005
+WM_SETTINGCHANGE = 0x001A
+WM_WINDOWPOSCHANGED = 0x0047
+WM_STYLECHANGED = 0x007D
+WM_DISPLAYCHANGE = 0x007E
+WM_NCDESTROY = 0x0082
+WM_NCCALCSIZE = 0x0083
+WM_NCHITTEST = 0x0084
+WM_NCLBUTTONDOWN = 0x00A1
+WM_NCLBUTTONUP = 0x00A2
+WM_NCLBUTTONDBLCLK = 0x00A3
+WM_NCRBUTTONUP = 0x00A5
+WM_SYSCOMMAND = 0x0112
+WM_NCMOUSELEAVE = 0x02A2
+WM_MOUSELEAVE = 0x02A3
+WM_DPICHANGED = 0x02E0
+
+# WM_NCHITTEST results
+HTCAPTION = 2
+HTMAXBUTTON = 9
+HTLEFT = 10
+HTRIGHT = 11
+HTTOP = 12
+HTTOPLEFT = 13
+HTTOPRIGHT = 14
+HTBOTTOM = 15
+HTBOTTOMLEFT = 16
+HTBOTTOMRIGHT = 17
+
+# WM_NCCALCSIZE results
+WVR_HREDRAW = 0x0100
+WVR_VREDRAW = 0x0200
+WVR_REDRAW = WVR_HREDRAW | WVR_VREDRAW
+
+# WM_SIZE request types
+SIZE_MAXIMIZED = 2
+
+# WM_SYSCOMMAND commands
+SC_MOVE = 0xF010
+
+# SetWindowPos flags
+SWP_NOSIZE = 0x0001
+SWP_NOMOVE = 0x0002
+SWP_NOZORDER = 0x0004
+SWP_NOACTIVATE = 0x0010
+SWP_FRAMECHANGED = 0x0020
+
+# Window styles
+GWL_STYLE = -16
+CS_DBLCLKS = 0x0008
+WS_MAXIMIZEBOX = 0x00010000
+WS_MINIMIZEBOX = 0x00020000
+WS_THICKFRAME = 0x00040000
+WS_SIZEBOX = WS_THICKFRAME
+WS_CAPTION = 0x00C00000
+
+# ShowWindow commands
+SW_MAXIMIZE = 3
+
+# MonitorFromWindow flags
+MONITOR_DEFAULTTOPRIMARY = 0x00000001
+
+# GetSystemMetricsForDpi indices
+SM_CXSIZEFRAME = 32
+SM_CYSIZEFRAME = 33
+SM_CXPADDEDBORDER = 92
+
+# DwmSetWindowAttribute attributes and window corner preferences
+DWMWA_WINDOW_CORNER_PREFERENCE = 33
+DWMWCP_DEFAULT = 0
+DWMWCP_DONOTROUND = 1
+DWMWCP_ROUND = 2
+DWMWCP_ROUNDSMALL = 3
@@ -0,0 +1,48 @@
+"""
+Coalesced frame recalculation for the Windows backend.
+
+``SetWindowPos(..., SWP_FRAMECHANGED)`` makes Windows send ``WM_NCCALCSIZE`` and
+repaint the non-client area. It is only needed when the frame geometry really
+changes, such as after a monitor or DPI change or a maximize transition, and
+several such triggers often arrive within the same burst of messages. Requests
+made through :func:`requestFrameChange` are therefore batched into a single
+``SetWindowPos`` call per window and event-loop turn.
+"""
+
+from PySide6.QtCore import QTimer
+from PySide6.QtWidgets import QWidget
+
+from cutewindow.platforms.windows.constants import (
+    SWP_FRAMECHANGED,
+    SWP_NOACTIVATE,
+    SWP_NOMOVE,
+    SWP_NOSIZE,
+    SWP_NOZORDER,
+)
+from cutewindow.platforms.windows.native_api import SetWindowPos
+
+_FRAME_CHANGE_FLAGS = (
+    SWP_NOMOVE | SWP_NOSIZE | SWP_NOZORDER | SWP_NOACTIVATE | SWP_FRAMECHANGED
+)
+
+
+def requestFrameChange(widget: QWidget, hWnd: int) -> None:
+    """
+    Request a frame recalculation for a window.
+
+    The recalculation runs once on the next event-loop turn, no matter how
+    many requests were made until then.
+
+    Args:
+        widget (QWidget): The top-level window whose frame changed.
+        hWnd (int): The native handle of the window.
+    """
+    if getattr(widget, "_frame_change_pending", False):
+        return
+    widget._frame_change_pending = True  # type: ignore[attr-defined]
+    QTimer.singleShot(0, widget, lambda: _applyFrameChange(widget, hWnd))
+
+
+def _applyFrameChange(widget: QWidget, hWnd: int) -> None:
+    widget._frame_change_pending = False  # type: ignore[attr-defined]
+    SetWindowPos(hWnd, None, 0, 0, 0, 0, _FRAME_CHANGE_FLAGS)
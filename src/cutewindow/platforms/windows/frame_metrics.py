@@ -0,0 +1,99 @@
+"""
+Per-window frame metrics for the Windows backend.
+
+The resize border thickness of a customizable window depends on the DPI of the
+monitor the window lives on. Querying it costs one ``GetDpiForWindow`` and four
+``GetSystemMetricsForDpi`` calls, which is far too much for a message such as
+``WM_NCHITTEST`` that Windows sends on every mouse move. This module keeps the
+values in a small per-window record that is only recomputed when the native
+event handler sees a message that can change them.
+"""
+
+from dataclasses import dataclass
+from typing import Optional
+
+from PySide6.QtWidgets import QWidget
+
+from cutewindow.platforms.windows.constants import (
+    SM_CXPADDEDBORDER,
+    SM_CXSIZEFRAME,
+    SM_CYSIZEFRAME,
+    WM_DISPLAYCHANGE,
+    WM_DPICHANGED,
+    WM_SETTINGCHANGE,
+)
+from cutewindow.platforms.windows.native_api import (
+    GetDpiForWindow,
+    GetSystemMetricsForDpi,
+)
+
+# Messages after which the cached metrics of a window may be stale. A move to a
+# monitor with a different DPI is reported through WM_DPICHANGED, changes to the
+# monitor layout through WM_DISPLAYCHANGE and theme/border settings through
+# WM_SETTINGCHANGE.
+INVALIDATING_MESSAGES = frozenset((WM_DPICHANGED, WM_SETTINGCHANGE, WM_DISPLAYCHANGE))
+
+
+@dataclass(frozen=True)
+class FrameMetrics:
+    """
+    DPI-dependent frame metrics of a single window.
+
+    Attributes:
+        dpi (int): The DPI of the window.
+        border_width (int): Width of the vertical resize borders in pixels.
+        border_height (int): Height of the horizontal resize borders in pixels.
+    """
+
+    dpi: int
+    border_width: int
+    border_height: int
+
+    @classmethod
+    def query(cls, hWnd: int) -> "FrameMetrics":
+        """
+        Query the current frame metrics of a window from the system.
+
+        Args:
+            hWnd (int): The native window handle.
+
+        Returns:
+            FrameMetrics: The metrics for the window's current DPI.
+        """
+        dpi = GetDpiForWindow(hWnd)
+        padded_border = GetSystemMetricsForDpi(SM_CXPADDEDBORDER, dpi)
+        return cls(
+            dpi=dpi,
+            border_width=GetSystemMetricsForDpi(SM_CXSIZEFRAME, dpi) + padded_border,
+            border_height=GetSystemMetricsForDpi(SM_CYSIZEFRAME, dpi) + padded_border,
+        )
+
+
+def frameMetrics(widget: QWidget, hWnd: int) -> FrameMetrics:
+    """
+    Get the cached frame metrics of a window, querying them on first use.
+
+    Args:
+        widget (QWidget): The top-level window owning the cache.
+        hWnd (int): The native handle of the window.
+
+    Returns:
+        FrameMetrics: The cached metrics.
+    """
+    metrics: Optional[FrameMetrics] = getattr(widget, "_frame_metrics", None)
+    if metrics is None:
+        metrics = FrameMetrics.query(hWnd)
+        widget._frame_metrics = metrics  # type: ignore[attr-defined]
+    return metrics
+
+
+def invalidateFrameMetrics(widget: QWidget) -> None:
+    """
+    Drop the cached frame metrics of a window.
+
+    The metrics are queried again the next time they are needed.
+
+    Args:
+        widget (QWidget): The top-level window owning the cache.
+    """
+    widget._frame_metrics = None  # type: ignore[attr-defined]
@@ -0,0 +1,191 @@
+"""
+Opt-in instrumentation of native message handling on Windows.
+
+When enabled, every message that reaches ``nativeEvent`` is recorded per window
+handle and message id: how often it arrived, how often it was handled and how
+long the handler took, as a histogram with fixed latency buckets. Recording
+costs two ``perf_counter_ns`` calls, a couple of dict lookups and a bisect on a
+short tuple. While disabled, ``nativeEvent`` only checks the :data:`enabled`
+flag.
+
+Instrumentation is switched with :func:`setEnabled`, or enabled at import time
+by setting the ``CUTEWINDOW_INSTRUMENT_NATIVE_EVENTS`` environment variable.
+
+Example:
+    >>> from cutewindow.platforms.windows import instrumentation
+    >>> instrumentation.setEnabled(True)
+    >>> # ... use the application ...
+    >>> for hWnd, messages in instrumentation.snapshot().items():
+    ...     for message_id, stats in messages.items():
+    ...         print(hex(hWnd), stats["name"], stats["count"], stats["max_us"])
+"""
+
+import os
+from bisect import bisect_left
+from typing import Any, Dict, List, Optional, Tuple
+
+from cutewindow.platforms.windows import constants
+
+#: Upper bounds of the latency buckets in microseconds. Samples slower than the
+#: last bound are counted in an extra overflow bucket.
+LATENCY_BUCKETS_US: Tuple[int, ...] = (
+    10,
+    25,
+    50,
+    100,
+    250,
+    500,
+    1000,
+    2500,
+    5000,
+    10000,
+)
+
+_BUCKET_BOUNDS_NS = tuple(bound * 1000 for bound in LATENCY_BUCKETS_US)
+
+_MESSAGE_NAMES: Dict[int, str] = {
+    value: name for name, value in vars(constants).items() if name.startswith("WM_")
+}
+
+#: Whether instrumentation is enabled. Read-only, use :func:`setEnabled`.
+enabled = os.environ.get("CUTEWINDOW_INSTRUMENT_NATIVE_EVENTS", "") not in ("", "0")
+
+
+class MessageStats:
+    """
+    Counters for one message id of one window.
+
+    Attributes:
+        count (int): Number of messages received.
+        handled (int): Number of messages reported as handled to Qt.
+        total_ns (int): Total time spent handling the messages.
+        max_ns (int): Longest time spent handling a single message.
+        histogram (List[int]): Message count per latency bucket, with the
+            overflow bucket last.
+    """
+
+    __slots__ = ("count", "handled", "total_ns", "max_ns", "histogram")
+
+    def __init__(self) -> None:
+        """Initialize empty counters."""
+        self.count = 0
+        self.handled = 0
+        self.total_ns = 0
+        self.max_ns = 0
+        self.histogram: List[int] = [0] * (len(_BUCKET_BOUNDS_NS) + 1)
+
+    def record(self, handled: bool, elapsed_ns: int) -> None:
+        """
+        Record one message.
+
+        Args:
+            handled (bool): Whether the message was handled.
+            elapsed_ns (int): Time spent handling the message in nanoseconds.
+        """
+        self.count += 1
+        if handled:
+            self.handled += 1
+        self.total_ns += elapsed_ns
+        if elapsed_ns > self.max_ns:
+            self.max_ns = elapsed_ns
+        self.histogram[bisect_left(_BUCKET_BOUNDS_NS, elapsed_ns)] += 1
+
+    def asDict(self, message_id: int) -> Dict[str, Any]:
+        """
+        Convert the counters to a plain dictionary.
+
+        Args:
+            message_id (int): The message id the counters belong to.
+
+        Returns:
+            Dict[str, Any]: The counters, with times in microseconds.
+        """
+        return {
+            "name": _MESSAGE_NAMES.get(message_id, hex(message_id)),
+            "count": self.count,
+            "handled": self.handled,
+            "unhandled": self.count - self.handled,
+            "handled_ratio": self.handled / self.count if self.count else 0.0,
+            "total_us": self.total_ns / 1000,
+            "mean_us": self.total_ns / self.count / 1000 if self.count else 0.0,
+            "max_us": self.max_ns / 1000,
+            "histogram": list(self.histogram),
+        }
+
+
+_stats: Dict[int, Dict[int, MessageStats]] = {}
+
+
+def setEnabled(value: bool) -> None:
+    """
+    Enable or disable recording of native messages.
+
+    Counters recorded so far are kept; use :func:`reset` to clear them.
+
+    Args:
+        value (bool): Whether instrumentation is enabled.
+    """
+    global enabled
+    enabled = value
+
+
+def isEnabled() -> bool:
+    """
+    Check whether native messages are being recorded.
+
+    Returns:
+        bool: True if instrumentation is enabled, False otherwise.
+    """
+    return enabled
+
+
+def record(hWnd: int, message_id: int, handled: bool, elapsed_ns: int) -> None:
+    """
+    Record one native message.
+
+    Args:
+        hWnd (int): The native handle of the window receiving the message.
+        message_id (int): The message id.
+        handled (bool): Whether the message was handled.
+        elapsed_ns (int): Time spent handling the message in nanoseconds.
+    """
+    window = _stats.get(hWnd)
+    if window is None:
+        window = _stats[hWnd] = {}
+    stats = window.get(message_id)
+    if stats is None:
+        stats = window[message_id] = MessageStats()
+    stats.record(handled, elapsed_ns)
+
+
+def snapshot() -> Dict[int, Dict[int, Dict[str, Any]]]:
+    """
+    Get a copy of all counters recorded so far.
+
+    The histogram of each message lists the number of messages per bucket of
+    :data:`LATENCY_BUCKETS_US`, followed by the overflow bucket.
+
+    Returns:
+        Dict[int, Dict[int, Dict[str, Any]]]: Counters keyed by window handle,
+        then by message id.
+    """
+    return {
+        hWnd: {
+            message_id: stats.asDict(message_id) for message_id, stats in window.items()
+        }
+        for hWnd, window in _stats.items()
+    }
+
+
+def reset(hWnd: Optional[int] = None) -> None:
+    """
+    Clear recorded counters.
+
+    Args:
+        hWnd (int, optional): Only clear the counters of this window. Clears
+            all counters if omitted.
+    """
+    if hWnd is None:
+        _stats.clear()
+    else:
+        _stats.pop(hWnd, None)
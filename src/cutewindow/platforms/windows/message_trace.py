@@ -0,0 +1,429 @@
+"""
+Binary trace recording and replay of native Windows messages.
+
+A :class:`TraceRecorder` writes one fixed-size record per message that reaches
+``nativeEvent`` into a memory-mapped ring buffer file. Once the buffer is full
+the oldest records are overwritten, so memory and disk use stay bounded and
+recording can stay enabled in production. Because the file is memory-mapped,
+the records written so far survive a crash of the process.
+
+Each record holds the message id, ``wParam`` and ``lParam``, a timestamp, the
+time spent in the handler, the window geometry at that moment, the handler's
+result and, for messages whose ``lParam`` points to a structure, the relevant
+fields of that structure.
+
+A :class:`TraceReplayer` memory-maps such a file and feeds the records back
+through the native event handlers with the
+:class:`~cutewindow.platforms.windows.simulator.Win32Simulator`, so a trace
+from a user's machine can be reproduced and profiled on Linux.
+
+Example:
+    >>> from cutewindow.platforms.windows import message_trace
+    >>> message_trace.startRecording("cutewindow.trace")
+    >>> # ... reproduce the problem ...
+    >>> message_trace.stopRecording()
+    >>> with message_trace.TraceReplayer("cutewindow.trace") as replayer:
+    ...     for record, result in replayer.replay(window, simulator):
+    ...         print(record.message, record.result, result)
+"""
+
+import ctypes
+import mmap
+import os
+import struct
+import time
+from ctypes import addressof
+from ctypes.wintypes import MSG
+from typing import Any, Iterator, List, NamedTuple, Optional, Tuple
+
+from PySide6.QtWidgets import QWidget
+
+from cutewindow.platforms.windows.c_structures import (
+    LPNCCALCSIZE_PARAMS,
+    LPSTYLESTRUCT,
+    LPWINDOWPOS,
+    NCCALCSIZE_PARAMS,
+    PWINDOWPOS,
+    STYLESTRUCT,
+)
+from cutewindow.platforms.windows.constants import (
+    WM_NCCALCSIZE,
+    WM_NCHITTEST,
+    WM_NCLBUTTONDBLCLK,
+    WM_NCLBUTTONDOWN,
+    WM_NCLBUTTONUP,
+    WM_NCRBUTTONUP,
+    WM_STYLECHANGED,
+    WM_WINDOWPOSCHANGED,
+)
+
+MAGIC = b"CWTRACE\0"
+VERSION = 1
+
+# magic, version, record size, capacity, records written, start time (ns)
+_HEADER = struct.Struct("<8sHHIQq")
+_COUNT_OFFSET = 16
+
+# timestamp, elapsed, hWnd, message, wParam, lParam, window rect, payload,
+# device pixel ratio * 100, flags, result
+_RECORD = struct.Struct("<qIQIQq4i5iHBxq")
+
+_HANDLED = 0x01
+_MAXIMIZED = 0x02
+
+# Messages whose lParam holds the cursor position in screen coordinates
+_POINT_MESSAGES = frozenset(
+    (
+        WM_NCHITTEST,
+        WM_NCLBUTTONDOWN,
+        WM_NCLBUTTONDBLCLK,
+        WM_NCLBUTTONUP,
+        WM_NCRBUTTONUP,
+    )
+)
+
+Payload = Tuple[int, int, int, int, int]
+_NO_PAYLOAD: Payload = (0, 0, 0, 0, 0)
+
+
+class TraceRecord(NamedTuple):
+    """
+    One recorded native message.
+
+    Attributes:
+        timestamp_ns (int): Time since the recording started.
+        elapsed_ns (int): Time spent in the handler.
+        hWnd (int): The native handle of the receiving window.
+        message (int): The message id.
+        wParam (int): The wParam of the message.
+        lParam (int): The lParam of the message. Pointers are only meaningful
+            in the recording process; see ``payload``.
+        window_rect (Tuple[int, int, int, int]): The window frame in physical
+            screen coordinates.
+        payload (Tuple[int, ...]): Fields of the structure lParam points to,
+            for WM_NCCALCSIZE, WM_WINDOWPOSCHANGED and WM_STYLECHANGED.
+        device_pixel_ratio (float): The device pixel ratio of the window.
+        handled (bool): Whether the handler handled the message.
+        maximized (bool): Whether the window was maximized.
+        result (int): The result returned by the handler.
+    """
+
+    timestamp_ns: int
+    elapsed_ns: int
+    hWnd: int
+    message: int
+    wParam: int
+    lParam: int
+    window_rect: Tuple[int, int, int, int]
+    payload: Payload
+    device_pixel_ratio: float
+    handled: bool
+    maximized: bool
+    result: int
+
+
+def capturePayload(message_id: int, lParam: int) -> Payload:
+    """
+    Copy the fields of the structure a message's lParam points to.
+
+    Must be called before the handler runs, as handlers may modify it.
+
+    Args:
+        message_id (int): The message id.
+        lParam (int): The lParam of the message.
+
+    Returns:
+        Payload: The captured fields, or zeros for other messages.
+    """
+    if not lParam:
+        return _NO_PAYLOAD
+    if message_id == WM_NCCALCSIZE:
+        rect = ctypes.cast(lParam, LPNCCALCSIZE_PARAMS).contents.rgrc[0]
+        return rect.left, rect.top, rect.right, rect.bottom, 0
+    if message_id == WM_WINDOWPOSCHANGED:
+        pos = ctypes.cast(lParam, LPWINDOWPOS).contents
+        return pos.x, pos.y, pos.cx, pos.cy, pos.flags
+    if message_id == WM_STYLECHANGED:
+        styles = ctypes.cast(lParam, LPSTYLESTRUCT).contents
+        # Styles are DWORDs; store them as signed 32-bit values
+        return (
+            ctypes.c_int(styles.styleOld).value,
+            ctypes.c_int(styles.styleNew).value,
+            0,
+            0,
+            0,
+        )
+    return _NO_PAYLOAD
+
+
+class TraceRecorder:
+    """
+    Ring buffer of native message records backed by a memory-mapped file.
+
+    Attributes:
+        path (str): Path of the trace file.
+        capacity (int): Maximum number of records kept.
+    """
+
+    def __init__(self, path: str, capacity: int = 16384) -> None:
+        """
+        Create the trace file and map it into memory.
+
+        Args:
+            path (str): Path of the trace file, overwritten if it exists.
+            capacity (int): Maximum number of records kept, defaults to 16384
+                (about 1.4 MB).
+        """
+        if capacity <= 0:
+            raise ValueError("capacity must be positive")
+        self.path = path
+        self.capacity = capacity
+        self._count = 0
+        self._start_ns = time.perf_counter_ns()
+        size = _HEADER.size + capacity * _RECORD.size
+        with open(path, "w+b") as file:
+            file.truncate(size)
+            self._map = mmap.mmap(file.fileno(), size)
+        _HEADER.pack_into(
+            self._map,
+            0,
+            MAGIC,
+            VERSION,
+            _RECORD.size,
+            capacity,
+            0,
+            time.time_ns(),
+        )
+
+    def __len__(self) -> int:
+        return min(self._count, self.capacity)
+
+    def record(
+        self,
+        widget: QWidget,
+        msg: MSG,
+        payload: Payload,
+        result: Tuple[bool, int],
+        elapsed_ns: int,
+    ) -> None:
+        """
+        Append one message to the ring buffer.
+
+        Args:
+            widget (QWidget): The window that received the message.
+            msg (MSG): The message.
+            payload (Payload): Fields captured with :func:`capturePayload`.
+            result (Tuple[bool, int]): The result returned by the handler.
+            elapsed_ns (int): Time spent in the handler.
+        """
+        r = widget.devicePixelRatioF()
+        g = widget.frameGeometry()
+        # Prefer the backend's mirror, which tracks the native maximized state
+        state = getattr(widget, "_window_state", None)
+        maximized = state.maximized if state is not None else widget.isMaximized()
+        flags = (_HANDLED if result[0] else 0) | (_MAXIMIZED if maximized else 0)
+        offset = _HEADER.size + (self._count % self.capacity) * _RECORD.size
+        _RECORD.pack_into(
+            self._map,
+            offset,
+            time.perf_counter_ns() - self._start_ns,
+            min(elapsed_ns, 0xFFFFFFFF),
+            msg.hWnd or 0,
+            msg.message,
+            msg.wParam,
+            msg.lParam,
+            round(g.left() * r),
+            round(g.top() * r),
+            round((g.left() + g.width()) * r),
+            round((g.top() + g.height()) * r),
+            *payload,
+            round(r * 100),
+            flags,
+            int(result[1]),
+        )
+        self._count += 1
+        struct.pack_into("<Q", self._map, _COUNT_OFFSET, self._count)
+
+    def close(self) -> None:
+        """Flush the trace file and unmap it."""
+        if not self._map.closed:
+            self._map.flush()
+            self._map.close()
+
+
+class TraceReplayer:
+    """
+    Read-only view of a trace file that replays it through nativeEvent.
+
+    Records are iterated from the oldest to the newest one kept in the ring
+    buffer.
+    """
+
+    def __init__(self, path: str) -> None:
+        """
+        Map a trace file into memory.
+
+        Args:
+            path (str): Path of the trace file.
+
+        Raises:
+            ValueError: If the file is not a trace of a supported version.
+        """
+        with open(path, "rb") as file:
+            self._map = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+        try:
+            magic, version, record_size, capacity, count, start = _HEADER.unpack_from(
+                self._map, 0
+            )
+            if magic != MAGIC or version != VERSION or record_size != _RECORD.size:
+                raise ValueError(f"{path} is not a CuteWindow message trace")
+        except (struct.error, ValueError):
+            self._map.close()
+            raise
+        self.capacity: int = capacity
+        self.count: int = count
+        self.start_time_ns: int = start
+
+    def __enter__(self) -> "TraceReplayer":
+        return self
+
+    def __exit__(self, *exc_info: Any) -> None:
+        self.close()
+
+    def __len__(self) -> int:
+        return min(self.count, self.capacity)
+
+    def __iter__(self) -> Iterator[TraceRecord]:
+        first = self.count - len(self)
+        for index in range(first, self.count):
+            offset = _HEADER.size + (index % self.capacity) * _RECORD.size
+            fields = _RECORD.unpack_from(self._map, offset)
+            yield TraceRecord(
+                timestamp_ns=fields[0],
+                elapsed_ns=fields[1],
+                hWnd=fields[2],
+                message=fields[3],
+                wParam=fields[4],
+                lParam=fields[5],
+                window_rect=fields[6:10],
+                payload=fields[10:15],
+                device_pixel_ratio=fields[15] / 100,
+                handled=bool(fields[16] & _HANDLED),
+                maximized=bool(fields[16] & _MAXIMIZED),
+                result=fields[17],
+            )
+
+    def replay(
+        self, widget: QWidget, simulator: Any, hWnd: Optional[int] = None
+    ) -> List[Tuple[TraceRecord, Tuple[bool, int]]]:
+        """
+        Feed the recorded messages to a window's nativeEvent.
+
+        Before each message, the simulated window takes the recorded geometry
+        and maximized state. Structures pointed to by lParam are rebuilt from
+        the recorded payload, and cursor positions are translated to the
+        replaying window.
+
+        Args:
+            widget (QWidget): The window to replay the messages on. It must be
+                registered with the simulator.
+            simulator (Win32Simulator): The installed Win32 simulator.
+            hWnd (Optional[int]): Only replay the messages of this recorded
+                window. Replays all messages if omitted.
+
+        Returns:
+            List[Tuple[TraceRecord, Tuple[bool, int]]]: Each replayed record
+            with the result of the replay.
+        """
+        window = simulator.window(widget)
+        results = []
+        for record in self:
+            if hWnd is not None and record.hWnd != hWnd:
+                continue
+            window.rect = record.window_rect
+            window.maximized = record.maximized
+            _resizeTo(widget, record)
+            # payload keeps the structure lParam points to alive during the call
+            lParam, payload = self._replayArguments(widget, record)
+            result = simulator.send(widget, record.message, record.wParam, lParam)
+            results.append((record, result))
+        return results
+
+    def _replayArguments(self, widget: QWidget, record: TraceRecord) -> Tuple[int, Any]:
+        message, fields = record.message, record.payload
+        payload: Any = None
+        if message == WM_NCCALCSIZE:
+            payload = NCCALCSIZE_PARAMS()
+            rect = payload.rgrc[0]
+            rect.left, rect.top, rect.right, rect.bottom = fields[:4]
+        elif message == WM_WINDOWPOSCHANGED:
+            payload = PWINDOWPOS(int(widget.winId()), None, *fields)
+        elif message == WM_STYLECHANGED:
+            payload = STYLESTRUCT(fields[0] & 0xFFFFFFFF, fields[1] & 0xFFFFFFFF)
+        elif message in _POINT_MESSAGES:
+            return _translatePoint(widget, record), None
+        else:
+            return record.lParam, None
+        return addressof(payload), payload
+
+    def close(self) -> None:
+        """Unmap the trace file."""
+        if not self._map.closed:
+            self._map.close()
+
+
+def _resizeTo(widget: QWidget, record: TraceRecord) -> None:
+    left, top, right, bottom = record.window_rect
+    r = record.device_pixel_ratio or 1.0
+    width, height = round((right - left) / r), round((bottom - top) / r)
+    if (
+        width > 0
+        and height > 0
+        and (width, height)
+        != (
+            widget.frameGeometry().width(),
+            widget.frameGeometry().height(),
+        )
+    ):
+        widget.resize(width, height)
+
+
+def _translatePoint(widget: QWidget, record: TraceRecord) -> int:
+    # Keep the cursor at the same logical offset from the window's frame
+    x = ctypes.c_short(record.lParam & 0xFFFF).value
+    y = ctypes.c_short((record.lParam >> 16) & 0xFFFF).value
+    left, top = record.window_rect[:2]
+    recorded_ratio = record.device_pixel_ratio or 1.0
+    r = widget.devicePixelRatioF()
+    px = round(((x - left) / recorded_ratio + widget.x()) * r) & 0xFFFF
+    py = round(((y - top) / recorded_ratio + widget.y()) * r) & 0xFFFF
+    return ctypes.c_ssize_t(py << 16 | px).value
+
+
+#: The recorder messages are written to, or None while not recording.
+active_recorder: Optional[TraceRecorder] = None
+
+
+def startRecording(path: str, capacity: int = 16384) -> TraceRecorder:
+    """
+    Start recording native messages of all Cute windows to a trace file.
+
+    Args:
+        path (str): Path of the trace file, overwritten if it exists.
+        capacity (int): Maximum number of records kept in the ring buffer.
+
+    Returns:
+        TraceRecorder: The active recorder.
+    """
+    global active_recorder
+    stopRecording()
+    active_recorder = TraceRecorder(os.fspath(path), capacity)
+    return active_recorder
+
+
+def stopRecording() -> None:
+    """Stop recording and close the trace file, if recording."""
+    global active_recorder
+    recorder, active_recorder = active_recorder, None
+    if recorder is not None:
+        recorder.close()
@@ -0,0 +1,226 @@
+"""
+Prototype-bound bindings to the Win32 functions used by the Windows backend.
+
+Every function the backend calls is resolved once, at import time, with full
+``argtypes``/``restype`` prototypes. This avoids the dynamic attribute lookup
+of ``ctypes.windll.<dll>.<function>`` on every call, lets ctypes marshal
+arguments without guessing their types and keeps 64-bit handles intact.
+Library handles are loaded once and cached.
+
+On platforms other than Windows the libraries are provided by a
+:class:`StubLoader`, so the backend can be imported, tested and benchmarked
+elsewhere. Stub functions return 0 unless an implementation is installed:
+
+Example:
+    >>> from cutewindow.platforms.windows import native_api
+    >>> native_api.stub_loader.implement("user32", "GetDpiForWindow", lambda h: 96)
+    >>> native_api.GetDpiForWindow(0x1234)
+    96
+"""
+
+import ctypes
+import sys
+from ctypes import POINTER, c_int, c_long, wintypes
+from typing import Any, Callable, Dict, Optional
+
+from cutewindow.platforms.windows.c_structures import (
+    MARGINS,
+    MONITORINFO,
+    WINDOWPLACEMENT,
+)
+
+IS_WINDOWS = sys.platform == "win32"
+
+HRESULT = c_long
+LRESULT = LPARAM = ctypes.c_ssize_t
+WPARAM = ctypes.c_size_t
+
+
+class StubFunction:
+    """
+    Stand-in for a foreign function on platforms without Win32.
+
+    Accepts the same ``argtypes``/``restype`` attributes as a ctypes function
+    and forwards calls to an optional Python implementation.
+
+    Attributes:
+        argtypes (Optional[tuple]): Declared argument types, unused.
+        restype (Any): Declared return type, unused.
+        implementation (Optional[Callable]): Python implementation of the call.
+    """
+
+    def __init__(self, name: str) -> None:
+        """
+        Initialize the stub function.
+
+        Args:
+            name (str): Name of the emulated function.
+        """
+        self.__name__ = name
+        self.argtypes: Optional[tuple] = None
+        self.restype: Any = None
+        self.implementation: Optional[Callable[..., Any]] = None
+
+    def __call__(self, *args: Any) -> Any:
+        """Call the implementation, or return 0 if there is none."""
+        if self.implementation is None:
+            return 0
+        return self.implementation(*args)
+
+
+class StubLibrary:
+    """
+    Stand-in for a Win32 DLL on platforms without Win32.
+
+    Functions are created on first access and cached, so the same
+    :class:`StubFunction` is returned for every lookup of a name.
+    """
+
+    def __init__(self, name: str) -> None:
+        """
+        Initialize the stub library.
+
+        Args:
+            name (str): Name of the emulated library.
+        """
+        self._name = name
+        self._functions: Dict[str, StubFunction] = {}
+
+    def __getattr__(self, name: str) -> StubFunction:
+        if name.startswith("_"):
+            raise AttributeError(name)
+        function = self._functions.get(name)
+        if function is None:
+            function = self._functions[name] = StubFunction(name)
+        return function
+
+
+class StubLoader:
+    """
+    Library loader used instead of ``ctypes.WinDLL`` outside of Windows.
+
+    Example:
+        >>> stub_loader.implement("user32", "IsZoomed", lambda hWnd: 1)
+    """
+
+    def __init__(self) -> None:
+        """Initialize the stub loader."""
+        self._libraries: Dict[str, StubLibrary] = {}
+
+    def load(self, name: str) -> StubLibrary:
+        """
+        Get the stub library with the given name, creating it on first use.
+
+        Args:
+            name (str): Name of the library, such as "user32".
+
+        Returns:
+            StubLibrary: The cached stub library.
+        """
+        library = self._libraries.get(name)
+        if library is None:
+            library = self._libraries[name] = StubLibrary(name)
+        return library
+
+    def implement(
+        self, library: str, name: str, implementation: Optional[Callable[..., Any]]
+    ) -> None:
+        """
+        Install a Python implementation for a stub function.
+
+        Args:
+            library (str): Name of the library, such as "user32".
+            name (str): Name of the function.
+            implementation (Optional[Callable]): The implementation, or None to
+                make the function return 0 again.
+        """
+        getattr(self.load(library), name).implementation = implementation
+
+
+stub_loader = StubLoader()
+
+_libraries: Dict[str, Any] = {}
+
+
+def _library(name: str) -> Any:
+    library = _libraries.get(name)
+    if library is None:
+        if IS_WINDOWS:
+            library = ctypes.WinDLL(name, use_last_error=True)  # type: ignore
+        else:
+            library = stub_loader.load(name)
+        _libraries[name] = library
+    return library
+
+
+def _bind(library: str, name: str, restype: Any, *argtypes: Any) -> Any:
+    function = getattr(_library(library), name)
+    function.restype = restype
+    function.argtypes = argtypes
+    return function
+
+
+# user32
+GetDpiForWindow = _bind("user32", "GetDpiForWindow", wintypes.UINT, wintypes.HWND)
+GetSystemMetricsForDpi = _bind(
+    "user32", "GetSystemMetricsForDpi", c_int, c_int, wintypes.UINT
+)
+IsZoomed = _bind("user32", "IsZoomed", wintypes.BOOL, wintypes.HWND)
+GetWindowLongW = _bind("user32", "GetWindowLongW", wintypes.LONG, wintypes.HWND, c_int)
+SetWindowLongW = _bind(
+    "user32", "SetWindowLongW", wintypes.LONG, wintypes.HWND, c_int, wintypes.LONG
+)
+SetWindowPos = _bind(
+    "user32",
+    "SetWindowPos",
+    wintypes.BOOL,
+    wintypes.HWND,
+    wintypes.HWND,
+    c_int,
+    c_int,
+    c_int,
+    c_int,
+    wintypes.UINT,
+)
+GetWindowPlacement = _bind(
+    "user32",
+    "GetWindowPlacement",
+    wintypes.BOOL,
+    wintypes.HWND,
+    POINTER(WINDOWPLACEMENT),
+)
+GetWindowRect = _bind(
+    "user32", "GetWindowRect", wintypes.BOOL, wintypes.HWND, POINTER(wintypes.RECT)
+)
+MonitorFromWindow = _bind(
+    "user32", "MonitorFromWindow", wintypes.HMONITOR, wintypes.HWND, wintypes.DWORD
+)
+GetMonitorInfoW = _bind(
+    "user32",
+    "GetMonitorInfoW",
+    wintypes.BOOL,
+    wintypes.HMONITOR,
+    POINTER(MONITORINFO),
+)
+ReleaseCapture = _bind("user32", "ReleaseCapture", wintypes.BOOL)
+SendMessageW = _bind(
+    "user32", "SendMessageW", LRESULT, wintypes.HWND, wintypes.UINT, WPARAM, LPARAM
+)
+
+# dwmapi
+DwmExtendFrameIntoClientArea = _bind(
+    "dwmapi",
+    "DwmExtendFrameIntoClientArea",
+    HRESULT,
+    wintypes.HWND,
+    POINTER(MARGINS),
+)
+DwmSetWindowAttribute = _bind(
+    "dwmapi",
+    "DwmSetWindowAttribute",
+    HRESULT,
+    wintypes.HWND,
+    wintypes.DWORD,
+    wintypes.LPCVOID,
+    wintypes.DWORD,
+)
@@ -1,121 +1,293 @@
 import ctypes
-from ctypes.wintypes import POINT
+from ctypes import c_uint
+from ctypes.wintypes import MSG
+from time import perf_counter_ns
+from typing import Callable, Dict, Tuple
 
-import win32con
-import win32gui
 from PySide6.QtCore import QByteArray, QEvent, QPoint, Qt
 from PySide6.QtGui import QMouseEvent
-from PySide6.QtWidgets import QApplication, QPushButton, QWidget
+from PySide6.QtWidgets import QApplication, QWidget
 
-from cutewindow.platforms.windows.c_structures import LPNCCALCSIZE_PARAMS
+from cutewindow.hit_test import HitRegion
+from cutewindow.platforms.windows import instrumentation, message_trace
+from cutewindow.platforms.windows.c_structures import (
+    LPNCCALCSIZE_PARAMS,
+    LPSTYLESTRUCT,
+    LPWINDOWPOS,
+)
+from cutewindow.platforms.windows.constants import (
+    GWL_STYLE,
+    HTBOTTOM,
+    HTBOTTOMLEFT,
+    HTBOTTOMRIGHT,
+    HTCAPTION,
+    HTLEFT,
+    HTMAXBUTTON,
+    HTRIGHT,
+    HTTOP,
+    HTTOPLEFT,
+    HTTOPRIGHT,
+    SIZE_MAXIMIZED,
+    SWP_NOMOVE,
+    SWP_NOSIZE,
+    WM_MOUSELEAVE,
+    WM_NCCALCSIZE,
+    WM_NCHITTEST,
+    WM_NCLBUTTONDBLCLK,
+    WM_NCLBUTTONDOWN,
+    WM_NCLBUTTONUP,
+    WM_NCMOUSELEAVE,
+    WM_NCRBUTTONUP,
+    WM_SIZE,
+    WM_STYLECHANGED,
+    WM_WINDOWPOSCHANGED,
+    WS_SIZEBOX,
+    WVR_REDRAW,
+)
+from cutewindow.platforms.windows.frame_change import requestFrameChange
+from cutewindow.platforms.windows.frame_metrics import (
+    INVALIDATING_MESSAGES,
+    frameMetrics,
+    invalidateFrameMetrics,
+)
+from cutewindow.platforms.windows.native_api import IsZoomed
 from cutewindow.platforms.windows.title_bar.TitleBar import MaximizeButtonState
-from cutewindow.platforms.windows.utils import isFullScreen, isMaximized
+from cutewindow.platforms.windows.utils import getWindowRect
+from cutewindow.platforms.windows.window_state import (
+    invalidateWindowState,
+    windowState,
+)
 
+# WM_STYLECHANGED passes the GWL_* index as a (sign-extended) WPARAM
+_GWL_STYLE_WPARAM = GWL_STYLE & 0xFFFFFFFF
+_SWP_NOGEOMETRY = SWP_NOMOVE | SWP_NOSIZE
 
-def _nativeEvent(widget: QWidget, event_type: QByteArray, message: int):
-    msg = ctypes.wintypes.MSG.from_address(message.__int__())
+# Offset of MSG.message, used to read the message id without building a MSG
+_MESSAGE_OFFSET = MSG.message.offset
 
-    pt = POINT()
-    ctypes.windll.user32.GetCursorPos(ctypes.byref(pt))
+NativeEventResult = Tuple[bool, int]
+MessageHandler = Callable[[QWidget, MSG], NativeEventResult]
+
+_UNHANDLED: NativeEventResult = (False, 0)
+
+_HIT_TEST_RESULTS: Dict[HitRegion, NativeEventResult] = {
+    HitRegion.CAPTION: (True, HTCAPTION),
+    HitRegion.MAXIMIZE_BUTTON: (True, HTMAXBUTTON),
+    HitRegion.LEFT: (True, HTLEFT),
+    HitRegion.RIGHT: (True, HTRIGHT),
+    HitRegion.TOP: (True, HTTOP),
+    HitRegion.BOTTOM: (True, HTBOTTOM),
+    HitRegion.TOP_LEFT: (True, HTTOPLEFT),
+    HitRegion.TOP_RIGHT: (True, HTTOPRIGHT),
+    HitRegion.BOTTOM_LEFT: (True, HTBOTTOMLEFT),
+    HitRegion.BOTTOM_RIGHT: (True, HTBOTTOMRIGHT),
+}
+
+
+def _cursorPos(widget: QWidget, lParam: int) -> Tuple[int, int]:
+    """
+    Decode the screen position packed in a message's lParam.
+
+    Hit-test and non-client mouse messages carry the cursor position in
+    physical screen coordinates, which makes a GetCursorPos call unnecessary.
+
+    Args:
+        widget (QWidget): The window receiving the message.
+        lParam (int): The lParam of the message.
+
+    Returns:
+        Tuple[int, int]: The cursor position in the window's logical coordinates.
+    """
+    sx = lParam & 0xFFFF
+    sy = (lParam >> 16) & 0xFFFF
+    # GET_X_LPARAM/GET_Y_LPARAM: coordinates are signed on multi-monitor setups
+    if sx & 0x8000:
+        sx -= 0x10000
+    if sy & 0x8000:
+        sy -= 0x10000
     r = widget.devicePixelRatioF()
-    x = pt.x / r - widget.x()
-    y = pt.y / r - widget.y()
-
-    user32 = ctypes.windll.user32
-    dpi = user32.GetDpiForWindow(msg.hWnd)
-    borderWidth = user32.GetSystemMetricsForDpi(
-        win32con.SM_CXSIZEFRAME, dpi
-    ) + user32.GetSystemMetricsForDpi(92, dpi)
-    borderHeight = user32.GetSystemMetricsForDpi(
-        win32con.SM_CYSIZEFRAME, dpi
-    ) + user32.GetSystemMetricsForDpi(92, dpi)
-
-    if msg.message == win32con.WM_NCHITTEST:
-        if widget.isResizable() and not isMaximized(msg.hWnd):
-            w, h = widget.width(), widget.height()
-            lx = x < borderWidth
-            rx = x > w - borderWidth
-            ty = y < borderHeight
-            by = y > h - borderHeight
-
-            if lx and ty:
-                return True, win32con.HTTOPLEFT
-            if rx and by:
-                return True, win32con.HTBOTTOMRIGHT
-            if rx and ty:
-                return True, win32con.HTTOPRIGHT
-            if lx and by:
-                return True, win32con.HTBOTTOMLEFT
-            if ty:
-                return True, win32con.HTTOP
-            if by:
-                return True, win32con.HTBOTTOM
-            if lx:
-                return True, win32con.HTLEFT
-            if rx:
-                return True, win32con.HTRIGHT
-
-        if widget.childAt(QPoint(x, y)) is widget._title_bar.maximize_button:
-            widget._title_bar.maximize_button.setState(MaximizeButtonState.HOVER)
-            return True, win32con.HTMAXBUTTON
-
-        if widget.childAt(x, y) not in widget._title_bar.findChildren(QPushButton):
-            if borderHeight < y < widget._title_bar.height():
-                return True, win32con.HTCAPTION
-
-    elif msg.message == win32con.WM_MOVE:
-        win32gui.SetWindowPos(
-            msg.hWnd,
-            None,
-            0,
-            0,
-            0,
-            0,
-            win32con.SWP_NOMOVE | win32con.SWP_NOSIZE | win32con.SWP_FRAMECHANGED,
+    return int(sx / r - widget.x()), int(sy / r - widget.y())
+
+
+def _onNcHitTest(widget: QWidget, msg: MSG) -> NativeEventResult:
+    x, y = _cursorPos(widget, msg.lParam)
+    metrics = frameMetrics(widget, msg.hWnd)
+    state = windowState(widget, msg.hWnd)
+    index = widget._title_bar.hitTestIndex()
+    index.setResizeBorders(metrics.border_width, metrics.border_height)
+
+    region = index.hitTest(x, y, state.resizable and not state.maximized)
+    if region is HitRegion.MAXIMIZE_BUTTON:
+        widget._title_bar.maximize_button.setState(MaximizeButtonState.HOVER)
+    return _HIT_TEST_RESULTS.get(region, _UNHANDLED)
+
+
+def _isOverMaximizeButton(widget: QWidget, msg: MSG) -> bool:
+    x, y = _cursorPos(widget, msg.lParam)
+    region = widget._title_bar.hitTestIndex().hitTest(x, y, resizable=False)
+    return region is HitRegion.MAXIMIZE_BUTTON
+
+
+def _onMouseLeave(widget: QWidget, msg: MSG) -> NativeEventResult:
+    widget._title_bar.maximize_button.setState(MaximizeButtonState.NORMAL)
+    return False, 0
+
+
+def _onNcButtonDown(widget: QWidget, msg: MSG) -> NativeEventResult:
+    if _isOverMaximizeButton(widget, msg):
+        QApplication.sendEvent(
+            widget._title_bar.maximize_button,
+            QMouseEvent(
+                QEvent.MouseButtonPress,
+                QPoint(),
+                Qt.LeftButton,
+                Qt.LeftButton,
+                Qt.NoModifier,
+            ),
+        )
+        return True, 0
+    return False, 0
+
+
+def _onNcButtonUp(widget: QWidget, msg: MSG) -> NativeEventResult:
+    if _isOverMaximizeButton(widget, msg):
+        QApplication.sendEvent(
+            widget._title_bar.maximize_button,
+            QMouseEvent(
+                QEvent.MouseButtonRelease,
+                QPoint(),
+                Qt.LeftButton,
+                Qt.LeftButton,
+                Qt.NoModifier,
+            ),
         )
+    return False, 0
+
+
+def _setMaximized(widget: QWidget, hWnd: int, maximized: bool) -> None:
+    state = windowState(widget, hWnd)
+    if maximized != state.maximized:
+        state.maximized = maximized
+        requestFrameChange(widget, hWnd)
 
-    elif msg.message in [0x2A2, win32con.WM_MOUSELEAVE]:
-        widget._title_bar.maximize_button.setState(MaximizeButtonState.NORMAL)
-    elif msg.message in [win32con.WM_NCLBUTTONDOWN, win32con.WM_NCLBUTTONDBLCLK]:
-        if widget.childAt(QPoint(x, y)) is widget._title_bar.maximize_button:
-            QApplication.sendEvent(
-                widget._title_bar.maximize_button,
-                QMouseEvent(
-                    QEvent.MouseButtonPress,
-                    QPoint(),
-                    Qt.LeftButton,
-                    Qt.LeftButton,
-                    Qt.NoModifier,
-                ),
-            )
-            return True, 0
-    elif msg.message in [win32con.WM_NCLBUTTONUP, win32con.WM_NCRBUTTONUP]:
-        if widget.childAt(QPoint(x, y)) is widget._title_bar.maximize_button:
-            QApplication.sendEvent(
-                widget._title_bar.maximize_button,
-                QMouseEvent(
-                    QEvent.MouseButtonRelease,
-                    QPoint(),
-                    Qt.LeftButton,
-                    Qt.LeftButton,
-                    Qt.NoModifier,
-                ),
-            )
-
-    elif msg.message == win32con.WM_NCCALCSIZE:
-        rect = ctypes.cast(msg.lParam, LPNCCALCSIZE_PARAMS).contents.rgrc[0]
-
-        isMax = isMaximized(msg.hWnd)
-        isFull = isFullScreen(msg.hWnd)
-
-        # adjust the size of client rect
-        if isMax and not isFull:
-            rect.top += borderHeight
-            rect.left += borderWidth
-            rect.right -= borderWidth
-            rect.bottom -= borderHeight
-
-        _ = 0 if not msg.wParam else win32con.WVR_REDRAW
-        return True, win32con.WVR_REDRAW
 
+def _onNcCalcSize(widget: QWidget, msg: MSG) -> NativeEventResult:
+    rect = ctypes.cast(msg.lParam, LPNCCALCSIZE_PARAMS).contents.rgrc[0]
+
+    # WM_NCCALCSIZE arrives before WM_SIZE during a maximize, so the maximized
+    # flag is refreshed here with a single IsZoomed call
+    state = windowState(widget, msg.hWnd)
+    _setMaximized(widget, msg.hWnd, bool(IsZoomed(msg.hWnd)))
+    isFull = (rect.left, rect.top, rect.right, rect.bottom) == state.monitor_rect
+
+    # adjust the size of client rect
+    if state.maximized and not isFull:
+        metrics = frameMetrics(widget, msg.hWnd)
+        rect.top += metrics.border_height
+        rect.left += metrics.border_width
+        rect.right -= metrics.border_width
+        rect.bottom -= metrics.border_height
+
+    return True, WVR_REDRAW
+
+
+def _onSize(widget: QWidget, msg: MSG) -> NativeEventResult:
+    _setMaximized(widget, msg.hWnd, msg.wParam == SIZE_MAXIMIZED)
+    return False, 0
+
+
+def _onWindowPosChanged(widget: QWidget, msg: MSG) -> NativeEventResult:
+    pos = ctypes.cast(msg.lParam, LPWINDOWPOS).contents
+    flags = pos.flags
+    if flags & _SWP_NOGEOMETRY == _SWP_NOGEOMETRY:
+        return False, 0
+
+    if flags & _SWP_NOGEOMETRY:
+        window_rect = getWindowRect(msg.hWnd)
+        if window_rect is None:
+            return False, 0
+    else:
+        window_rect = (pos.x, pos.y, pos.x + pos.cx, pos.y + pos.cy)
+    if windowState(widget, msg.hWnd).updateGeometry(msg.hWnd, window_rect):
+        invalidateFrameMetrics(widget)
+        requestFrameChange(widget, msg.hWnd)
+    return False, 0
+
+
+def _onStyleChanged(widget: QWidget, msg: MSG) -> NativeEventResult:
+    if msg.wParam & 0xFFFFFFFF == _GWL_STYLE_WPARAM:
+        style = ctypes.cast(msg.lParam, LPSTYLESTRUCT).contents.styleNew
+        windowState(widget, msg.hWnd).resizable = bool(style & WS_SIZEBOX)
     return False, 0
+
+
+def _onMetricsChanged(widget: QWidget, msg: MSG) -> NativeEventResult:
+    invalidateFrameMetrics(widget)
+    invalidateWindowState(widget)
+    requestFrameChange(widget, msg.hWnd)
+    return False, 0
+
+
+_HANDLERS: Dict[int, MessageHandler] = {
+    WM_NCHITTEST: _onNcHitTest,
+    WM_NCMOUSELEAVE: _onMouseLeave,
+    WM_MOUSELEAVE: _onMouseLeave,
+    WM_NCLBUTTONDOWN: _onNcButtonDown,
+    WM_NCLBUTTONDBLCLK: _onNcButtonDown,
+    WM_NCLBUTTONUP: _onNcButtonUp,
+    WM_NCRBUTTONUP: _onNcButtonUp,
+    WM_NCCALCSIZE: _onNcCalcSize,
+    WM_SIZE: _onSize,
+    WM_WINDOWPOSCHANGED: _onWindowPosChanged,
+    WM_STYLECHANGED: _onStyleChanged,
+}
+_HANDLERS.update(dict.fromkeys(INVALIDATING_MESSAGES, _onMetricsChanged))
+
+
+def _nativeEvent(
+    widget: QWidget, event_type: QByteArray, message: int
+) -> NativeEventResult:
+    """
+    Handle a native Windows message on behalf of a customizable window.
+
+    The message id is read straight from the MSG structure and looked up in a
+    dispatch table, so messages without a handler return before any other
+    work is done. While instrumentation or trace recording is enabled, every
+    message is also recorded in
+    :mod:`cutewindow.platforms.windows.instrumentation` or
+    :mod:`cutewindow.platforms.windows.message_trace`.
+
+    Args:
+        widget (QWidget): The window receiving the message.
+        event_type (QByteArray): The type of the native event.
+        message (int): Address of the native MSG structure.
+
+    Returns:
+        Tuple[bool, int]: Whether the message was handled and its result.
+    """
+    address = message.__int__()
+    message_id = c_uint.from_address(address + _MESSAGE_OFFSET).value
+    if instrumentation.enabled or message_trace.active_recorder is not None:
+        return _observedDispatch(widget, address, message_id)
+    handler = _HANDLERS.get(message_id)
+    if handler is None:
+        return False, 0
+    return handler(widget, MSG.from_address(address))
+
+
+def _observedDispatch(
+    widget: QWidget, address: int, message_id: int
+) -> NativeEventResult:
+    recorder = message_trace.active_recorder
+    msg = MSG.from_address(address)
+    if recorder is not None:
+        payload = message_trace.capturePayload(message_id, msg.lParam)
+    start = perf_counter_ns()
+    handler = _HANDLERS.get(message_id)
+    result = _UNHANDLED if handler is None else handler(widget, msg)
+    elapsed_ns = perf_counter_ns() - start
+    if instrumentation.enabled:
+        instrumentation.record(msg.hWnd or 0, message_id, result[0], elapsed_ns)
+    if recorder is not None:
+        recorder.record(widget, msg, payload, result, elapsed_ns)
+    return result
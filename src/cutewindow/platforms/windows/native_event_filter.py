@@ -0,0 +1,224 @@
+"""
+Application-wide native event filter for Cute windows.
+
+By default each Cute window overrides ``nativeEvent``, so every native message
+of every window crosses from C++ into Python. :func:`installNativeEventFilter`
+switches to an alternative mode: a single :class:`QAbstractNativeEventFilter`
+on the application handles the messages of all Cute windows. Each Cute window
+the filter takes over is switched to a twin of its class without the
+``nativeEvent`` override, so its messages enter Python once, in the filter.
+Other windows, and the classes themselves, are left alone, and the windows
+are switched back when the filter is removed.
+
+The filter reads the message id first and lets everything without a handler
+through before looking at windows. Windows are found through a table from
+native handle to Cute window, filled on first use with ``QWidget.find``.
+Handles of other Qt windows are remembered as well, so they are only looked
+up once. Handles Qt has not mapped yet, as during ``CreateWindowEx``, are not
+remembered and are looked up again on their next message. Entries are dropped
+on ``WM_NCDESTROY`` and when the widget is destroyed.
+
+Example:
+    >>> app = QApplication(sys.argv)
+    >>> installNativeEventFilter()
+    >>> window = CuteWindow()
+"""
+
+from ctypes import c_uint, c_void_p
+from ctypes.wintypes import MSG
+from functools import partial
+from typing import Callable, Dict, Optional, Tuple, Type
+
+from PySide6.QtCore import QAbstractNativeEventFilter, QByteArray, QCoreApplication
+from PySide6.QtWidgets import QDialog, QMainWindow, QWidget
+
+from cutewindow.platforms.windows.constants import WM_NCDESTROY
+from cutewindow.platforms.windows.CuteDialog import CuteDialog
+from cutewindow.platforms.windows.CuteMainWindow import CuteMainWindow
+from cutewindow.platforms.windows.CuteWindow import CuteWindow
+from cutewindow.platforms.windows.native_event import _HANDLERS, _nativeEvent
+
+_HWND_OFFSET = MSG.hWnd.offset
+_MESSAGE_OFFSET = MSG.message.offset
+
+# Window messages are also seen as "windows_dispatcher_MSG" when they are
+# dispatched; only the window procedure pass may be handled
+_WINDOW_MESSAGE = QByteArray(b"windows_generic_MSG")
+
+_WINDOW_CLASSES: Tuple[Type[QWidget], ...] = (CuteWindow, CuteMainWindow, CuteDialog)
+
+# Qt implementation of nativeEvent per Cute window class
+_QT_NATIVE_EVENTS: Dict[Type[QWidget], Callable] = {
+    CuteWindow: QWidget.nativeEvent,
+    CuteMainWindow: QMainWindow.nativeEvent,
+    CuteDialog: QDialog.nativeEvent,
+}
+
+# Twin of each window class without the nativeEvent override
+_filtered_classes: Dict[type, type] = {}
+
+
+def _filteredClass(cls: type) -> Optional[type]:
+    filtered = _filtered_classes.get(cls)
+    if filtered is None:
+        for window_class, qt_native_event in _QT_NATIVE_EVENTS.items():
+            # Subclasses overriding nativeEvent themselves keep their override
+            if issubclass(cls, window_class) and cls.nativeEvent is (
+                window_class.__dict__["nativeEvent"]
+            ):
+                filtered = type(
+                    cls.__name__,
+                    (cls,),
+                    {"nativeEvent": qt_native_event, "__module__": cls.__module__},
+                )
+                _filtered_classes[cls] = filtered
+                break
+    return filtered
+
+
+class CuteNativeEventFilter(QAbstractNativeEventFilter):
+    """
+    Native event filter dispatching the messages of all Cute windows.
+
+    Attributes:
+        windows (Dict[int, Optional[QWidget]]): Cute window per native handle,
+            or None for handles of other Qt windows.
+    """
+
+    def __init__(self) -> None:
+        """Initialize the filter with an empty window table."""
+        super().__init__()
+        self.windows: Dict[int, Optional[QWidget]] = {}
+
+    def nativeEventFilter(self, eventType: QByteArray, message: int):  # type: ignore
+        """
+        Handle a native message if it is meant for a Cute window.
+
+        Args:
+            eventType (QByteArray): The type of the native event.
+            message (int): Address of the native MSG structure.
+
+        Returns:
+            Tuple[bool, int]: Whether the message was handled and its result.
+        """
+        address = int(message)
+        message_id = c_uint.from_address(address + _MESSAGE_OFFSET).value
+        if message_id not in _HANDLERS:
+            if message_id == WM_NCDESTROY:
+                self.unregisterWindow(self._hWnd(address))
+            return False, 0
+        if eventType != _WINDOW_MESSAGE:
+            return False, 0
+
+        hWnd = self._hWnd(address)
+        try:
+            widget = self.windows[hWnd]
+        except KeyError:
+            widget = self.registerWindow(hWnd)
+        if widget is None:
+            return False, 0
+        return _nativeEvent(widget, eventType, address)
+
+    @staticmethod
+    def _hWnd(address: int) -> int:
+        return c_void_p.from_address(address + _HWND_OFFSET).value or 0
+
+    def registerWindow(self, hWnd: int) -> Optional[QWidget]:
+        """
+        Look up the widget of a native handle and take it over if it is Cute.
+
+        The result is remembered once Qt has mapped the handle to a widget.
+
+        Args:
+            hWnd (int): The native window handle.
+
+        Returns:
+            Optional[QWidget]: The Cute window with that handle, or None if
+            the handle belongs to another window or is not mapped yet.
+        """
+        widget = QWidget.find(hWnd)
+        if widget is None:
+            return None
+        if not isinstance(widget, _WINDOW_CLASSES):
+            self.windows[hWnd] = None
+            return None
+        filtered = _filteredClass(type(widget))
+        if filtered is not None:
+            widget.__class__ = filtered
+        widget.destroyed.connect(partial(self._forgetWindow, hWnd))
+        self.windows[hWnd] = widget
+        return widget
+
+    def unregisterWindow(self, hWnd: int) -> None:
+        """
+        Forget a native handle, for instance because its window was destroyed.
+
+        The window gets its ``nativeEvent`` override back, so it handles the
+        messages of a native window it may create again itself.
+
+        Args:
+            hWnd (int): The native window handle.
+        """
+        widget = self.windows.pop(hWnd, None)
+        if widget is not None:
+            _restoreClass(widget)
+
+    def _forgetWindow(self, hWnd: int, *args: object) -> None:
+        self.windows.pop(hWnd, None)
+
+    def unregisterAll(self) -> None:
+        """Forget all native handles and give the windows their overrides back."""
+        for hWnd in list(self.windows):
+            self.unregisterWindow(hWnd)
+
+
+def _restoreClass(widget: QWidget) -> None:
+    cls = type(widget)
+    if _filtered_classes.get(cls.__base__) is cls:
+        widget.__class__ = cls.__base__
+
+
+_filter: Optional[CuteNativeEventFilter] = None
+
+
+def installNativeEventFilter() -> CuteNativeEventFilter:
+    """
+    Handle the native messages of all Cute windows in one application filter.
+
+    Cute windows lose their ``nativeEvent`` override while the filter
+    handles them. A QApplication must exist.
+
+    Returns:
+        CuteNativeEventFilter: The installed filter.
+    """
+    global _filter
+    if _filter is None:
+        app = QCoreApplication.instance()
+        if app is None:
+            raise RuntimeError("A QApplication must be created first")
+        _filter = CuteNativeEventFilter()
+        app.installNativeEventFilter(_filter)
+    return _filter
+
+
+def removeNativeEventFilter() -> None:
+    """Remove the application filter and give the windows their overrides back."""
+    global _filter
+    if _filter is None:
+        return
+    app = QCoreApplication.instance()
+    if app is not None:
+        app.removeNativeEventFilter(_filter)
+    _filter.unregisterAll()
+    _filter = None
+
+
+def nativeEventFilter() -> Optional[CuteNativeEventFilter]:
+    """
+    Get the installed application filter.
+
+    Returns:
+        Optional[CuteNativeEventFilter]: The filter, or None if each window
+        handles its own native events.
+    """
+    return _filter
@@ -0,0 +1,426 @@
+"""
+Simulated Win32 window manager for running the Windows backend elsewhere.
+
+:class:`Win32Simulator` installs Python implementations for the stub functions
+of :mod:`cutewindow.platforms.windows.native_api`, keeps the native state of
+each registered window (rectangle, style, maximized flag) and builds the
+``MSG`` structures, including their ``lParam`` payloads, that Windows would
+send to ``nativeEvent``. Together with the offscreen Qt platform, this allows
+the native event path to be tested, benchmarked and replayed on Linux.
+
+The simulator only models what the backend observes. It does not move Qt
+widgets, and nativeEvent is never called by Qt itself.
+
+Example:
+    >>> with Win32Simulator() as simulator:
+    ...     hWnd = simulator.addWindow(window)
+    ...     simulator.hitTestSweep(window, [(10, 10), (400, 15)])
+    ...     simulator.maximize(window)
+"""
+
+import ctypes
+from ctypes import addressof
+from ctypes.wintypes import MSG, RECT
+from dataclasses import dataclass, field
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+from PySide6.QtCore import QByteArray
+from PySide6.QtWidgets import QWidget
+
+from cutewindow.platforms.windows import native_api
+from cutewindow.platforms.windows.c_structures import (
+    NCCALCSIZE_PARAMS,
+    PWINDOWPOS,
+    STYLESTRUCT,
+)
+from cutewindow.platforms.windows.constants import (
+    GWL_STYLE,
+    SIZE_MAXIMIZED,
+    SM_CXPADDEDBORDER,
+    SM_CXSIZEFRAME,
+    SM_CYSIZEFRAME,
+    SW_MAXIMIZE,
+    WM_MOVE,
+    WM_NCCALCSIZE,
+    WM_NCHITTEST,
+    WM_SIZE,
+    WM_STYLECHANGED,
+    WM_WINDOWPOSCHANGED,
+    WS_CAPTION,
+    WS_SIZEBOX,
+)
+
+Rect = Tuple[int, int, int, int]
+
+SIZE_RESTORED = 0
+SW_SHOWNORMAL = 1
+
+EVENT_TYPE = QByteArray(b"windows_generic_MSG")
+
+# Unscaled GetSystemMetrics values of a default Windows 11 installation
+_SYSTEM_METRICS = {SM_CXSIZEFRAME: 4, SM_CYSIZEFRAME: 4, SM_CXPADDEDBORDER: 4}
+
+
+@dataclass
+class SimulatedWindow:
+    """
+    Native state of one simulated window.
+
+    Attributes:
+        rect (Rect): The window rectangle in physical screen coordinates.
+        style (int): The GWL_STYLE value of the window.
+        maximized (bool): Whether the window is maximized.
+        restore_rect (Rect): The rectangle to restore to after a maximize.
+    """
+
+    rect: Rect
+    style: int = WS_CAPTION | WS_SIZEBOX
+    maximized: bool = False
+    restore_rect: Rect = (0, 0, 0, 0)
+
+
+@dataclass
+class SimulatorStats:
+    """
+    Counters of the messages sent and Win32 calls made by the simulator.
+
+    Attributes:
+        messages (int): Number of messages delivered to nativeEvent.
+        calls (Dict[str, int]): Number of calls per function name.
+    """
+
+    messages: int = 0
+    calls: Dict[str, int] = field(default_factory=dict)
+
+    def count(self, name: str) -> None:
+        """
+        Count one call of a function.
+
+        Args:
+            name (str): Name of the function.
+        """
+        self.calls[name] = self.calls.get(name, 0) + 1
+
+
+def _target(argument: Any) -> Any:
+    # Arguments arrive as byref() objects or pointers depending on the caller
+    target = getattr(argument, "_obj", None)
+    return target if target is not None else argument.contents
+
+
+def _setRect(rect: RECT, value: Rect) -> None:
+    rect.left, rect.top, rect.right, rect.bottom = value
+
+
+class Win32Simulator:
+    """
+    Simulated Win32 layer backing the native_api stubs.
+
+    Attributes:
+        monitor_rect (Rect): Rectangle of the single simulated monitor.
+        dpi (int): DPI reported for every window.
+        windows (Dict[int, SimulatedWindow]): Simulated windows by handle.
+        stats (SimulatorStats): Counters of the messages and Win32 calls.
+    """
+
+    MONITOR = 1
+
+    def __init__(self, monitor_rect: Rect = (0, 0, 1920, 1080), dpi: int = 96) -> None:
+        """
+        Initialize the simulator.
+
+        Args:
+            monitor_rect (Rect): Rectangle of the simulated monitor.
+            dpi (int): DPI reported for every window.
+        """
+        self.monitor_rect = monitor_rect
+        self.dpi = dpi
+        self.windows: Dict[int, SimulatedWindow] = {}
+        self.stats = SimulatorStats()
+
+    def __enter__(self) -> "Win32Simulator":
+        self.install()
+        return self
+
+    def __exit__(self, *exc_info: Any) -> None:
+        self.uninstall()
+
+    def _implementations(self) -> Dict[Tuple[str, str], Any]:
+        return {
+            ("user32", "GetDpiForWindow"): self._getDpiForWindow,
+            ("user32", "GetSystemMetricsForDpi"): self._getSystemMetricsForDpi,
+            ("user32", "IsZoomed"): self._isZoomed,
+            ("user32", "GetWindowLongW"): self._getWindowLong,
+            ("user32", "SetWindowLongW"): self._setWindowLong,
+            ("user32", "SetWindowPos"): self._setWindowPos,
+            ("user32", "GetWindowPlacement"): self._getWindowPlacement,
+            ("user32", "GetWindowRect"): self._getWindowRect,
+            ("user32", "MonitorFromWindow"): self._monitorFromWindow,
+            ("user32", "GetMonitorInfoW"): self._getMonitorInfo,
+            ("user32", "ReleaseCapture"): self._succeed("ReleaseCapture"),
+            ("user32", "SendMessageW"): self._succeed("SendMessageW"),
+            ("dwmapi", "DwmExtendFrameIntoClientArea"): self._succeed(
+                "DwmExtendFrameIntoClientArea"
+            ),
+            ("dwmapi", "DwmSetWindowAttribute"): self._succeed("DwmSetWindowAttribute"),
+        }
+
+    def install(self) -> None:
+        """Install the simulator as the implementation of the Win32 stubs."""
+        if native_api.IS_WINDOWS:
+            raise RuntimeError("The Win32 simulator cannot replace real Win32")
+        for (library, name), implementation in self._implementations().items():
+            native_api.stub_loader.implement(library, name, implementation)
+
+    def uninstall(self) -> None:
+        """Restore the default stub implementations."""
+        for library, name in self._implementations():
+            native_api.stub_loader.implement(library, name, None)
+
+    # Windows
+
+    def addWindow(self, widget: QWidget, rect: Optional[Rect] = None) -> int:
+        """
+        Register a top-level window with the simulator.
+
+        Args:
+            widget (QWidget): The window to register.
+            rect (Optional[Rect]): Its native rectangle. Defaults to the
+                widget's frame geometry in physical pixels.
+
+        Returns:
+            int: The native handle of the window.
+        """
+        hWnd = int(widget.winId())
+        if rect is None:
+            r = widget.devicePixelRatioF()
+            g = widget.frameGeometry()
+            rect = (
+                round(g.left() * r),
+                round(g.top() * r),
+                round((g.left() + g.width()) * r),
+                round((g.top() + g.height()) * r),
+            )
+        self.windows[hWnd] = SimulatedWindow(rect=rect, restore_rect=rect)
+        return hWnd
+
+    def window(self, widget: QWidget) -> SimulatedWindow:
+        """
+        Get the simulated state of a registered window.
+
+        Args:
+            widget (QWidget): The registered window.
+
+        Returns:
+            SimulatedWindow: Its simulated native state.
+        """
+        return self.windows[int(widget.winId())]
+
+    # Messages
+
+    def message(
+        self, hWnd: int, message_id: int, wParam: int = 0, lParam: int = 0
+    ) -> MSG:
+        """
+        Build a native message.
+
+        Args:
+            hWnd (int): The native handle of the receiving window.
+            message_id (int): The message id.
+            wParam (int): The wParam of the message.
+            lParam (int): The lParam of the message.
+
+        Returns:
+            MSG: The message structure.
+        """
+        return MSG(hWnd, message_id, wParam, lParam)
+
+    def send(
+        self, widget: QWidget, message_id: int, wParam: int = 0, lParam: int = 0
+    ) -> Tuple[bool, int]:
+        """
+        Deliver a message to a window's ``nativeEvent``.
+
+        Args:
+            widget (QWidget): The receiving window.
+            message_id (int): The message id.
+            wParam (int): The wParam of the message.
+            lParam (int): The lParam of the message.
+
+        Returns:
+            Tuple[bool, int]: The result returned by ``nativeEvent``.
+        """
+        self.stats.messages += 1
+        msg = self.message(int(widget.winId()), message_id, wParam, lParam)
+        return widget.nativeEvent(EVENT_TYPE, addressof(msg))
+
+    # Message streams
+
+    def hitTestSweep(
+        self, widget: QWidget, points: Iterable[Tuple[int, int]]
+    ) -> List[Tuple[bool, int]]:
+        """
+        Send a ``WM_NCHITTEST`` for each point, as during a mouse sweep.
+
+        Args:
+            widget (QWidget): The receiving window.
+            points (Iterable[Tuple[int, int]]): Cursor positions relative to
+                the window in logical coordinates.
+
+        Returns:
+            List[Tuple[bool, int]]: The hit-test results.
+        """
+        r = widget.devicePixelRatioF()
+        ox, oy = widget.x(), widget.y()
+        return [
+            self.send(widget, WM_NCHITTEST, 0, _packPoint(x + ox, y + oy, r))
+            for x, y in points
+        ]
+
+    def move(self, widget: QWidget, x: int, y: int) -> None:
+        """
+        Move a window, sending the messages of one step of a drag.
+
+        Args:
+            widget (QWidget): The window to move.
+            x (int): New left edge in physical screen coordinates.
+            y (int): New top edge in physical screen coordinates.
+        """
+        window = self.window(widget)
+        left, top, right, bottom = window.rect
+        window.rect = (x, y, x + right - left, y + bottom - top)
+        self._sendWindowPosChanged(widget, window.rect)
+        self.send(widget, WM_MOVE, 0, _packPoint(x, y, 1.0))
+
+    def maximize(self, widget: QWidget) -> None:
+        """
+        Maximize a window, sending the messages Windows sends for it.
+
+        Args:
+            widget (QWidget): The window to maximize.
+        """
+        window = self.window(widget)
+        if not window.maximized:
+            window.restore_rect = window.rect
+        window.maximized = True
+        self._resize(widget, self.monitor_rect, SIZE_MAXIMIZED)
+
+    def restore(self, widget: QWidget) -> None:
+        """
+        Restore a maximized window, sending the messages Windows sends for it.
+
+        Args:
+            widget (QWidget): The window to restore.
+        """
+        window = self.window(widget)
+        window.maximized = False
+        self._resize(widget, window.restore_rect, SIZE_RESTORED)
+
+    def setStyle(self, widget: QWidget, style: int) -> None:
+        """
+        Change the style of a window and send ``WM_STYLECHANGED``.
+
+        Args:
+            widget (QWidget): The window to change.
+            style (int): The new GWL_STYLE value.
+        """
+        window = self.window(widget)
+        styles = STYLESTRUCT(window.style, style)
+        window.style = style
+        self.send(widget, WM_STYLECHANGED, GWL_STYLE, addressof(styles))
+
+    def _resize(self, widget: QWidget, rect: Rect, size_type: int) -> None:
+        window = self.window(widget)
+        params = NCCALCSIZE_PARAMS()
+        _setRect(params.rgrc[0], rect)
+        window.rect = rect
+        self.send(widget, WM_NCCALCSIZE, 1, addressof(params))
+        self._sendWindowPosChanged(widget, rect)
+        left, top, right, bottom = rect
+        size = ((bottom - top) & 0xFFFF) << 16 | ((right - left) & 0xFFFF)
+        self.send(widget, WM_SIZE, size_type, size)
+
+    def _sendWindowPosChanged(self, widget: QWidget, rect: Rect) -> None:
+        left, top, right, bottom = rect
+        pos = PWINDOWPOS(
+            int(widget.winId()), None, left, top, right - left, bottom - top, 0
+        )
+        self.send(widget, WM_WINDOWPOSCHANGED, 0, addressof(pos))
+
+    # Win32 implementations
+
+    def _succeed(self, name: str) -> Any:
+        def implementation(*args: Any) -> int:
+            self.stats.count(name)
+            # DWM functions return S_OK, user32 functions TRUE
+            return 0 if name.startswith("Dwm") else 1
+
+        return implementation
+
+    def _getDpiForWindow(self, hWnd: int) -> int:
+        self.stats.count("GetDpiForWindow")
+        return self.dpi
+
+    def _getSystemMetricsForDpi(self, index: int, dpi: int) -> int:
+        self.stats.count("GetSystemMetricsForDpi")
+        return _SYSTEM_METRICS.get(index, 0) * dpi // 96
+
+    def _isZoomed(self, hWnd: int) -> int:
+        self.stats.count("IsZoomed")
+        window = self.windows.get(hWnd)
+        return int(window is not None and window.maximized)
+
+    def _getWindowLong(self, hWnd: int, index: int) -> int:
+        self.stats.count("GetWindowLongW")
+        window = self.windows.get(hWnd)
+        return window.style if window is not None and index == GWL_STYLE else 0
+
+    def _setWindowLong(self, hWnd: int, index: int, value: int) -> int:
+        self.stats.count("SetWindowLongW")
+        window = self.windows.get(hWnd)
+        if window is None or index != GWL_STYLE:
+            return 0
+        previous, window.style = window.style, value
+        return previous
+
+    def _setWindowPos(self, hWnd: int, *args: Any) -> int:
+        self.stats.count("SetWindowPos")
+        return int(hWnd in self.windows)
+
+    def _getWindowPlacement(self, hWnd: int, placement: Any) -> int:
+        self.stats.count("GetWindowPlacement")
+        window = self.windows.get(hWnd)
+        if window is None:
+            return 0
+        placement = _target(placement)
+        placement.showCmd = SW_MAXIMIZE if window.maximized else SW_SHOWNORMAL
+        _setRect(placement.rcNormalPosition, window.restore_rect)
+        return 1
+
+    def _getWindowRect(self, hWnd: int, rect: Any) -> int:
+        self.stats.count("GetWindowRect")
+        window = self.windows.get(hWnd)
+        if window is None:
+            return 0
+        _setRect(_target(rect), window.rect)
+        return 1
+
+    def _monitorFromWindow(self, hWnd: int, flags: int) -> int:
+        self.stats.count("MonitorFromWindow")
+        return self.MONITOR
+
+    def _getMonitorInfo(self, monitor: int, info: Any) -> int:
+        self.stats.count("GetMonitorInfoW")
+        if monitor != self.MONITOR:
+            return 0
+        info = _target(info)
+        _setRect(info.rcMonitor, self.monitor_rect)
+        _setRect(info.rcWork, self.monitor_rect)
+        return 1
+
+
+def _packPoint(x: float, y: float, ratio: float) -> int:
+    # MAKELPARAM of physical coordinates, keeping negative values 16-bit signed
+    px = int(round(x * ratio)) & 0xFFFF
+    py = int(round(y * ratio)) & 0xFFFF
+    return ctypes.c_ssize_t(py << 16 | px).value
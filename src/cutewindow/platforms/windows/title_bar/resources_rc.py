@@ -1,346 +0,0 @@
-# Resource object code (Python 3)
-# Created by: object code
-# Created by: The Resource Compiler for Qt version 6.4.2
-# WARNING! All changes made in this file will be lost!
-
-from PySide6 import QtCore
-
-qt_resource_data = b"\
-\x00\x00\x00\xb9\
-\x89\
-PNG\x0d\x0a\x1a\x0a\x00\x00\x00\x0dIHDR\x00\
-\x00\x00H\x00\x00\x00H\x08\x06\x00\x00\x00U\xed\xb3G\
-\x00\x00\x00\x09pHYs\x00\x00!8\x00\x00!8\
-\x01E\x961`\x00\x00\x00\x01sRGB\x00\xae\xce\
-\x1c\xe9\x00\x00\x00\x04gAMA\x00\x00\xb1\x8f\x0b\xfc\
-a\x05\x00\x00\x00NIDATx\x01\xed\xd0A\x0d\
-\x800\x14\x05\xb0\xf7\x13\x14M\x01(\x07\x05\xb34\x14\
-pc!a\xad\x84&\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x8b\xaaL\xd0{?\xf3\x81\xd6\xda\x91\x97m\x99`\x8c\
-\xb1\xe7'\xa6\x04U\xd5\x15\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x1e\xdd\xa3G\x08\x0a\xf1\xa2\xd8\xc6\x00\x00\x00\x00\
-IEND\xaeB`\x82\
-\x00\x00\x01\x81\
-\x89\
-PNG\x0d\x0a\x1a\x0a\x00\x00\x00\x0dIHDR\x00\
-\x00\x00H\x00\x00\x00H\x08\x06\x00\x00\x00U\xed\xb3G\
-\x00\x00\x00\x09pHYs\x00\x00!8\x00\x00!8\
-\x01E\x961`\x00\x00\x00\x01sRGB\x00\xae\xce\
-\x1c\xe9\x00\x00\x00\x04gAMA\x00\x00\xb1\x8f\x0b\xfc\
-a\x05\x00\x00\x01\x16IDATx\x01\xed\xda\xc1m\
-\x840\x10\x85\xe1\x17D\x01\x94@\x09\xe1\xc0=)%\
-\x1d\xa4\x83\x94\x90\x12\x92R\xdc\x00\x22\x1ddK\xd8\x0a\
-\xd8\x1d\x1a\xd8w\xf1\x98\xdd\xd5\xffI\xc87$\x9e<\
-6\x1a[\x02\x00\x00\x00\x00\x00\x00\x00\x00w\xe1E\x8d\
-\xac\xeb:n\xdb\xf6\xa6$]\xd7\x95i\x9aN\xaa\xac\
-W;c<?J\x12\xe1\x7f\xc4\xf0\xab\xca:\xe1\xa6\
-f3(\xa6\x7fQBI/\xcbrQ\x22f\x90A\
-@F\xf5\x12\x8b\xddj\x88\x05\xf3SI\xe2\xdde\x9e\
-\xe7\xa2F2\xd6\xa0!\x9e/%\x89\xed|\x1f\x8a\x1a\
-\xc9^\xa4O\xaag\xd4\x01R\x03\xda\xffMj\x95C\
-\xecV\xff: $\x16i\x83\x80\x0c\x022\x08\xc8 \
- \x83\x80\x0c\x022\x08\xc8  \x83\x80\x0c\x022\x08\
-\xc8  \x83\x80\x8c\x96\xc7>)\xa2\xa5\xf2\xbe\x8f}\
-\xdf\xff)\xc1\xc3\x07\x94\xdd~\xa5\xc4\x8c\xd4\x19\x14\xfd\
-\xe3\xd7h\xe2\xab\x86(\xa5A\x07\xc8.\xb1\xef\xf80\
-=2J\xccH\xb9\xdd\xb1\xdf\xe4P\x9es\x1cc\x9f\
-\x05\x00\x00\x00\x00\x00\x00\x00\xc0\x93\xb9\x02@\x16:\xe6\
-y\x9d^\x0a\x00\x00\x00\x00IEND\xaeB`\x82\
-\
-\x00\x00\x00\xb1\
-\x89\
-PNG\x0d\x0a\x1a\x0a\x00\x00\x00\x0dIHDR\x00\
-\x00\x00\x18\x00\x00\x00\x18\x08\x06\x00\x00\x00\xe0w=\xf8\
-\x00\x00\x00\x09pHYs\x00\x00\x0b\x13\x00\x00\x0b\x13\
-\x01\x00\x9a\x9c\x18\x00\x00\x00\x01sRGB\x00\xae\xce\
-\x1c\xe9\x00\x00\x00\x04gAMA\x00\x00\xb1\x8f\x0b\xfc\
-a\x05\x00\x00\x00FIDATx\x01\xed\xd3\xc1\x09\
-\x00 \x0c\x03\xc0T\x1c\xc8\x8e\xe6\x84nP\xdc\xa8n\
-\xa0E\x11\x14r\xdf\x94\xe6\x15\x80\xe8y2\x0b\xcd\xac\
-a\xf5@\xa4\xabj\xc5\x8eH\xc1\xea&\xe12\x16\xb0\
-\xe0\x5c\x9e\x85\xee^\x22[ \xfa\xdc\x00;\xfc\x11\xbc\
-\x05~A\xcd\x00\x00\x00\x00IEND\xaeB`\x82\
-\
-\x00\x00\x00\xff\
-\x89\
-PNG\x0d\x0a\x1a\x0a\x00\x00\x00\x0dIHDR\x00\
-\x00\x000\x00\x00\x000\x08\x06\x00\x00\x00W\x02\xf9\x87\
-\x00\x00\x00\x09pHYs\x00\x00\x16%\x00\x00\x16%\
-\x01IR$\xf0\x00\x00\x00\x01sRGB\x00\xae\xce\
-\x1c\xe9\x00\x00\x00\x04gAMA\x00\x00\xb1\x8f\x0b\xfc\
-a\x05\x00\x00\x00\x94IDATx\x01\xed\xd7A\x0d\
-\x03!\x14E\xd1GS\x01#\xa1\x16\x08\x02:R*\
-e\xaa\xa0\x16\xc6J\x05\x10\xac\x8c\x02(]\xd4\xc0\x87\
-\xe4\xa7\x99{\x12\xc2\xfa\xb2\xe2I\x00\x00\x00\x80\x97 \
-\x83R\xcaRk}i\x9ewJi\x97\xc1U6K\
-?\x0f\xcd\xb5\xcb\xc0\x1a\xf0\xf3\xec/\xb7i@\xce\xb9\
-i\xc0E\x7f\x8e\x00o\x04x#\xc0\x1b\x01\xde\x08\xf0\
-F\x807\x02\xbc\x0d\xed\x81\x10\xc2\xbd\xff\xe779\x1a\
-\x0ah\xad\xad\xfdZ\xe5\xc8\xb4\x89\xbf\xfa.\xbei\x9e\
-#\xc6x\x08\x00\x00\x00\xe7\xf2\x01\x8d4\x19\xe7\x17&\
-C\xfa\x00\x00\x00\x00IEND\xaeB`\x82\
-\x00\x00\x01`\
-\x89\
-PNG\x0d\x0a\x1a\x0a\x00\x00\x00\x0dIHDR\x00\
-\x00\x000\x00\x00\x000\x08\x06\x00\x00\x00W\x02\xf9\x87\
-\x00\x00\x00\x09pHYs\x00\x00\x16%\x00\x00\x16%\
-\x01IR$\xf0\x00\x00\x00\x01sRGB\x00\xae\xce\
-\x1c\xe9\x00\x00\x00\x04gAMA\x00\x00\xb1\x8f\x0b\xfc\
-a\x05\x00\x00\x00\xf5IDATx\x01\xed\xd7\xed\x0d\
-\x83 \x10\x06\xe0\xa3+\xe9 \xdd\xa0v\xb2\xda\x09\x5c\
-D\xe3FR\xce@\xd2\x1f\xc4 \x1cr\x89\xef\xf3\xcb\
-4)w\xafA>\x88\x00\x00\x00\x00\xe0~\xe6y~\
-\x92\x90u]\xb3\xc7zP\x06n\xde\x183-\xcb\xf2\
-\xa1B<\xc6\xb6m\x93\xe4\x0bI\xe2\x0a\x8e\xae\xb8-\
-\x09\xc1\xff\xe51x,j\xa1$D\xf3\xe6\x83\x9c\x10\
-j\x9a\x0f\xce\x84P\xd7|\x90\x12Bm\xf3\xc1Q\x08\
-\xf5\xcd\x07\xb1\x105\x9b7T\x017\xea\xf6\x89\x97{\
-\x1c\xfdO\x83\xb5\xf6\xdb\xf7\xfd@\xc2\xaa\x04`\x7f!\
-\xa8V\xf3,k'N\xe1\x9a\xb7\xb1g\xf1:T\x81\
-\x9f\xff\xfb\xb4\xd9\x8b\xf8\xe9\xd4u\xdd\x9b\xb4\x8b}\xb0\
-\x12\xc7\x8eK\x1c\xad6\xeaC\xa4,\x95jC\x9cY\
-\xe7\xd5\x85\xc8\xd9\xa4\xd4\x84(\xd9a\x9b\x87\x908\x1e\
-4\x0b\xc1\xd7?\xa9\xb3M\x08Qr/\xce-,V\
-\xf0\xf2\xfb0\x00\x00\x00\x00\xe8\xf0\x03\x94yQH\xb7\
-37\x0c\x00\x00\x00\x00IEND\xaeB`\x82\
-\x00\x00\x01\xbf\
-\x89\
-PNG\x0d\x0a\x1a\x0a\x00\x00\x00\x0dIHDR\x00\
-\x00\x00H\x00\x00\x00H\x08\x06\x00\x00\x00U\xed\xb3G\
-\x00\x00\x00\x09pHYs\x00\x00!8\x00\x00!8\
-\x01E\x961`\x00\x00\x00\x01sRGB\x00\xae\xce\
-\x1c\xe9\x00\x00\x00\x04gAMA\x00\x00\xb1\x8f\x0b\xfc\
-a\x05\x00\x00\x01TIDATx\x01\xed\xda\xcdm\
-\xc2@\x10\x86\xe1qh \xa5\xe4\xe4s\xd2A:\x09\
-\x1d\x84\x12\xd2J*H\xce\xb6,\xa7\x14\xee\x96\xad\xec\
-'\x91\x0bB\x99\xfc\xec\xce\xda\xe8}$\x84\xc4\x81a\
-_\x84am\xcc\x00\x00\x00\x00\x00\x00\x00\x00\xd8\xb0q\
-\x1c\x9f\xba\xae\xbb\xb3 \x9a\x95f>[\x017\x96\x99\
-^\xe8\xb2,/\xbb\xdd\xee-\x22\x92fhV\x9ay\
-\x18\x86ao\x99e\x0f4M\xd3k\xba;\xa6\xdbm\
-\xe9H_q4K3\xe7y~\xb7\xcc\x1a+\xe0\xc2\
-\x0b\x7fh\xdb\xf6\xc32\x8a\x98!E\x02I\xc9\x05D\
-\xc5\x91b\x81\xa4\xc4B\x22\xe3H\xd1@\x92sA\xd1\
-q\xa4x \xc9\xb1\xb0\x1aq$$\x90\xfcg\x81\xb5\
-\xe2HX \xf9\xcbBk\xc6\x91\xd0@\xf2\x9b\x05\xd7\
-\x8e#\xe1\x81\xe4'\x0b_C\x1c\xa9\x12H\xbe\x0b\xb0\
-\x968R-\x90\x5c\x0a\xa1\xc7\xd7\x12G\xaa\x06\x92\xf3\
-H\xa7\x87W\x11G\xaa\x07\x92\xb3H\xb2\x8a8\x92}\
-7\x7fm\xf8\x8898H;\xf8\x9aw\xf0C\xd1\xc1\
-V\xc3\xc1f\xd5\xc1\xe9\x0e\x07'\xcc\x1c\x9crup\
-\xd2\xde\xc1e\x1f\x07\x17\x0e\x1d\xd9\x03E\xbe\xbb\x11\xb3\
-\xb2\xef\xe6\x9b\xa6\xb9\xb7\xa0\xe3\x83\x9e\xfb\xb4\x7f;j\
-f\x9a\xfdh[\xd0\xf7\xfd!\xfa\xef/i\xe6\xde\x00\
-\x00\x00\x00\x00\x00\x00\x00\xd8\xb0O\x8f,\xf8F/Z\
-+\xa3\x00\x00\x00\x00IEND\xaeB`\x82\
-\x00\x00\x00\x96\
-\x89\
-PNG\x0d\x0a\x1a\x0a\x00\x00\x00\x0dIHDR\x00\
-\x00\x00\x18\x00\x00\x00\x18\x08\x06\x00\x00\x00\xe0w=\xf8\
-\x00\x00\x00\x09pHYs\x00\x00\x0b\x13\x00\x00\x0b\x13\
-\x01\x00\x9a\x9c\x18\x00\x00\x00\x01sRGB\x00\xae\xce\
-\x1c\xe9\x00\x00\x00\x04gAMA\x00\x00\xb1\x8f\x0b\xfc\
-a\x05\x00\x00\x00+IDATx\x01\xed\xc91\x01\
-\x00 \x0c\x03\xc1`)\x0eP\x8e\x83h\xc2A\xdb\xb1\
-\xc3\xdfz\x12\x00\xb4N\x95I\x9e\x06l_\x01\xc0b\
-\x1f'\x8a\x04\x02\x7f\x08\x84\x18\x00\x00\x00\x00IEN\
-D\xaeB`\x82\
-\x00\x00\x00\x9f\
-\x89\
-PNG\x0d\x0a\x1a\x0a\x00\x00\x00\x0dIHDR\x00\
-\x00\x000\x00\x00\x000\x08\x06\x00\x00\x00W\x02\xf9\x87\
-\x00\x00\x00\x09pHYs\x00\x00\x16%\x00\x00\x16%\
-\x01IR$\xf0\x00\x00\x00\x01sRGB\x00\xae\xce\
-\x1c\xe9\x00\x00\x00\x04gAMA\x00\x00\xb1\x8f\x0b\xfc\
-a\x05\x00\x00\x004IDATx\x01\xed\xc0\x01\x09\
-\x00!\x10\x04\xc0\xfd\x8ft\x0dLn\x83\xcbd\x07\x11\
-D\x98I\x00\x00\x00\x00n\xf8\xb2\xa9\xbbg\x0e\xaa\xaa\
-\x91\x0d\x7f\x00\x00\x00\x00\xe0A\x0b\x9c\xcf\x04\x04\x01\xad\
-\x9c\x9d\x00\x00\x00\x00IEND\xaeB`\x82\
-\x00\x00\x016\
-\x89\
-PNG\x0d\x0a\x1a\x0a\x00\x00\x00\x0dIHDR\x00\
-\x00\x000\x00\x00\x000\x08\x06\x00\x00\x00W\x02\xf9\x87\
-\x00\x00\x00\x09pHYs\x00\x00\x16%\x00\x00\x16%\
-\x01IR$\xf0\x00\x00\x00\x01sRGB\x00\xae\xce\
-\x1c\xe9\x00\x00\x00\x04gAMA\x00\x00\xb1\x8f\x0b\xfc\
-a\x05\x00\x00\x00\xcbIDATx\x01\xed\xd7\xc1\x0d\
-\xc20\x10\x04\xc0\xb5E\x01)!\x94\x10\xa5\x00R\x0a\
-\xa5\xa4\x03D\x07i\x85\x02\xa2\x94\x00%\xa4\x02\x9b{\
-\x18\x1e\xfc|>\xe9\x14\xb4#Y~\xe5\xb1\xf1Z:\
-\x03DDDDD^\x02\x0cl\xdb\xd6\xa5\x94n\xd0\
-{\x8c\xe3\xb8@\xe1\x04\x1b\x9d\xac+\xda,P0\x09\
-0\x0c\xc3\x0b\xca\xd3\x5c\xd75\xa3A\xc4\xc1\xa9N\xc0\
-\xb3\xf3\xbf\xb4\x15\xfat~/\xabF_\xf6\x05\x06Z\
-\xef\xc0]\xfe\xe4\x5c\xf3\x81t\xfe\x09C\x87\xbf\x03\x0c\
-\xe0\x8d\x01\xbc1\x807\x06\xf0f5N\xab\xc5\x18\xcf\
-\xa8\x1fG\xbe\xdc\x03\x94Q\x5c\xad)@\x08\xe1\x22\xb3\
-\xcd\x8c:\x1d\x0c5\x05\xc89O\xb2Mp\xa4~\x13\
-\xcb\x9b\xa0\x87\xde.\xd5Q\xf7\x9e\x88\x88\x88\x88\xfe\xc4\
-\x1bP\xba,e\x9cx\xea\x93\x00\x00\x00\x00IEN\
-D\xaeB`\x82\
-\x00\x00\x01?\
-\x89\
-PNG\x0d\x0a\x1a\x0a\x00\x00\x00\x0dIHDR\x00\
-\x00\x00H\x00\x00\x00H\x08\x06\x00\x00\x00U\xed\xb3G\
-\x00\x00\x00\x09pHYs\x00\x00!8\x00\x00!8\
-\x01E\x961`\x00\x00\x00\x01sRGB\x00\xae\xce\
-\x1c\xe9\x00\x00\x00\x04gAMA\x00\x00\xb1\x8f\x0b\xfc\
-a\x05\x00\x00\x00\xd4IDATx\x01\xed\xda\xb1M\
-\xc50\x14\x86\xd1K\xc4\x00o\x04F\xc0E\x06`\x03\
-V`\x22F\x80Q\xde\x02QV`\x847A\xc04\
-\x94\xfc\x8d\x1d\x81t\x8e\x14\xa5\xf6g\xbb\xba\xae\x02\x00\
-\x00\x00\x00\x00\xfe\x84\xbb\x1al\xdf\xf7\xcbq\x1c\xcfu\
-\xb2eY\xae\xad\xb5\x8f\x1a\xec\xbe\xc6\xbb\xf4\xef\xadN\
-\xd67\xe5\xa5\xff\xdek\xb0\xa5\xf8\xd5\x8c\x13\xf4\xa3\xef\
-\xea\xd3\xba\xae\xd7\x9ah\xdb\xb6\xcf\x9a\xc8\x09\x0a\x04\x0a\
-\x04\x0a\x04\x0a\x04\x0a\x04\x0a\x04\x0a\x04\x0a\x04\x0a\x04\x0a\
-\x04\x0a\x04\x0a\x04\x0a\x04\x0a\x04\x0a\x04\x0a\x04\x0a\x04\x0a\
-\x04\x0a\x04\x0a\x04\x0a\x04\x0a\x04\x0a\xa6\xce\xc5\xfa8\xf8\
-\xb1\x8f\xa2k\xa6>{\xab\x99\xa6\x06\xea^g/`\
-6W,\x18\xfe\xba\xe3[\xbfV\x0fu\xbe[k\xed\
-V\x00\x00\x00\x00\x00\xf0O}\x01g\xf7#\x15G\xac\
-\x5c\xeb\x00\x00\x00\x00IEND\xaeB`\x82\
-\x00\x00\x00\xe3\
-\x89\
-PNG\x0d\x0a\x1a\x0a\x00\x00\x00\x0dIHDR\x00\
-\x00\x00\x18\x00\x00\x00\x18\x08\x06\x00\x00\x00\xe0w=\xf8\
-\x00\x00\x00\x09pHYs\x00\x00\x0b\x13\x00\x00\x0b\x13\
-\x01\x00\x9a\x9c\x18\x00\x00\x00\x01sRGB\x00\xae\xce\
-\x1c\xe9\x00\x00\x00\x04gAMA\x00\x00\xb1\x8f\x0b\xfc\
-a\x05\x00\x00\x00xIDATx\x01\xed\x93A\x0d\
-\x800\x0cE;\x82\x00$\x80\x84m\x0a\x90\x82\x04\x94\
-!\x01\x05\xdbp\x00\x0e\x900\xca\x8d\x03\xfb;5\x81\
-\xa4\xef\xfa\x9a\xfe\x1e\xfa\x89\x14\xe5\xf3\x98\xda@J\xa9\
-\xcb9/\xc5\x05\xc6l\xd6\xda\x99\xa4\x881\xae\xc8\xb7\
-H\x86\x10\xf6\x92\xe3\xcb\x0f\xe7\xdcH\x15`\x00Z\x82\
-\xc2\x9f4$\x8c\x06\xc8\x07\xf0#L\xd0#\xc9\x9fr\
-\xdeEzs\x5c\xbe\xde{?\x90\xa2\xfc\x9f\x0b,\xab\
-\x1d\xa2V\xe0@\xb1\x00\x00\x00\x00IEND\xaeB\
-`\x82\
-\x00\x00\x00\xf5\
-\x89\
-PNG\x0d\x0a\x1a\x0a\x00\x00\x00\x0dIHDR\x00\
-\x00\x00\x18\x00\x00\x00\x18\x08\x06\x00\x00\x00\xe0w=\xf8\
-\x00\x00\x00\x09pHYs\x00\x00\x0b\x13\x00\x00\x0b\x13\
-\x01\x00\x9a\x9c\x18\x00\x00\x00\x01sRGB\x00\xae\xce\
-\x1c\xe9\x00\x00\x00\x04gAMA\x00\x00\xb1\x8f\x0b\xfc\
-a\x05\x00\x00\x00\x8aIDATx\x01\xed\x94\xc1\x0d\
-\x80 \x0cE['`\x04V`\x14Gp2Fp\
-\x14Vp\x047@J8\x10\x22\xb5J\x88\x97\xbe\x8b\
-\x91|\xde\x0f\x10\x00P\x94\xa9\x84\x10\xcchf\xe1&\
-\xc6\x18\xf7\xf4\xb5L\xc6\x96\x8cy]\xe0\x9c;\x11q\
-K\x02\x7fWR\xe4\x9e2\x94\xedy\x10\x1ehDG\
-o\xecsA+\xa4\x7f\xa9\x5c\x5cP\x97\xe4IB9\
-\xb1\xc0d\xfe\xdf\xa2\xa9\x87\xcc\x89\xa4%\xc8\xc8\xf3E\
-\xe3\x04U\xc9\xca\xdd\x05n\x05\xc3O\x85\xa2\x8cs\x01\
-\xcf>\x8b\x8e\x9b\xd7\x04O\x00\x00\x00\x00IEND\
-\xaeB`\x82\
-"
-
-qt_resource_name = b"\
-\x00\x05\
-\x00o\xa6S\
-\x00i\
-\x00c\x00o\x00n\x00s\
-\x00\x09\
-\x0b(\xce\x82\
-\x00t\
-\x00i\x00t\x00l\x00e\x00-\x00b\x00a\x00r\
-\x00\x0f\
-\x09\xa2\xa6g\
-\x00m\
-\x00i\x00n\x00i\x00m\x00i\x00z\x00e\x00@\x003\x00x\x00.\x00p\x00n\x00g\
-\x00\x0e\
-\x0a\xfd\x98G\
-\x00r\
-\x00e\x00s\x00t\x00o\x00r\x00e\x00@\x003\x00x\x00.\x00p\x00n\x00g\
-\x00\x0c\
-\x0fy\xb7\xc7\
-\x00m\
-\x00a\x00x\x00i\x00m\x00i\x00z\x00e\x00.\x00p\x00n\x00g\
-\x00\x0f\
-\x0d\x92\xb8G\
-\x00m\
-\x00a\x00x\x00i\x00m\x00i\x00z\x00e\x00@\x002\x00x\x00.\x00p\x00n\x00g\
-\x00\x0c\
-\x0e\xdd\x84g\
-\x00c\
-\x00l\x00o\x00s\x00e\x00@\x002\x00x\x00.\x00p\x00n\x00g\
-\x00\x0c\
-\x0e\xed\x84g\
-\x00c\
-\x00l\x00o\x00s\x00e\x00@\x003\x00x\x00.\x00p\x00n\x00g\
-\x00\x0c\
-\x0f\x88\xf7\xc7\
-\x00m\
-\x00i\x00n\x00i\x00m\x00i\x00z\x00e\x00.\x00p\x00n\x00g\
-\x00\x0f\
-\x09\x92\xa6g\
-\x00m\
-\x00i\x00n\x00i\x00m\x00i\x00z\x00e\x00@\x002\x00x\x00.\x00p\x00n\x00g\
-\x00\x0e\
-\x0a\xcd\x98G\
-\x00r\
-\x00e\x00s\x00t\x00o\x00r\x00e\x00@\x002\x00x\x00.\x00p\x00n\x00g\
-\x00\x0f\
-\x0d\xa2\xb8G\
-\x00m\
-\x00a\x00x\x00i\x00m\x00i\x00z\x00e\x00@\x003\x00x\x00.\x00p\x00n\x00g\
-\x00\x0b\
-\x06y\xc2'\
-\x00r\
-\x00e\x00s\x00t\x00o\x00r\x00e\x00.\x00p\x00n\x00g\
-\x00\x09\
-\x06\x98\x83'\
-\x00c\
-\x00l\x00o\x00s\x00e\x00.\x00p\x00n\x00g\
-"
-
-qt_resource_struct = b"\
-\x00\x00\x00\x00\x00\x02\x00\x00\x00\x01\x00\x00\x00\x01\
-\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x02\x00\x00\x00\x01\x00\x00\x00\x02\
-\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x10\x00\x02\x00\x00\x00\x0c\x00\x00\x00\x03\
-\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x01t\x00\x00\x00\x00\x00\x01\x00\x00\x0a\xdb\
-\x00\x00\x01\x85\x16\xd0\x0ct\
-\x00\x00\x01\x90\x00\x00\x00\x00\x00\x01\x00\x00\x0b\xc2\
-\x00\x00\x01\x85\x16\xd0\x0c5\
-\x00\x00\x01\x0a\x00\x00\x00\x00\x00\x01\x00\x00\x07\xbb\
-\x00\x00\x01\x85\x16\xd0\x0cf\
-\x00\x00\x00(\x00\x00\x00\x00\x00\x01\x00\x00\x00\x00\
-\x00\x00\x01\x85\x16\xd0\x0cm\
-\x00\x00\x01.\x00\x00\x00\x00\x00\x01\x00\x00\x08^\
-\x00\x00\x01\x85\x16\xd0\x0cz\
-\x00\x00\x00L\x00\x00\x00\x00\x00\x01\x00\x00\x00\xbd\
-\x00\x00\x01\x85\x16\xd0\x0c\x81\
-\x00\x00\x00\x8c\x00\x00\x00\x00\x00\x01\x00\x00\x02\xf7\
-\x00\x00\x01\x85\x16\xd0\x0cR\
-\x00\x00\x01P\x00\x00\x00\x00\x00\x01\x00\x00\x09\x98\
-\x00\x00\x01\x85\x16\xd0\x0cY\
-\x00\x00\x00\xb0\x00\x00\x00\x00\x00\x01\x00\x00\x03\xfa\
-\x00\x00\x01\x85\x16\xd0\x0c<\
-\x00\x00\x00\xce\x00\x00\x00\x00\x00\x01\x00\x00\x05^\
-\x00\x00\x01\x85\x16\xd0\x0cF\
-\x00\x00\x00n\x00\x00\x00\x00\x00\x01\x00\x00\x02B\
-\x00\x00\x01\x85\x16\xd0\x0cK\
-\x00\x00\x00\xec\x00\x00\x00\x00\x00\x01\x00\x00\x07!\
-\x00\x00\x01\x85\x16\xd0\x0c^\
-"
-
-
-def qInitResources():
-    QtCore.qRegisterResourceData(
-        0x03, qt_resource_struct, qt_resource_name, qt_resource_data
-    )
-
-
-def qCleanupResources():
-    QtCore.qUnregisterResourceData(
-        0x03, qt_resource_struct, qt_resource_name, qt_resource_data
-    )
-
-
-qInitResources()
@@ -1,77 +1,168 @@
-from ctypes import byref, cdll
+from ctypes import byref, c_int, sizeof
+from ctypes.wintypes import RECT
+from typing import Optional, Tuple
 
-import win32api
-import win32con
-import win32gui
 from PySide6.QtCore import QPoint
 from PySide6.QtWidgets import QWidget
 
-from cutewindow.platforms.windows.c_structures import MARGINS
+from cutewindow.platforms.windows.c_structures import (
+    MARGINS,
+    MONITORINFO,
+    WINDOWPLACEMENT,
+)
+from cutewindow.platforms.windows.constants import (
+    CS_DBLCLKS,
+    DWMWA_WINDOW_CORNER_PREFERENCE,
+    DWMWCP_DEFAULT,
+    DWMWCP_ROUND,
+    DWMWCP_ROUNDSMALL,
+    GWL_STYLE,
+    HTCAPTION,
+    MONITOR_DEFAULTTOPRIMARY,
+    SC_MOVE,
+    SW_MAXIMIZE,
+    WM_SYSCOMMAND,
+    WS_CAPTION,
+    WS_MAXIMIZEBOX,
+    WS_MINIMIZEBOX,
+    WS_SIZEBOX,
+    WS_THICKFRAME,
+)
+from cutewindow.platforms.windows.native_api import (
+    DwmExtendFrameIntoClientArea,
+    DwmSetWindowAttribute,
+    GetMonitorInfoW,
+    GetWindowLongW,
+    GetWindowPlacement,
+    GetWindowRect,
+    MonitorFromWindow,
+    ReleaseCapture,
+    SendMessageW,
+    SetWindowLongW,
+)
+from cutewindow.window_shape import RoundedCorners, WindowShape
+
+Rect = Tuple[int, int, int, int]
 
 
 def addShadowEffect(hWnd):
     hWnd = int(hWnd)
     margins = MARGINS(-1, -1, -1, -1)
-    dwmapi = cdll.LoadLibrary("dwmapi")
-    dwmapi.DwmExtendFrameIntoClientArea(hWnd, byref(margins))
+    DwmExtendFrameIntoClientArea(hWnd, byref(margins))
 
 
 def addWindowAnimation(hWnd):
     hWnd = int(hWnd)
-    style = win32gui.GetWindowLong(hWnd, win32con.GWL_STYLE)
-    win32gui.SetWindowLong(
+    style = GetWindowLongW(hWnd, GWL_STYLE)
+    SetWindowLongW(
         hWnd,
-        win32con.GWL_STYLE,
+        GWL_STYLE,
         style
-        | win32con.WS_MINIMIZEBOX
-        | win32con.WS_MAXIMIZEBOX
-        | win32con.WS_CAPTION
-        | win32con.CS_DBLCLKS
-        | win32con.WS_THICKFRAME,
+        | WS_MINIMIZEBOX
+        | WS_MAXIMIZEBOX
+        | WS_CAPTION
+        | CS_DBLCLKS
+        | WS_THICKFRAME,
     )
 
 
+def setWindowCornerPreference(hWnd, preference: int) -> bool:
+    value = c_int(preference)
+    result = DwmSetWindowAttribute(
+        int(hWnd), DWMWA_WINDOW_CORNER_PREFERENCE, byref(value), sizeof(value)
+    )
+    # Fails before Windows 11, which has no corner preference
+    return result == 0
+
+
+def applyDwmWindowShape(hWnd, shape: Optional[WindowShape]) -> bool:
+    """
+    Round the corners of a window through DWM, keeping its shadow.
+
+    DWM offers a small (4 pixel) and a regular (8 pixel) corner radius on
+    Windows 11. Other shapes and radii need a mask.
+
+    Args:
+        hWnd: The native window handle.
+        shape (Optional[WindowShape]): The shape to apply, or None to restore
+            the default corners.
+
+    Returns:
+        bool: True if DWM rounds the corners.
+    """
+    if shape is None:
+        setWindowCornerPreference(hWnd, DWMWCP_DEFAULT)
+        return False
+    # Subclasses may build other shapes than plain rounded corners
+    if type(shape) is not RoundedCorners:
+        return False
+    if shape.radius == 4:
+        return setWindowCornerPreference(hWnd, DWMWCP_ROUNDSMALL)
+    if shape.radius == 8:
+        return setWindowCornerPreference(hWnd, DWMWCP_ROUND)
+    return False
+
+
 def setWindowNonResizable(hwnd):
-    style = win32gui.GetWindowLong(hwnd, win32con.GWL_STYLE)
-    style &= ~win32con.WS_SIZEBOX
-    style &= ~win32con.WS_THICKFRAME
-    style &= ~win32con.WS_MAXIMIZEBOX
-    win32gui.SetWindowLong(hwnd, win32con.GWL_STYLE, style)
+    hwnd = int(hwnd)
+    style = GetWindowLongW(hwnd, GWL_STYLE)
+    style &= ~WS_SIZEBOX
+    style &= ~WS_THICKFRAME
+    style &= ~WS_MAXIMIZEBOX
+    SetWindowLongW(hwnd, GWL_STYLE, style)
 
 
 def isWindowResizable(hwnd):
-    style = win32api.GetWindowLong(hwnd, win32con.GWL_STYLE)
-    return style & win32con.WS_SIZEBOX != 0
+    style = GetWindowLongW(int(hwnd), GWL_STYLE)
+    return style & WS_SIZEBOX != 0
 
 
 def isMaximized(hWnd) -> bool:
-    windowPlacement = win32gui.GetWindowPlacement(hWnd)
-    if not windowPlacement:
+    windowPlacement = WINDOWPLACEMENT()
+    windowPlacement.length = sizeof(WINDOWPLACEMENT)
+    if not GetWindowPlacement(int(hWnd), byref(windowPlacement)):
         return False
 
-    return windowPlacement[1] == win32con.SW_MAXIMIZE
+    return windowPlacement.showCmd == SW_MAXIMIZE
+
+
+def getWindowRect(hWnd) -> Optional[Rect]:
+    rect = RECT()
+    if not GetWindowRect(int(hWnd), byref(rect)):
+        return None
+    return rect.left, rect.top, rect.right, rect.bottom
+
+
+def getMonitor(hWnd) -> int:
+    return MonitorFromWindow(int(hWnd), MONITOR_DEFAULTTOPRIMARY) or 0
+
+
+def getMonitorRect(monitor: int) -> Optional[Rect]:
+    monitorInfo = MONITORINFO()
+    monitorInfo.cbSize = sizeof(MONITORINFO)
+    if not GetMonitorInfoW(monitor, byref(monitorInfo)):
+        return None
+    rect = monitorInfo.rcMonitor
+    return rect.left, rect.top, rect.right, rect.bottom
 
 
 def isFullScreen(hWnd) -> bool:
-    hWnd = int(hWnd)
-    winRect = win32gui.GetWindowRect(hWnd)
+    winRect = getWindowRect(hWnd)
     if not winRect:
         return False
 
-    monitor = win32api.MonitorFromWindow(hWnd, win32con.MONITOR_DEFAULTTOPRIMARY)
-    monitorInfo = win32api.GetMonitorInfo(monitor)
-    if not monitorInfo:
+    monitorRect = getMonitorRect(getMonitor(hWnd))
+    if not monitorRect:
         return False
 
-    monitorRect = monitorInfo["Monitor"]
-    return all(i == j for i, j in zip(winRect, monitorRect))
+    return winRect == monitorRect
 
 
 def startSystemMove(widget: QWidget, pos: QPoint) -> None:
-    win32gui.ReleaseCapture()
-    win32api.SendMessage(
+    ReleaseCapture()
+    SendMessageW(
         int(widget.winId()),
-        win32con.WM_SYSCOMMAND,
-        win32con.SC_MOVE | win32con.HTCAPTION,
+        WM_SYSCOMMAND,
+        SC_MOVE | HTCAPTION,
         0,
     )
@@ -0,0 +1,142 @@
+"""
+Deferred native setup shared by the Windows window classes.
+
+The Windows ``CuteWindow``, ``CuteMainWindow`` and ``CuteDialog`` only differ
+in their Qt base class. Creating the native handle, applying the DWM shadow and
+window styles and building the title bar are deferred to the first show, so
+windows that are never shown stay cheap; :class:`WindowsCuteWindowMixin` does
+that once for all three.
+"""
+
+from typing import Optional
+
+from PySide6.QtCore import QEvent
+
+from cutewindow.base import CuteWindowMixin
+from cutewindow.platforms.windows.title_bar.TitleBar import TitleBar
+from cutewindow.platforms.windows.utils import (
+    addShadowEffect,
+    addWindowAnimation,
+    applyDwmWindowShape,
+    isWindowResizable,
+    setWindowNonResizable,
+)
+from cutewindow.platforms.windows.window_state import invalidateWindowState
+from cutewindow.window_shape import WindowShape
+
+
+class WindowsCuteWindowMixin(CuteWindowMixin):
+    """
+    Mixin creating the native parts of a Windows window on its first show.
+
+    Calls made before the first show, such as :meth:`setNonResizable` or
+    ``setWindowShape()``, are remembered and applied then.
+
+    Note:
+        This mixin is designed to be used with QWidget subclasses, before the
+        Qt class in the bases, like :class:`~cutewindow.base.CuteWindowMixin`.
+    """
+
+    def __init__(self, *args, **kwargs):
+        """
+        Initialize the Windows window mixin.
+
+        Args:
+            *args: Variable length argument list passed to parent class.
+            **kwargs: Arbitrary keyword arguments passed to parent class.
+        """
+        # Native handle, DWM styling and title bar are created on first show
+        self._materialized = False
+        self._resizable = True
+        super().__init__(*args, **kwargs)
+
+    def titleBar(self) -> TitleBar:
+        """
+        Get the title bar widget, creating it on first use.
+
+        Returns:
+            TitleBar: The title bar widget instance.
+        """
+        if self._title_bar is None:
+            self._title_bar = TitleBar(self)  # type: ignore[arg-type]
+            self._title_bar.resize(
+                self.width(), self._title_bar.height()  # type: ignore[attr-defined]
+            )
+        return self._title_bar  # type: ignore[return-value]
+
+    def setVisible(self, visible: bool) -> None:
+        """
+        Show or hide the window, creating its native parts on the first show.
+
+        Args:
+            visible (bool): True to show the window.
+        """
+        if visible and not self._materialized:
+            self._materialize()
+        super().setVisible(visible)  # type: ignore[misc]
+
+    def _materialize(self) -> None:
+        self._materialized = True
+        self.titleBar()
+        hWnd = self.winId()  # type: ignore[attr-defined]
+        addShadowEffect(hWnd)
+        addWindowAnimation(hWnd)
+        if not self._resizable:
+            self.setNonResizable()
+        if self._window_shape is not None:
+            self.setWindowShape(self._window_shape)
+
+    def setNonResizable(self) -> None:
+        """
+        Make the window non-resizable.
+
+        This method disables window resizing functionality by modifying the
+        window style and hiding the maximize button from the title bar.
+        """
+        self._resizable = False
+        if not self._materialized:
+            return
+        setWindowNonResizable(self.winId())  # type: ignore[attr-defined]
+        # Hide maximize button if it exists on the title bar
+        if hasattr(self._title_bar, "maximize_button"):
+            self._title_bar.maximize_button.hide()  # type: ignore
+
+    def isResizable(self) -> bool:
+        """
+        Check if the window is resizable.
+
+        Returns:
+            bool: True if the window is resizable, False otherwise.
+        """
+        if not self._materialized:
+            return self._resizable
+        return isWindowResizable(self.winId())  # type: ignore[attr-defined]
+
+    def applyNativeWindowShape(self, shape: Optional[WindowShape]) -> bool:
+        """
+        Round the corners of the window through DWM where possible.
+
+        Args:
+            shape (Optional[WindowShape]): The shape to apply.
+
+        Returns:
+            bool: True if DWM shapes the window, False to use a mask.
+        """
+        if not self._materialized:
+            # Applied again on the first show
+            return False
+        return applyDwmWindowShape(self.winId(), shape)  # type: ignore[attr-defined]
+
+    def changeEvent(self, event: QEvent) -> None:
+        """
+        Handle change events.
+
+        Qt window state changes drop the mirrored native state of the window,
+        so it is queried again the next time a native message needs it.
+
+        Args:
+            event (QEvent): The change event.
+        """
+        if event.type() == QEvent.WindowStateChange:  # type: ignore
+            invalidateWindowState(self)  # type: ignore[arg-type]
+        super().changeEvent(event)  # type: ignore[misc]
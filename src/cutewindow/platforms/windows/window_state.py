@@ -0,0 +1,180 @@
+"""
+Shadow window state for the Windows backend.
+
+Hit testing and ``WM_NCCALCSIZE`` need to know whether a window is maximized
+or resizable and which monitor it is on. Asking Win32 each time costs up to
+five system calls per message, so this module keeps a per-window mirror of that
+state instead.
+The mirror is updated from the messages that change it (``WM_SIZE``,
+``WM_WINDOWPOSCHANGED``, ``WM_STYLECHANGED``) and dropped on Qt
+``WindowStateChange`` events, after which it is queried again on next use.
+
+Setting the ``CUTEWINDOW_DEBUG_WINDOW_STATE`` environment variable, or calling
+:func:`setDebugChecks`, cross-checks the mirror against the real Win32 values
+on every read and logs any mismatch.
+"""
+
+import logging
+import os
+from dataclasses import dataclass, fields
+from typing import Optional, Tuple
+
+from PySide6.QtWidgets import QWidget
+
+from cutewindow.platforms.windows.utils import (
+    getMonitor,
+    getMonitorRect,
+    getWindowRect,
+    isMaximized,
+    isWindowResizable,
+)
+
+logger = logging.getLogger(__name__)
+
+Rect = Tuple[int, int, int, int]
+
+_debug_checks = os.environ.get("CUTEWINDOW_DEBUG_WINDOW_STATE", "") not in ("", "0")
+
+
+def setDebugChecks(enabled: bool) -> None:
+    """
+    Enable or disable cross-checking the mirror against Win32 on every read.
+
+    Args:
+        enabled (bool): Whether debug checks are enabled.
+    """
+    global _debug_checks
+    _debug_checks = enabled
+
+
+@dataclass
+class WindowState:
+    """
+    Mirror of the native state of a single window.
+
+    Attributes:
+        maximized (bool): Whether the window is maximized.
+        resizable (bool): Whether the window has the WS_SIZEBOX style.
+        window_rect (Rect): The window rectangle in screen coordinates.
+        monitor (int): Handle of the monitor the window is on.
+        monitor_rect (Rect): The rectangle of that monitor.
+    """
+
+    maximized: bool = False
+    resizable: bool = True
+    window_rect: Rect = (0, 0, 0, 0)
+    monitor: int = 0
+    monitor_rect: Rect = (0, 0, 0, 0)
+
+    @classmethod
+    def query(cls, hWnd: int) -> "WindowState":
+        """
+        Query the current state of a window from the system.
+
+        Args:
+            hWnd (int): The native window handle.
+
+        Returns:
+            WindowState: The current state of the window.
+        """
+        state = cls(maximized=isMaximized(hWnd), resizable=isWindowResizable(hWnd))
+        state.updateGeometry(hWnd, getWindowRect(hWnd) or (0, 0, 0, 0))
+        return state
+
+    def updateGeometry(self, hWnd: int, window_rect: Rect) -> bool:
+        """
+        Update the window rectangle and everything derived from it.
+
+        Windows belong to the monitor they overlap most. While more than half
+        of the window lies on the mirrored monitor no other monitor can overlap
+        it more, so moves and resizes within a monitor make no system call.
+
+        Args:
+            hWnd (int): The native window handle.
+            window_rect (Rect): The new window rectangle in screen coordinates.
+
+        Returns:
+            bool: True if the window changed monitor, False otherwise.
+        """
+        self.window_rect = window_rect
+        if self.monitor and _onMonitor(window_rect, self.monitor_rect):
+            return False
+        monitor = getMonitor(hWnd)
+        changed = monitor != self.monitor
+        if changed:
+            self.monitor = monitor
+            self.monitor_rect = getMonitorRect(monitor) or (0, 0, 0, 0)
+        return changed
+
+    def verify(self, hWnd: int) -> bool:
+        """
+        Compare the mirror with the real Win32 state and log mismatches.
+
+        Mismatching fields are corrected so the window keeps behaving.
+
+        Args:
+            hWnd (int): The native window handle.
+
+        Returns:
+            bool: True if the mirror matched, False otherwise.
+        """
+        actual = WindowState.query(hWnd)
+        matched = True
+        for field in fields(self):
+            mirrored = getattr(self, field.name)
+            expected = getattr(actual, field.name)
+            if mirrored != expected:
+                logger.warning(
+                    "Window state mirror of %#x is out of sync: %s is %r, "
+                    "expected %r",
+                    hWnd,
+                    field.name,
+                    mirrored,
+                    expected,
+                )
+                setattr(self, field.name, expected)
+                matched = False
+        return matched
+
+
+def _onMonitor(window_rect: Rect, monitor_rect: Rect) -> bool:
+    # True if more than half of the window lies on the monitor
+    left, top, right, bottom = window_rect
+    m_left, m_top, m_right, m_bottom = monitor_rect
+    width = min(right, m_right) - max(left, m_left)
+    height = min(bottom, m_bottom) - max(top, m_top)
+    if width <= 0 or height <= 0:
+        return False
+    return 2 * width * height > (right - left) * (bottom - top)
+
+
+def windowState(widget: QWidget, hWnd: int) -> WindowState:
+    """
+    Get the mirrored state of a window, querying it on first use.
+
+    Args:
+        widget (QWidget): The top-level window owning the mirror.
+        hWnd (int): The native handle of the window.
+
+    Returns:
+        WindowState: The mirrored state.
+    """
+    state: Optional[WindowState] = getattr(widget, "_window_state", None)
+    if state is None:
+        state = WindowState.query(hWnd)
+        widget._window_state = state  # type: ignore[attr-defined]
+    elif _debug_checks:
+        state.verify(hWnd)
+    return state
+
+
+def invalidateWindowState(widget: QWidget) -> None:
+    """
+    Drop the mirrored state of a window.
+
+    The state is queried again the next time it is needed.
+
+    Args:
+        widget (QWidget): The top-level window owning the mirror.
+    """
+    widget._window_state = None  # type: ignore[attr-defined]
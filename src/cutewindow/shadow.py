@@ -0,0 +1,178 @@
+"""
+Cached nine-slice drop shadows for frameless windows.
+
+Frameless windows get no shadow unless the platform draws one, as DWM does on
+Windows. A ``QGraphicsDropShadowEffect`` on the root widget blurs the whole
+window again on every repaint. :class:`NineSliceShadow` instead blurs a small
+template once per (radius, color, device pixel ratio) and paints the shadow as
+a frame of its slices around the content: the four corners are drawn as they
+are and the four edges are stretched from one-pixel slices. Resizing only
+draws the cached slices at new positions, the template is never blurred again.
+
+Example:
+    >>> shadow = NineSliceShadow(radius=16, color=QColor(0, 0, 0, 96))
+    >>> # in paintEvent of a translucent widget with 16 pixel margins
+    >>> painter = QPainter(self)
+    >>> shadow.paint(painter, self.rect().marginsRemoved(shadow.margins()))
+"""
+
+from functools import lru_cache
+from typing import Dict
+
+from PySide6.QtCore import QMargins, QRect, QRectF, Qt
+from PySide6.QtGui import QColor, QImage, QPainter, QPixmap
+from PySide6.QtWidgets import QGraphicsBlurEffect, QGraphicsPixmapItem, QGraphicsScene
+
+
+def shadowTemplate(radius: int, color: QColor, device_pixel_ratio: float) -> QPixmap:
+    """
+    Get the blurred shadow template, blurring it on first use.
+
+    The template is a square of ``4 * radius + 1`` logical pixels: a shadow
+    rectangle inset by ``radius`` on each side, blurred by ``radius``.
+
+    Args:
+        radius (int): The blur radius in logical pixels.
+        color (QColor): The shadow color.
+        device_pixel_ratio (float): The device pixel ratio to blur for.
+
+    Returns:
+        QPixmap: The cached template, tagged with the device pixel ratio.
+    """
+    return _blurTemplate(radius, color.rgba(), device_pixel_ratio)
+
+
+def shadowCacheStatistics() -> Dict[str, int]:
+    """
+    Get how often cached templates were reused versus blurred.
+
+    Returns:
+        Dict[str, int]: The number of "hits" and "misses" and the cache "size".
+    """
+    info = _blurTemplate.cache_info()
+    return {"hits": info.hits, "misses": info.misses, "size": info.currsize}
+
+
+@lru_cache(maxsize=32)
+def _blurTemplate(radius: int, rgba: int, device_pixel_ratio: float) -> QPixmap:
+    side = round((4 * radius + 1) * device_pixel_ratio)
+    inset = round(radius * device_pixel_ratio)
+
+    source = QPixmap(side, side)
+    source.fill(Qt.transparent)  # type: ignore
+    painter = QPainter(source)
+    painter.fillRect(
+        QRect(inset, inset, side - 2 * inset, side - 2 * inset), QColor.fromRgba(rgba)
+    )
+    painter.end()
+
+    # Blur once through a scene, the template is small
+    scene = QGraphicsScene()
+    item = QGraphicsPixmapItem(source)
+    effect = QGraphicsBlurEffect()
+    effect.setBlurRadius(inset)
+    effect.setBlurHints(QGraphicsBlurEffect.QualityHint)  # type: ignore
+    item.setGraphicsEffect(effect)
+    scene.addItem(item)
+
+    image = QImage(side, side, QImage.Format_ARGB32_Premultiplied)  # type: ignore
+    image.fill(Qt.transparent)  # type: ignore
+    painter = QPainter(image)
+    scene.render(painter, QRectF(0, 0, side, side), QRectF(0, 0, side, side))
+    painter.end()
+
+    template = QPixmap.fromImage(image)
+    template.setDevicePixelRatio(device_pixel_ratio)
+    return template
+
+
+class NineSliceShadow:
+    """
+    Drop shadow painted from the slices of a cached template.
+
+    Attributes:
+        radius (int): The blur radius, which is also the shadow's width
+            outside the content.
+        color (QColor): The shadow color.
+    """
+
+    def __init__(self, radius: int = 16, color: QColor = QColor(0, 0, 0, 96)) -> None:
+        """
+        Initialize the shadow.
+
+        Args:
+            radius (int): The blur radius in logical pixels, defaults to 16.
+            color (QColor): The shadow color, defaults to translucent black.
+        """
+        self.radius = radius
+        self.color = QColor(color)
+
+    def margins(self) -> QMargins:
+        """
+        Get the space the shadow needs around the content.
+
+        Returns:
+            QMargins: The radius on every side.
+        """
+        return QMargins(self.radius, self.radius, self.radius, self.radius)
+
+    def paint(self, painter: QPainter, content: QRect) -> None:
+        """
+        Paint the shadow around a content rectangle.
+
+        Only the frame outside of the content is painted; the content is left
+        for the widget to paint.
+
+        Args:
+            painter (QPainter): The painter, on a device with room for
+                :meth:`margins` around the content.
+            content (QRect): The content rectangle in painter coordinates.
+        """
+        device = painter.device()
+        ratio = device.devicePixelRatioF() if device is not None else 1.0
+        template = shadowTemplate(self.radius, self.color, ratio)
+
+        r = self.radius
+        corner = 2 * r
+        # Logical coordinates of the slices in the template
+        inner = 2 * r + 1
+        left = content.left() - r
+        top = content.top() - r
+        right = content.right() + 1 + r
+        bottom = content.bottom() + 1 + r
+        width = right - left - 2 * corner
+        height = bottom - top - 2 * corner
+
+        def draw(
+            x: float,
+            y: float,
+            w: float,
+            h: float,
+            sx: float,
+            sy: float,
+            sw: float,
+            sh: float,
+        ) -> None:
+            if w <= 0 or h <= 0:
+                return
+            painter.drawPixmap(
+                QRectF(x, y, w, h),
+                template,
+                QRectF(sx * ratio, sy * ratio, sw * ratio, sh * ratio),
+            )
+
+        # Corners, the L-shaped part outside of the content
+        draw(left, top, corner, r, 0, 0, corner, r)
+        draw(left, top + r, r, r, 0, r, r, r)
+        draw(right - corner, top, corner, r, inner, 0, corner, r)
+        draw(right - r, top + r, r, r, inner + r, r, r, r)
+        draw(left, bottom - r, corner, r, 0, inner + r, corner, r)
+        draw(left, bottom - corner, r, r, 0, inner, r, r)
+        draw(right - corner, bottom - r, corner, r, inner, inner + r, corner, r)
+        draw(right - r, bottom - corner, r, r, inner + r, inner, r, r)
+
+        # Edges, stretched from the middle column or row of the template
+        draw(left + corner, top, width, r, corner, 0, 1, r)
+        draw(left + corner, bottom - r, width, r, corner, inner + r, 1, r)
+        draw(left, top + corner, r, height, 0, corner, r, 1)
+        draw(right - r, top + corner, r, height, inner + r, corner, r, 1)
@@ -0,0 +1,613 @@
+"""
+Title bar with window controls, shared by the platforms that draw their own.
+
+Windows and frameless Linux windows have no system-drawn window controls, so
+their title bars are built from the classes in this module: the close,
+minimize and maximize/restore buttons, styled by the process-wide
+:mod:`~cutewindow.title_bar_theme`, and :class:`WindowControlsTitleBar`, which
+lays them out, keeps the hit-test regions and hands title bar drags over to
+the system. The module depends on Qt only; each backend subclasses the title
+bar and supplies its platform's move function.
+"""
+
+from enum import Enum, IntEnum, auto
+from functools import partial
+from typing import Dict, Optional
+
+from PySide6.QtCore import QPoint, QRect, Qt
+from PySide6.QtGui import QColor, QIcon, QMouseEvent, QPainter, QPaintEvent
+from PySide6.QtWidgets import (
+    QFrame,
+    QHBoxLayout,
+    QPushButton,
+    QSizePolicy,
+    QSpacerItem,
+    QWidget,
+)
+
+from cutewindow.base import CuteWindowMixin
+from cutewindow.drag_gesture import DragGesture
+from cutewindow.glyphs import Glyph, GlyphState, glyphPixmap
+from cutewindow.hit_test import HitRegion, HitTestIndex
+from cutewindow.Icon import Icon
+from cutewindow.title_bar_resources import registerResources
+from cutewindow.title_bar_theme import (
+    CompiledTitleBarTheme,
+    addThemedWidget,
+    compiledTitleBarTheme,
+)
+
+
+class MaximizeButtonIcon(str, Enum):
+    """
+    Enumeration of maximize button icon types.
+
+    This enum defines the two possible states for the maximize button icon:
+    - RESTORE: Show the restore icon (when window is maximized)
+    - MAXIMIZE: Show the maximize icon (when window is normal size)
+    """
+
+    RESTORE = "restore"
+    MAXIMIZE = "maximize"
+
+
+class TitleBarButton(QPushButton):
+    """
+    Base class for title bar buttons.
+
+    This class provides common styling and behavior for all title bar buttons.
+    Sizes come from the process-wide title bar theme, and the backgrounds of
+    the hover and pressed states from the theme's application stylesheet,
+    which selects the buttons by their ``titleBarButton`` property. Qt paints
+    the buttons, so stylesheets set on a window or a button apply as usual.
+
+    The icon shows the button's glyph: either the bundled PNG icon, or, when
+    the theme sets ``procedural_glyphs``, a pixmap drawn at the exact device
+    pixel size over the background Qt painted.
+
+    Attributes:
+        GLYPH (Optional[Glyph]): The initial glyph of the button class.
+        ROLE (str): The ``titleBarButton`` property the stylesheet selects.
+
+    Example:
+        >>> button = TitleBarButton(parent=title_bar)
+        >>> button.setGlyph(Glyph.CLOSE)
+    """
+
+    GLYPH: Optional[Glyph] = None
+    ROLE = "button"
+
+    def __init__(self, parent: Optional[QWidget]) -> None:
+        """
+        Initialize the title bar button.
+
+        Args:
+            parent (Optional[QWidget]): The parent widget, defaults to None.
+        """
+        super(TitleBarButton, self).__init__(parent)
+
+        self._glyph = self.GLYPH
+        self.setProperty("titleBarButton", self.ROLE)
+
+        # Repaint when the mouse enters or leaves the button
+        self.setAttribute(Qt.WA_Hover)  # type: ignore
+        addThemedWidget(self)
+
+    def applyTitleBarTheme(self, theme: CompiledTitleBarTheme) -> None:
+        """
+        Apply the sizes and glyphs of a title bar theme.
+
+        Args:
+            theme (CompiledTitleBarTheme): The theme to apply.
+        """
+        self.setFixedSize(theme.button_size)
+        self.setIconSize(theme.icon_size)
+        self._updateIcon(theme)
+        self.update()
+
+    def glyph(self) -> Optional[Glyph]:
+        """
+        Get the glyph shown by the button.
+
+        Returns:
+            Optional[Glyph]: The glyph, or None if the button has none.
+        """
+        return self._glyph
+
+    def setGlyph(self, glyph: Glyph) -> None:
+        """
+        Set the glyph shown by the button.
+
+        Args:
+            glyph (Glyph): The glyph to show.
+        """
+        if glyph == self._glyph:
+            return
+        self._glyph = glyph
+        self._updateIcon(compiledTitleBarTheme())
+        self.update()
+
+    def _updateIcon(self, theme: CompiledTitleBarTheme) -> None:
+        if self._glyph is None:
+            return
+        if theme.procedural_glyphs:
+            # Glyphs are drawn at paint time, no PNG is decoded
+            self.setIcon(QIcon())
+            return
+        # The title bar icons are loaded on first use
+        registerResources()
+        self.setIcon(Icon(f":/icons/title-bar/{self._glyph.value}.png"))
+
+    def glyphState(self) -> GlyphState:
+        """
+        Get the state the glyph is drawn for.
+
+        Returns:
+            GlyphState: PRESSED, HOVER or NORMAL.
+        """
+        if self.isDown():
+            return GlyphState.PRESSED
+        if self.isHovered():
+            return GlyphState.HOVER
+        return GlyphState.NORMAL
+
+    def glyphColor(self, theme: CompiledTitleBarTheme, state: GlyphState) -> QColor:
+        """
+        Get the color of the procedurally drawn glyph in a state.
+
+        Args:
+            theme (CompiledTitleBarTheme): The theme to take colors from.
+            state (GlyphState): The state the glyph is drawn for.
+
+        Returns:
+            QColor: The glyph color.
+        """
+        return theme.glyph_color
+
+    def isHovered(self) -> bool:
+        """
+        Check if the button is drawn in its hover state.
+
+        Returns:
+            bool: True if the mouse is over the button, False otherwise.
+        """
+        return self.underMouse()
+
+    def paintEvent(self, event: QPaintEvent) -> None:
+        """Paint the button, and the procedural glyph if the theme uses them."""
+        super().paintEvent(event)
+        theme = compiledTitleBarTheme()
+        if not theme.procedural_glyphs or self._glyph is None:
+            return
+
+        icon_rect = QRect(self.rect().topLeft(), self.iconSize())
+        icon_rect.moveCenter(self.rect().center())
+        state = self.glyphState()
+        pixmap = glyphPixmap(
+            self._glyph,
+            icon_rect.size(),
+            self.devicePixelRatioF(),
+            state,
+            self.glyphColor(theme, state),
+        )
+        painter = QPainter(self)
+        painter.drawPixmap(icon_rect.topLeft(), pixmap)
+        painter.end()
+
+
+class MaximizeButtonState(IntEnum):
+    """
+    Enumeration of maximize button visual states.
+
+    This enum defines the visual states for the maximize button:
+    - HOVER: Button is being hovered by the mouse
+    - NORMAL: Button is in normal (non-hovered) state
+    """
+
+    HOVER = auto()
+    NORMAL = auto()
+
+
+class MaximizeButton(TitleBarButton):
+    """
+    Maximize/Restore button for the title bar.
+
+    This button handles window maximization and restoration. It changes its
+    icon based on the current window state and provides visual feedback
+    on hover.
+
+    Features:
+    - Changes icon between maximize and restore based on window state
+    - Provides hover effects with background color changes
+    - Maintains consistent styling with other title bar buttons
+
+    The hover state driven by native hit testing (Windows 11 snap layouts) is
+    exposed to the stylesheet as the ``nativeHover`` dynamic property, which
+    is only changed, and the button repolished, on real transitions.
+
+    Example:
+        >>> maximize_btn = MaximizeButton(parent=title_bar)
+        >>> maximize_btn.clicked.connect(window.showMaximized)
+    """
+
+    GLYPH = Glyph.MAXIMIZE
+    ROLE = "maximize"
+
+    def __init__(self, parent: Optional[QWidget]) -> None:
+        """
+        Initialize the maximize button.
+
+        Args:
+            parent (Optional[QWidget]): The parent widget, defaults to None.
+        """
+        super(MaximizeButton, self).__init__(parent)
+
+        self._state = MaximizeButtonState.NORMAL
+        self._state_transitions = 0
+        self._redundant_state_calls = 0
+
+    def state(self) -> MaximizeButtonState:
+        """
+        Get the visual state of the maximize button.
+
+        Returns:
+            MaximizeButtonState: The current visual state.
+        """
+        return self._state
+
+    def setState(self, state: MaximizeButtonState) -> None:
+        """
+        Set the visual state of the maximize button.
+
+        This method is called for every native hit test over the button, so
+        only real transitions repaint the button; repeated calls with the
+        current state are counted and otherwise ignored.
+
+        Args:
+            state (MaximizeButtonState): The visual state to set.
+        """
+        if state == self._state:
+            self._redundant_state_calls += 1
+            return
+
+        self._state = state
+        self._state_transitions += 1
+        self.setProperty("nativeHover", state == MaximizeButtonState.HOVER)
+        # Dynamic properties are matched when the button is polished
+        self.style().unpolish(self)
+        self.style().polish(self)
+        self.update()
+
+    def stateStatistics(self) -> Dict[str, int]:
+        """
+        Get how often setState() changed the state versus repeated it.
+
+        Returns:
+            Dict[str, int]: The number of "transitions" and "redundant" calls.
+        """
+        return {
+            "transitions": self._state_transitions,
+            "redundant": self._redundant_state_calls,
+        }
+
+    def isHovered(self) -> bool:
+        """
+        Check if the button is drawn in its hover state.
+
+        Returns:
+            bool: True if the mouse or a native hit test is over the button.
+        """
+        return self._state == MaximizeButtonState.HOVER or self.underMouse()
+
+
+class MinimizeButton(TitleBarButton):
+    """
+    Minimize button for the title bar.
+
+    This button handles window minimization. It provides a consistent
+    appearance with other title bar buttons and hover effects.
+
+    Features:
+    - Minimizes the window when clicked
+    - Provides hover effects with background color changes
+    - Maintains consistent styling with other title bar buttons
+
+    Attributes:
+        None (inherits from TitleBarButton)
+
+    Example:
+        >>> minimize_btn = MinimizeButton(parent=title_bar)
+        >>> minimize_btn.clicked.connect(window.showMinimized)
+    """
+
+    GLYPH = Glyph.MINIMIZE
+    ROLE = "minimize"
+
+    def __init__(self, parent: Optional[QWidget]) -> None:
+        """
+        Initialize the minimize button.
+
+        Args:
+            parent (Optional[QWidget]): The parent widget, defaults to None.
+        """
+        super(MinimizeButton, self).__init__(parent)
+
+
+class CloseButton(TitleBarButton):
+    """
+    Close button for the title bar.
+
+    This button handles window closing. It provides a distinctive red
+    hover effect to match Windows UI conventions and consistent
+    appearance with other title bar buttons.
+
+    Features:
+    - Closes the window when clicked
+    - Provides red hover effect (Windows convention)
+    - Maintains consistent styling with other title bar buttons
+
+    Attributes:
+        None (inherits from TitleBarButton)
+
+    Example:
+        >>> close_btn = CloseButton(parent=title_bar)
+        >>> close_btn.clicked.connect(window.close)
+    """
+
+    GLYPH = Glyph.CLOSE
+    ROLE = "close"
+
+    def __init__(self, parent: Optional[QWidget]) -> None:
+        """
+        Initialize the close button.
+
+        Args:
+            parent (Optional[QWidget]): The parent widget, defaults to None.
+        """
+        super(CloseButton, self).__init__(parent)
+
+    def glyphColor(self, theme: CompiledTitleBarTheme, state: GlyphState) -> QColor:
+        """
+        Get the color of the procedurally drawn glyph in a state.
+
+        Args:
+            theme (CompiledTitleBarTheme): The theme to take colors from.
+            state (GlyphState): The state the glyph is drawn for.
+
+        Returns:
+            QColor: The glyph color, which stands out on the red background
+            while the button is hovered or pressed.
+        """
+        if state == GlyphState.NORMAL:
+            return theme.glyph_color
+        return theme.close_active_glyph_color
+
+
+class WindowControlsTitleBar(QFrame):
+    """
+    Title bar with custom window controls, the base of the platform title bars.
+
+    The title bar is laid out with the buttons on the right side and a spacer
+    that takes up the remaining space. Dragging the caption hands the move over
+    to the system once per gesture, through ``QWindow.startSystemMove()`` or,
+    where that is not supported, through :meth:`startSystemMove`, which the
+    platform title bars override.
+
+    Features:
+    - Custom window controls (close, minimize, maximize/restore)
+    - Proper button icons that change based on window state
+    - Window dragging, handed over to the system once per drag gesture
+    - Window state notifications from the window to update the maximize icon
+    - Responsive layout that adapts to window resizing
+    - Precomputed hit-test regions for native hit testing
+
+    Attributes:
+        button_box (QWidget): Container widget for window control buttons.
+        maximize_button (MaximizeButton): The maximize/restore button.
+        minimize_button (MinimizeButton): The minimize button.
+        close_button (CloseButton): The close button.
+        button_box_horizontalLayout (QHBoxLayout): Layout for button container.
+        horizontalLayout (QHBoxLayout): Main layout for the title bar.
+        horizontalSpacer (QSpacerItem): Spacer that pushes buttons to the right.
+    """
+
+    def __init__(self, parent: Optional[QWidget] = None) -> None:
+        """
+        Initialize the title bar.
+
+        Args:
+            parent (Optional[QWidget]): The parent widget (usually the window),
+                                       defaults to None.
+        """
+        super(WindowControlsTitleBar, self).__init__(parent)
+
+        self.setObjectName("TitleBar")
+        addThemedWidget(self)
+
+        self.button_box = QWidget(self)
+
+        self.maximize_button = MaximizeButton(self.button_box)
+        self.minimize_button = MinimizeButton(self.button_box)
+        self.close_button = CloseButton(self.button_box)
+        self._maximize_button_icon = MaximizeButtonIcon.MAXIMIZE
+
+        self.button_box_horizontalLayout = QHBoxLayout(self.button_box)
+        self.button_box_horizontalLayout.setContentsMargins(0, 0, 0, 0)
+        self.button_box_horizontalLayout.setSpacing(0)
+
+        for btn in [self.minimize_button, self.maximize_button, self.close_button]:
+            self.button_box_horizontalLayout.addWidget(btn)
+
+        self.horizontalLayout = QHBoxLayout(self)
+        self.horizontalLayout.setContentsMargins(0, 0, 0, 0)
+        self.horizontalLayout.setSpacing(0)
+
+        self.horizontalSpacer = QSpacerItem(
+            20, 20, QSizePolicy.Expanding, QSizePolicy.Minimum  # type: ignore
+        )  # type: ignore
+
+        self.horizontalLayout.addSpacerItem(self.horizontalSpacer)
+        self.horizontalLayout.addWidget(self.button_box)
+
+        self.minimize_button.clicked.connect(self.on_minimize_button_clicked)
+        self.maximize_button.clicked.connect(self.on_maximize_button_clicked)
+        self.close_button.clicked.connect(self.on_close_button_clicked)
+
+        self._hit_test_index = HitTestIndex(self)
+        self._hit_test_index.addInteractiveWidget(
+            self.maximize_button, HitRegion.MAXIMIZE_BUTTON
+        )
+        # Static, so the gesture holds no reference back to the title bar
+        self._drag_gesture = DragGesture(
+            self, self.startSystemMove, type(self).isInteractiveAt
+        )
+
+        window = self.window()
+        if isinstance(window, CuteWindowMixin):
+            window.addWindowStateListener(self.onWindowStateChanged)
+            self.destroyed.connect(
+                partial(window.removeWindowStateListener, self.onWindowStateChanged)
+            )
+
+    @staticmethod
+    def startSystemMove(window: QWidget, pos: QPoint) -> None:
+        """
+        Move a window with the platform's own API.
+
+        Called by the drag gesture where ``QWindow.startSystemMove()`` is not
+        supported. The base title bar has no other way to move the window and
+        does nothing.
+
+        Args:
+            window (QWidget): The top-level widget to move.
+            pos (QPoint): The global position of the mouse.
+        """
+
+    def applyTitleBarTheme(self, theme: CompiledTitleBarTheme) -> None:
+        """
+        Apply the height of a title bar theme.
+
+        Args:
+            theme (CompiledTitleBarTheme): The theme to apply.
+        """
+        self.setFixedHeight(theme.height)
+
+    def hitTestIndex(self) -> HitTestIndex:
+        """
+        Get the hit-test index used for native hit testing.
+
+        Returns:
+            HitTestIndex: The title bar's hit-test index.
+        """
+        return self._hit_test_index
+
+    def isInteractiveAt(self, pos: QPoint) -> bool:
+        """
+        Check if a point lies on an interactive widget of the title bar.
+
+        Args:
+            pos (QPoint): The point in title bar coordinates.
+
+        Returns:
+            bool: True for buttons and registered interactive widgets.
+        """
+        pos = self.mapTo(self.window(), pos)
+        region = self._hit_test_index.hitTest(pos.x(), pos.y(), resizable=False)
+        return region in (HitRegion.INTERACTIVE, HitRegion.MAXIMIZE_BUTTON)
+
+    def dragGesture(self) -> DragGesture:
+        """
+        Get the gesture that moves the window when the title bar is dragged.
+
+        Returns:
+            DragGesture: The title bar's drag gesture.
+        """
+        return self._drag_gesture
+
+    def addInteractiveWidget(self, widget: QWidget) -> None:
+        """
+        Register a title bar child that should receive mouse input.
+
+        Buttons are interactive already. Custom title bars use this for other
+        widgets, such as search fields or tabs, which would otherwise be treated
+        as part of the draggable caption.
+
+        Args:
+            widget (QWidget): A descendant of the title bar.
+        """
+        self._hit_test_index.addInteractiveWidget(widget)
+
+    def removeInteractiveWidget(self, widget: QWidget) -> None:
+        """
+        Unregister a widget added with :meth:`addInteractiveWidget`.
+
+        Args:
+            widget (QWidget): The widget to unregister.
+        """
+        self._hit_test_index.removeInteractiveWidget(widget)
+
+    def on_close_button_clicked(self) -> None:
+        """
+        Handle close button click event.
+
+        This method is called when the close button is clicked and
+        closes the associated window.
+        """
+        self.window().close()
+
+    def on_maximize_button_clicked(self):
+        """Handle maximize button click event."""
+        status = self.topLevelWidget().isMaximized()
+        if status:
+            self.window().showNormal()
+            self.set_maximize_button_icon(MaximizeButtonIcon.MAXIMIZE)
+        else:
+            self.window().showMaximized()
+            self.set_maximize_button_icon(MaximizeButtonIcon.RESTORE)
+
+    def on_minimize_button_clicked(self) -> None:
+        """
+        Handle minimize button click event.
+
+        This method is called when the minimize button is clicked and
+        minimizes the associated window.
+        """
+        self.window().showMinimized()
+
+    def set_maximize_button_icon(self, icon: MaximizeButtonIcon) -> None:
+        """Set the maximize button icon based on window state."""
+        if icon == self._maximize_button_icon:
+            return
+        self._maximize_button_icon = icon
+        self.maximize_button.setGlyph(Glyph(icon.value))
+
+    def onWindowStateChanged(self, state: Qt.WindowStates) -> None:
+        """
+        Show the icon matching a new window state on the maximize button.
+
+        Args:
+            state (Qt.WindowStates): The new state of the window.
+        """
+        if state & Qt.WindowMaximized:  # type: ignore
+            self.set_maximize_button_icon(MaximizeButtonIcon.RESTORE)
+        else:
+            self.set_maximize_button_icon(MaximizeButtonIcon.MAXIMIZE)
+
+    def mousePressEvent(self, event: QMouseEvent) -> None:
+        """Handle mouse press events to arm the drag gesture."""
+        self._drag_gesture.press(event)
+        super().mousePressEvent(event)
+
+    def mouseMoveEvent(self, event: QMouseEvent) -> None:
+        """Handle mouse move events to hand window dragging over to the system."""
+        self._drag_gesture.move(event)
+
+    def mouseReleaseEvent(self, event: QMouseEvent) -> None:
+        """Handle mouse release events to end the drag gesture."""
+        self._drag_gesture.release(event)
+        super().mouseReleaseEvent(event)
+
+    def mouseDoubleClickEvent(self, event: QMouseEvent) -> None:
+        """Handle mouse double-click events to cancel the drag gesture."""
+        self._drag_gesture.doubleClick(event)
+        super().mouseDoubleClickEvent(event)
@@ -0,0 +1,37 @@
+"""
+Lazy registration of the title bar resources.
+
+The icons of the window control buttons ship as a binary resource file,
+``resources/title_bar.rcc``, built in the ``resources`` directory with::
+
+    pyside6-rcc --binary --no-compress title_bar.qrc -o title_bar.rcc
+
+The file is registered with :func:`registerResources` the first time a title
+bar button shows a bundled icon, so importing the title bar costs nothing and
+applications that bring their own title bar or draw the glyphs procedurally
+never load it. Qt memory-maps the
+registered file, and the uncompressed PNGs are read straight from the mapping.
+"""
+
+import os
+
+from PySide6.QtCore import QResource
+
+RESOURCE_FILE = os.path.join(os.path.dirname(__file__), "resources", "title_bar.rcc")
+
+_registered = False
+
+
+def registerResources() -> None:
+    """
+    Register the title bar resources under ``:/icons/title-bar``, once.
+
+    Raises:
+        RuntimeError: If the resource file cannot be registered.
+    """
+    global _registered
+    if _registered:
+        return
+    if not QResource.registerResource(RESOURCE_FILE):
+        raise RuntimeError(f"Could not register title bar resources {RESOURCE_FILE}")
+    _registered = True
@@ -0,0 +1,227 @@
+"""
+Process-wide theme of the title bars with window controls.
+
+The colors and sizes of the title bar and its buttons are described by a
+:class:`TitleBarTheme`. It is compiled once per process and theme into Qt
+value objects and one stylesheet (:class:`CompiledTitleBarTheme`). The
+stylesheet is installed once as a section of the application stylesheet, and
+its rules select the buttons by the ``titleBarButton`` dynamic property and
+their states by ``:hover``, ``:pressed`` and the ``nativeHover`` dynamic
+property. Qt paints the buttons from it, so creating a window parses no
+stylesheet, and stylesheets that applications set on their windows or on the
+buttons still take precedence over the theme.
+
+Example:
+    >>> from cutewindow.title_bar_theme import TitleBarTheme, setTitleBarTheme
+    >>> setTitleBarTheme(TitleBarTheme(hover_color="#3A3A44", height=32))
+"""
+
+from dataclasses import dataclass
+from functools import lru_cache
+from weakref import WeakSet
+
+from PySide6.QtCore import QSize
+from PySide6.QtGui import QColor
+from PySide6.QtWidgets import QApplication, QWidget
+
+# Markers of the title bar section of the application stylesheet
+_BEGIN = "/* cutewindow title bar theme */\n"
+_END = "/* end of cutewindow title bar theme */\n"
+
+_STYLESHEET = """\
+QPushButton[titleBarButton] {{
+    border: none;
+    outline: none;
+    background: transparent;
+}}
+QPushButton[titleBarButton]:hover,
+QPushButton[titleBarButton][nativeHover="true"] {{
+    background-color: {hover};
+}}
+QPushButton[titleBarButton]:pressed {{
+    background-color: {pressed};
+}}
+QPushButton[titleBarButton="close"]:hover {{
+    background-color: {close_hover};
+}}
+QPushButton[titleBarButton="close"]:pressed {{
+    background-color: {close_pressed};
+}}
+"""
+
+
+@dataclass(frozen=True)
+class TitleBarTheme:
+    """
+    Colors and sizes of the title bar.
+
+    Attributes:
+        height (int): Height of the title bar.
+        button_width (int): Width of the window control buttons.
+        button_height (int): Height of the window control buttons.
+        icon_size (int): Size of the button icons.
+        hover_color (str): Background of hovered minimize/maximize buttons.
+        pressed_color (str): Background of pressed minimize/maximize buttons.
+        close_hover_color (str): Background of the hovered close button.
+        close_pressed_color (str): Background of the pressed close button.
+        procedural_glyphs (bool): Draw the button glyphs with QPainter at the
+            exact device pixel size instead of using the bundled PNG icons.
+        glyph_color (str): Color of procedurally drawn glyphs.
+        close_active_glyph_color (str): Color of the procedurally drawn close
+            glyph while the close button is hovered or pressed.
+    """
+
+    height: int = 28
+    button_width: int = 40
+    button_height: int = 28
+    icon_size: int = 24
+    hover_color: str = "#1D1D24"
+    pressed_color: str = "#1D1D24"
+    close_hover_color: str = "#e81123"
+    close_pressed_color: str = "#e81123"
+    procedural_glyphs: bool = False
+    glyph_color: str = "#d1d3d2"
+    close_active_glyph_color: str = "#ffffff"
+
+
+@dataclass(frozen=True)
+class CompiledTitleBarTheme:
+    """
+    A title bar theme converted to the Qt objects used for layout and painting.
+
+    Attributes:
+        height (int): Height of the title bar.
+        button_size (QSize): Size of the window control buttons.
+        icon_size (QSize): Size of the button icons.
+        hover_color (QColor): Background of hovered buttons.
+        pressed_color (QColor): Background of pressed buttons.
+        close_hover_color (QColor): Background of the hovered close button.
+        close_pressed_color (QColor): Background of the pressed close button.
+        procedural_glyphs (bool): Whether glyphs are drawn procedurally.
+        glyph_color (QColor): Color of procedurally drawn glyphs.
+        close_active_glyph_color (QColor): Color of the procedurally drawn
+            close glyph while the close button is hovered or pressed.
+        stylesheet (str): The button rules of the application stylesheet.
+    """
+
+    height: int
+    button_size: QSize
+    icon_size: QSize
+    hover_color: QColor
+    pressed_color: QColor
+    close_hover_color: QColor
+    close_pressed_color: QColor
+    procedural_glyphs: bool
+    glyph_color: QColor
+    close_active_glyph_color: QColor
+    stylesheet: str
+
+
+@lru_cache(maxsize=None)
+def compileTitleBarTheme(theme: TitleBarTheme) -> CompiledTitleBarTheme:
+    """
+    Compile a theme, once per process and theme.
+
+    Args:
+        theme (TitleBarTheme): The theme to compile.
+
+    Returns:
+        CompiledTitleBarTheme: The compiled theme.
+    """
+    return CompiledTitleBarTheme(
+        height=theme.height,
+        button_size=QSize(theme.button_width, theme.button_height),
+        icon_size=QSize(theme.icon_size, theme.icon_size),
+        hover_color=QColor(theme.hover_color),
+        pressed_color=QColor(theme.pressed_color),
+        close_hover_color=QColor(theme.close_hover_color),
+        close_pressed_color=QColor(theme.close_pressed_color),
+        procedural_glyphs=theme.procedural_glyphs,
+        glyph_color=QColor(theme.glyph_color),
+        close_active_glyph_color=QColor(theme.close_active_glyph_color),
+        stylesheet=_STYLESHEET.format(
+            hover=theme.hover_color,
+            pressed=theme.pressed_color,
+            close_hover=theme.close_hover_color,
+            close_pressed=theme.close_pressed_color,
+        ),
+    )
+
+
+_theme = TitleBarTheme()
+_compiled = compileTitleBarTheme(_theme)
+_themed_widgets: "WeakSet[QWidget]" = WeakSet()
+
+
+def titleBarTheme() -> TitleBarTheme:
+    """
+    Get the current title bar theme.
+
+    Returns:
+        TitleBarTheme: The current theme.
+    """
+    return _theme
+
+
+def compiledTitleBarTheme() -> CompiledTitleBarTheme:
+    """
+    Get the current title bar theme in compiled form.
+
+    Returns:
+        CompiledTitleBarTheme: The current compiled theme.
+    """
+    return _compiled
+
+
+def addThemedWidget(widget: QWidget) -> None:
+    """
+    Apply the current theme to a widget now and on every theme change.
+
+    The widget must have an ``applyTitleBarTheme(theme)`` method. It is
+    tracked weakly, and the theme's stylesheet is installed in the
+    application if it is missing there.
+
+    Args:
+        widget (QWidget): The widget to theme, such as a title bar button.
+    """
+    _themed_widgets.add(widget)
+    installTitleBarStyleSheet()
+    widget.applyTitleBarTheme(_compiled)  # type: ignore[attr-defined]
+
+
+def installTitleBarStyleSheet() -> None:
+    """
+    Install the stylesheet of the current theme in the application.
+
+    The theme is kept as a section in front of the application's own rules,
+    which therefore win over it. The section is only replaced when the theme
+    changes or the application replaced its stylesheet, so this is a string
+    lookup otherwise.
+    """
+    app = QApplication.instance()
+    if app is None:
+        return
+    section = f"{_BEGIN}{_compiled.stylesheet}{_END}"
+    current = app.styleSheet()  # type: ignore[attr-defined]
+    if current.startswith(section):
+        return
+    begin = current.find(_BEGIN)
+    end = current.find(_END, begin)
+    if begin != -1 and end != -1:
+        current = current[:begin] + current[end + len(_END) :]
+    app.setStyleSheet(section + current)  # type: ignore[attr-defined]
+
+
+def setTitleBarTheme(theme: TitleBarTheme) -> None:
+    """
+    Set the title bar theme of all windows, existing and future.
+
+    Args:
+        theme (TitleBarTheme): The new theme.
+    """
+    global _theme, _compiled
+    _theme = theme
+    _compiled = compileTitleBarTheme(theme)
+    installTitleBarStyleSheet()
+    for widget in list(_themed_widgets):
+        widget.applyTitleBarTheme(_compiled)  # type: ignore[attr-defined]
@@ -0,0 +1,211 @@
+"""
+Cached window shapes for Cute windows.
+
+A window shape is applied as a mask, which has to match the window size, so a
+live resize needs a new mask for every size it passes through. Building a mask
+from scratch for every size, for instance by rasterizing a rounded rectangle
+into a bitmap, costs time proportional to the window area. The shapes in this
+module keep the masks of recent sizes in a bounded LRU, and
+:class:`RoundedCorners` builds new sizes from four corner pieces that are
+computed once per radius: the window rectangle, whose straight edges need no
+work, minus the translated corners. The cost of a new size therefore depends
+on the corner radius only, not on the window size.
+
+Masks are cached per exact size rather than per size bucket: a mask built for a
+larger bucket cannot be trimmed to the real size without cutting off its right
+and bottom corners. During a live resize each new size is a cache miss,
+which costs a few region operations per corner for :class:`RoundedCorners`,
+and the LRU stays within its capacity.
+
+Example:
+    >>> window = CuteWindow()
+    >>> window.setWindowShape(RoundedCorners(10))
+"""
+
+from abc import ABC, abstractmethod
+from collections import OrderedDict
+from functools import lru_cache
+from math import ceil, sqrt
+from typing import Callable, Dict, Tuple
+
+from PySide6.QtCore import QSize, Qt
+from PySide6.QtGui import QPainterPath, QRegion
+
+
+class WindowShape(ABC):
+    """
+    Abstract base class of window shapes, with a cache of masks per window size.
+
+    Subclasses implement :meth:`build`.
+
+    Attributes:
+        capacity (int): Maximum number of cached masks.
+    """
+
+    def __init__(self, capacity: int = 64) -> None:
+        """
+        Initialize the shape.
+
+        Args:
+            capacity (int): Maximum number of cached masks, defaults to 64.
+        """
+        self.capacity = capacity
+        self._regions: "OrderedDict[Tuple[int, int], QRegion]" = OrderedDict()
+        self._hits = 0
+        self._misses = 0
+
+    def region(self, size: QSize) -> QRegion:
+        """
+        Get the mask of the shape for a window size, building it on first use.
+
+        Args:
+            size (QSize): The window size.
+
+        Returns:
+            QRegion: The cached mask.
+        """
+        key = (size.width(), size.height())
+        region = self._regions.get(key)
+        if region is not None:
+            self._hits += 1
+            self._regions.move_to_end(key)
+            return region
+
+        self._misses += 1
+        region = self._regions[key] = self.build(*key)
+        if len(self._regions) > self.capacity:
+            self._regions.popitem(last=False)
+        return region
+
+    @abstractmethod
+    def build(self, width: int, height: int) -> QRegion:
+        """
+        Build the mask of the shape for a window size.
+
+        Args:
+            width (int): The window width.
+            height (int): The window height.
+
+        Returns:
+            QRegion: The mask.
+        """
+
+    def statistics(self) -> Dict[str, int]:
+        """
+        Get the hit and miss counts of the mask cache.
+
+        Returns:
+            Dict[str, int]: The "hits" and "misses" so far and the cache "size".
+        """
+        return {"hits": self._hits, "misses": self._misses, "size": len(self._regions)}
+
+
+@lru_cache(maxsize=None)
+def cornerPieces(radius: int) -> Tuple[QRegion, QRegion, QRegion, QRegion]:
+    """
+    Get the regions cut off by rounded corners, once per radius.
+
+    Each region lies in a ``radius`` by ``radius`` square at the origin.
+
+    Args:
+        radius (int): The corner radius.
+
+    Returns:
+        Tuple[QRegion, QRegion, QRegion, QRegion]: The top-left, top-right,
+        bottom-left and bottom-right pieces.
+    """
+    pieces = [QRegion(), QRegion(), QRegion(), QRegion()]
+    for row in range(radius):
+        # Width cut off at the pixel center of this row
+        dy = radius - row - 0.5
+        cut = ceil(radius - sqrt(max(radius * radius - dy * dy, 0)) - 0.5)
+        if cut <= 0:
+            continue
+        bottom = radius - 1 - row
+        pieces[0] += QRegion(0, row, cut, 1)
+        pieces[1] += QRegion(radius - cut, row, cut, 1)
+        pieces[2] += QRegion(0, bottom, cut, 1)
+        pieces[3] += QRegion(radius - cut, bottom, cut, 1)
+    return pieces[0], pieces[1], pieces[2], pieces[3]
+
+
+class RoundedCorners(WindowShape):
+    """
+    Window shape with rounded corners.
+
+    Attributes:
+        radius (int): The corner radius.
+    """
+
+    def __init__(self, radius: int, capacity: int = 64) -> None:
+        """
+        Initialize the shape.
+
+        Args:
+            radius (int): The corner radius.
+            capacity (int): Maximum number of cached masks, defaults to 64.
+        """
+        super().__init__(capacity)
+        self.radius = radius
+
+    def build(self, width: int, height: int) -> QRegion:
+        """
+        Build the mask from the window rectangle and the cached corner pieces.
+
+        Args:
+            width (int): The window width.
+            height (int): The window height.
+
+        Returns:
+            QRegion: The mask.
+        """
+        radius = min(self.radius, width // 2, height // 2)
+        region = QRegion(0, 0, width, height)
+        if radius <= 0:
+            return region
+        top_left, top_right, bottom_left, bottom_right = cornerPieces(radius)
+        right = width - radius
+        bottom = height - radius
+        region -= top_left
+        region -= top_right.translated(right, 0)
+        region -= bottom_left.translated(0, bottom)
+        region -= bottom_right.translated(right, bottom)
+        return region
+
+
+class PathShape(WindowShape):
+    """
+    Window shape given by a painter path for each window size.
+
+    Attributes:
+        path (Callable[[int, int], QPainterPath]): Function returning the
+            outline of the window for a width and height.
+    """
+
+    def __init__(
+        self, path: Callable[[int, int], QPainterPath], capacity: int = 64
+    ) -> None:
+        """
+        Initialize the shape.
+
+        Args:
+            path (Callable[[int, int], QPainterPath]): Function returning the
+                outline of the window for a width and height.
+            capacity (int): Maximum number of cached masks, defaults to 64.
+        """
+        super().__init__(capacity)
+        self.path = path
+
+    def build(self, width: int, height: int) -> QRegion:
+        """
+        Build the mask by filling the outline of the window.
+
+        Args:
+            width (int): The window width.
+            height (int): The window height.
+
+        Returns:
+            QRegion: The mask.
+        """
+        polygon = self.path(width, height).toFillPolygon().toPolygon()
+        return QRegion(polygon, Qt.WindingFill)  # type: ignore
@@ -0,0 +1,18 @@
+"""Shared fixtures for CuteWindow tests."""
+
+import os
+import sys
+
+import pytest
+
+# Widget tests run without a display
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+
+
+@pytest.fixture(scope="session")
+def qapp():
+    """Provide the QApplication instance shared by all widget tests."""
+    from PySide6.QtWidgets import QApplication
+
+    app = QApplication.instance() or QApplication(sys.argv[:1])
+    yield app
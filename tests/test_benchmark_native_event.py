@@ -0,0 +1,110 @@
+"""
+Benchmarks of the Windows native event path, run through the Win32 simulator.
+
+Each scenario drives real windows with a synthetic message stream and reports
+the mean cost per message and the memory allocated while handling it. A
+scenario fails when it exceeds its budget, which can be configured with:
+
+- ``CUTEWINDOW_BENCHMARK_BUDGET_US``: mean microseconds per message.
+- ``CUTEWINDOW_BENCHMARK_ALLOC_BUDGET``: bytes still allocated per message
+  after the stream, to catch caches that grow with every message.
+"""
+
+import os
+import time
+import tracemalloc
+
+import pytest
+
+from cutewindow.platforms.windows import CuteDialog, CuteMainWindow, CuteWindow
+from cutewindow.platforms.windows.native_api import IS_WINDOWS
+from cutewindow.platforms.windows.simulator import Win32Simulator
+
+pytestmark = pytest.mark.skipif(
+    IS_WINDOWS, reason="the Win32 simulator replaces the stub loader"
+)
+
+BUDGET_US = float(os.environ.get("CUTEWINDOW_BENCHMARK_BUDGET_US", "250"))
+ALLOC_BUDGET = float(os.environ.get("CUTEWINDOW_BENCHMARK_ALLOC_BUDGET", "64"))
+
+WINDOW_CLASSES = [CuteWindow, CuteMainWindow, CuteDialog]
+
+
+def _hitTestSweep(simulator, window):
+    """Sweep the cursor across the title bar and the window borders."""
+    width, height = window.width(), window.height()
+    title_bar_height = window._title_bar.height()
+    points = [(x, y) for x in range(0, width, 8) for y in (2, title_bar_height // 2)]
+    points += [(1, y) for y in range(0, height, 8)]
+    points += [(width - 2, y) for y in range(0, height, 8)]
+    simulator.hitTestSweep(window, points)
+
+
+def _drag(simulator, window):
+    """Drag the window across the monitor."""
+    left, top, _, _ = simulator.window(window).rect
+    for step in range(200):
+        simulator.move(window, left + step, top + step // 2)
+
+
+def _maximizeCycles(simulator, window):
+    """Maximize and restore the window repeatedly."""
+    for _ in range(50):
+        simulator.maximize(window)
+        simulator.restore(window)
+
+
+SCENARIOS = {
+    "hit-test-sweep": _hitTestSweep,
+    "drag": _drag,
+    "maximize-cycles": _maximizeCycles,
+}
+
+
+@pytest.fixture
+def simulator():
+    """Install the Win32 simulator for the duration of a test."""
+    with Win32Simulator() as simulator:
+        yield simulator
+
+
+@pytest.mark.parametrize("scenario", list(SCENARIOS))
+@pytest.mark.parametrize("window_class", WINDOW_CLASSES, ids=lambda c: c.__name__)
+def test_native_event_budget(qapp, simulator, record_property, window_class, scenario):
+    """Test that a message stream stays within its time and memory budget."""
+    window = window_class()
+    window.show()
+    qapp.processEvents()
+    simulator.addWindow(window)
+    run = SCENARIOS[scenario]
+
+    # Warm up the caches so the steady state is measured
+    run(simulator, window)
+
+    simulator.stats.messages = 0
+    start = time.perf_counter_ns()
+    run(simulator, window)
+    elapsed_ns = time.perf_counter_ns() - start
+    messages = simulator.stats.messages
+
+    tracemalloc.start()
+    try:
+        before, _ = tracemalloc.get_traced_memory()
+        tracemalloc.reset_peak()
+        run(simulator, window)
+        after, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    qapp.processEvents()
+    window.close()
+
+    per_message_us = elapsed_ns / messages / 1000
+    retained = (after - before) / messages
+    record_property("messages", messages)
+    record_property("us_per_message", round(per_message_us, 2))
+    record_property("peak_bytes", peak - before)
+    record_property("retained_bytes_per_message", round(retained, 1))
+    assert (
+        per_message_us <= BUDGET_US
+    ), f"{per_message_us:.2f} us/message over {messages} messages"
+    assert retained <= ALLOC_BUDGET, f"{retained:.1f} B/message retained"
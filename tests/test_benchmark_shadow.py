@@ -0,0 +1,98 @@
+"""
+Benchmark of the nine-slice shadow against ``QGraphicsDropShadowEffect``.
+
+A live resize is simulated by rendering a window at a range of sizes, once
+painting the cached nine-slice shadow and once with a drop shadow effect on
+the root widget. The nine-slice shadow must be faster by at least the factor
+in ``CUTEWINDOW_BENCHMARK_SHADOW_SPEEDUP``.
+"""
+
+import os
+import time
+
+from PySide6.QtCore import QRect, Qt
+from PySide6.QtGui import QColor, QImage, QPainter
+from PySide6.QtWidgets import QGraphicsDropShadowEffect, QWidget
+
+from cutewindow.shadow import NineSliceShadow
+
+SPEEDUP = float(os.environ.get("CUTEWINDOW_BENCHMARK_SHADOW_SPEEDUP", "2"))
+
+RADIUS = 16
+SIZES = [(400 + step * 20, 300 + step * 15) for step in range(30)]
+
+
+class _Content(QWidget):
+    """Window content, a plain opaque rectangle."""
+
+    def paintEvent(self, event):
+        painter = QPainter(self)
+        painter.fillRect(self.rect(), QColor("#2b2b30"))
+
+
+class _NineSliceWindow(QWidget):
+    """Translucent window painting the nine-slice shadow around its content."""
+
+    def __init__(self):
+        super().__init__()
+        self.shadow = NineSliceShadow(RADIUS, QColor(0, 0, 0, 96))
+        self.content = _Content(self)
+
+    def resizeEvent(self, event):
+        self.content.setGeometry(self.rect().marginsRemoved(self.shadow.margins()))
+
+    def paintEvent(self, event):
+        painter = QPainter(self)
+        self.shadow.paint(painter, self.content.geometry())
+
+
+class _EffectWindow(QWidget):
+    """Translucent window with a drop shadow effect on its content."""
+
+    def __init__(self):
+        super().__init__()
+        self.content = _Content(self)
+        effect = QGraphicsDropShadowEffect(self.content)
+        effect.setBlurRadius(RADIUS * 2)
+        effect.setOffset(0, 0)
+        effect.setColor(QColor(0, 0, 0, 96))
+        self.content.setGraphicsEffect(effect)
+
+    def resizeEvent(self, event):
+        margins = RADIUS
+        self.content.setGeometry(
+            QRect(
+                margins,
+                margins,
+                self.width() - 2 * margins,
+                self.height() - 2 * margins,
+            )
+        )
+
+
+def _resize(window):
+    """Render the window at every size and return the mean time in seconds."""
+    start = time.perf_counter()
+    for width, height in SIZES:
+        window.resize(width, height)
+        image = QImage(width, height, QImage.Format_ARGB32_Premultiplied)
+        image.fill(Qt.transparent)
+        window.render(image)
+    return (time.perf_counter() - start) / len(SIZES)
+
+
+def test_nine_slice_shadow_beats_drop_shadow_effect(qapp):
+    """Test that resizing with the nine-slice shadow is cheaper than the effect."""
+    nine_slice = _NineSliceWindow()
+    effect = _EffectWindow()
+    # Warm up, so the template is blurred before the measurement
+    _resize(nine_slice)
+    _resize(effect)
+
+    nine_slice_s = _resize(nine_slice)
+    effect_s = _resize(effect)
+
+    assert nine_slice_s * SPEEDUP <= effect_s, (
+        f"nine-slice {nine_slice_s * 1e3:.2f} ms, "
+        f"drop shadow effect {effect_s * 1e3:.2f} ms per resize"
+    )
@@ -0,0 +1,95 @@
+"""Tests for the title bar drag gesture."""
+
+import gc
+from weakref import ref
+
+from PySide6.QtCore import QEvent, QPoint, QPointF, Qt
+from PySide6.QtGui import QMouseEvent
+from PySide6.QtWidgets import QApplication, QPushButton, QWidget
+
+from cutewindow.drag_gesture import DragGesture, DragState
+from cutewindow.platforms.windows.title_bar.TitleBar import TitleBar
+
+
+def _event(kind, x, y, buttons=Qt.LeftButton):
+    button = Qt.LeftButton if kind != QEvent.MouseMove else Qt.NoButton
+    pos = QPointF(x, y)
+    return QMouseEvent(kind, pos, pos, button, buttons, Qt.NoModifier)
+
+
+def _gesture():
+    widget = QWidget()
+    widget.resize(400, 28)
+    button = QPushButton(widget)
+    button.setGeometry(360, 0, 40, 28)
+    moves = []
+    gesture = DragGesture(widget, lambda window, pos: moves.append(pos))
+    return widget, gesture, moves
+
+
+def test_one_system_move_per_gesture(qapp):
+    """Test that a drag is handed over once, after the drag distance."""
+    widget, gesture, moves = _gesture()
+    distance = QApplication.startDragDistance()
+
+    assert gesture.press(_event(QEvent.MouseButtonPress, 10, 10))
+    assert not gesture.move(_event(QEvent.MouseMove, 10 + distance - 1, 10))
+    assert gesture.state() == DragState.PRESSED
+    assert gesture.move(_event(QEvent.MouseMove, 10 + distance, 10))
+    for x in range(20, 200):
+        assert not gesture.move(_event(QEvent.MouseMove, x, 10))
+    gesture.release(_event(QEvent.MouseButtonRelease, 200, 10))
+
+    assert moves == [QPoint(10 + distance, 10)]
+    assert gesture.statistics() == {"gestures": 1, "moves": 1, "fallback": 1}
+    assert gesture.state() == DragState.IDLE
+
+
+def test_presses_that_never_move(qapp):
+    """Test that children, other buttons and double clicks do not move."""
+    widget, gesture, moves = _gesture()
+
+    assert not gesture.press(_event(QEvent.MouseButtonPress, 370, 10))
+    gesture.move(_event(QEvent.MouseMove, 300, 10))
+    press = QMouseEvent(
+        QEvent.MouseButtonPress,
+        QPointF(10, 10),
+        QPointF(10, 10),
+        Qt.RightButton,
+        Qt.RightButton,
+        Qt.NoModifier,
+    )
+    assert not gesture.press(press)
+    gesture.move(_event(QEvent.MouseMove, 100, 10, Qt.RightButton))
+
+    gesture.press(_event(QEvent.MouseButtonPress, 10, 10))
+    gesture.doubleClick(_event(QEvent.MouseButtonDblClick, 10, 10))
+    gesture.move(_event(QEvent.MouseMove, 100, 10))
+
+    assert moves == []
+
+
+def test_windows_title_bar_buttons_are_interactive(qapp):
+    """Test that the Windows title bar does not drag from its buttons."""
+    title_bar = TitleBar(None)
+    title_bar.resize(400, 28)
+    title_bar.show()
+    close = title_bar.close_button.mapTo(title_bar, QPoint(5, 5))
+
+    assert title_bar.isInteractiveAt(close)
+    assert not title_bar.isInteractiveAt(QPoint(10, 10))
+    assert not title_bar.dragGesture().press(
+        _event(QEvent.MouseButtonPress, close.x(), close.y())
+    )
+
+
+def test_title_bar_is_freed_without_the_garbage_collector(qapp):
+    """Test that a title bar and its helpers form no reference cycle."""
+    gc.disable()
+    try:
+        title_bar = TitleBar(None)
+        freed = ref(title_bar)
+        del title_bar
+        assert freed() is None
+    finally:
+        gc.enable()
@@ -0,0 +1,85 @@
+"""Tests for the procedurally drawn title bar glyphs."""
+
+from itertools import combinations
+
+import pytest
+from PySide6.QtCore import QSize
+from PySide6.QtGui import QColor
+
+from cutewindow.glyphs import (
+    Glyph,
+    GlyphState,
+    glyphCacheStatistics,
+    glyphPixmap,
+)
+from cutewindow.platforms.windows.title_bar.TitleBar import (
+    MaximizeButtonIcon,
+    TitleBar,
+)
+from cutewindow.title_bar_theme import (
+    TitleBarTheme,
+    setTitleBarTheme,
+)
+
+WHITE = QColor("#ffffff")
+
+
+@pytest.mark.parametrize("ratio, device_size", [(1, 24), (1.25, 30), (2, 48)])
+def test_glyph_drawn_at_device_size(qapp, ratio, device_size):
+    """Test that glyphs are drawn at the exact device pixel size."""
+    pixmap = glyphPixmap(Glyph.CLOSE, QSize(24, 24), ratio, GlyphState.NORMAL, WHITE)
+
+    assert pixmap.width() == pixmap.height() == device_size
+    assert pixmap.devicePixelRatio() == ratio
+    center = device_size // 2
+    assert pixmap.toImage().pixelColor(center, center).alpha() > 0
+    assert pixmap.toImage().pixelColor(0, 0).alpha() == 0
+
+
+def test_glyph_drawn_once(qapp):
+    """Test that each glyph combination is drawn once and then reused."""
+    args = (Glyph.MINIMIZE, QSize(24, 24), 1.75, GlyphState.HOVER, WHITE)
+    first = glyphPixmap(*args)
+    before = glyphCacheStatistics()
+
+    for _ in range(10):
+        assert glyphPixmap(*args).cacheKey() == first.cacheKey()
+
+    after = glyphCacheStatistics()
+    assert after["misses"] == before["misses"]
+    assert after["hits"] == before["hits"] + 10
+
+
+def test_glyphs_differ(qapp):
+    """Test that every glyph is drawn with different pixels and drawn once."""
+    images = {
+        glyph: glyphPixmap(glyph, QSize(24, 24), 1, GlyphState.NORMAL, WHITE).toImage()
+        for glyph in Glyph
+    }
+
+    for first, second in combinations(Glyph, 2):
+        assert images[first] != images[second], f"{first} and {second} are equal"
+
+    pixmap = glyphPixmap(Glyph.CLOSE, QSize(24, 24), 1.5, GlyphState.NORMAL, WHITE)
+    assert (
+        glyphPixmap(Glyph.CLOSE, QSize(24, 24), 1.5, GlyphState.NORMAL, WHITE) is pixmap
+    )
+    assert (
+        glyphPixmap(Glyph.CLOSE, QSize(24, 24), 2, GlyphState.NORMAL, WHITE)
+        is not pixmap
+    )
+
+
+def test_procedural_theme_skips_icons(qapp):
+    """Test that title bars with procedural glyphs do not load icon files."""
+    try:
+        setTitleBarTheme(TitleBarTheme(procedural_glyphs=True))
+        title_bar = TitleBar(None)
+        assert title_bar.close_button.icon().isNull()
+
+        title_bar.set_maximize_button_icon(MaximizeButtonIcon.RESTORE)
+        assert title_bar.maximize_button.glyph() == Glyph.RESTORE
+        assert not title_bar.maximize_button.grab().toImage().isNull()
+    finally:
+        setTitleBarTheme(TitleBarTheme())
+    assert not title_bar.close_button.icon().isNull()
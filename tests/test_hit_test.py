@@ -0,0 +1,69 @@
+"""Tests for the title bar hit-test index."""
+
+from PySide6.QtWidgets import QHBoxLayout, QLineEdit, QPushButton, QWidget
+
+from cutewindow.hit_test import HitRegion, HitTestIndex
+
+
+def _make_window(qapp):
+    window = QWidget()
+    window.resize(400, 300)
+    title_bar = QWidget(window)
+    title_bar.setGeometry(0, 0, 400, 30)
+
+    layout = QHBoxLayout(title_bar)
+    layout.setContentsMargins(0, 0, 0, 0)
+    layout.setSpacing(0)
+    search = QLineEdit(title_bar)
+    search.setFixedWidth(100)
+    maximize = QPushButton(title_bar)
+    maximize.setFixedSize(40, 30)
+    layout.addWidget(search)
+    layout.addStretch()
+    layout.addWidget(maximize)
+    window.show()
+    qapp.processEvents()
+
+    index = HitTestIndex(title_bar)
+    index.addInteractiveWidget(maximize, HitRegion.MAXIMIZE_BUTTON)
+    index.setResizeBorders(4, 4)
+    return window, title_bar, search, maximize, index
+
+
+def test_regions(qapp):
+    """Test that points resolve to borders, buttons, caption and client area."""
+    window, title_bar, search, maximize, index = _make_window(qapp)
+
+    assert index.hitTest(1, 1) == HitRegion.TOP_LEFT
+    assert index.hitTest(399, 150) == HitRegion.RIGHT
+    assert index.hitTest(200, 299) == HitRegion.BOTTOM
+    assert index.hitTest(380, 15) == HitRegion.MAXIMIZE_BUTTON
+    assert index.hitTest(150, 15) == HitRegion.CAPTION
+    assert index.hitTest(200, 150) == HitRegion.CLIENT
+    assert index.hitTest(1, 150, resizable=False) == HitRegion.CLIENT
+
+    # Buttons are always interactive, other widgets must be registered
+    plain = QPushButton(title_bar)
+    plain.setGeometry(200, 0, 20, 30)
+    plain.show()
+    index.invalidate()
+    assert index.hitTest(210, 15) == HitRegion.INTERACTIVE
+    assert index.hitTest(50, 15) == HitRegion.CAPTION
+    index.addInteractiveWidget(search)
+    assert index.hitTest(50, 15) == HitRegion.INTERACTIVE
+
+
+def test_rebuilds_after_geometry_change(qapp):
+    """Test that the index follows title bar resizes and hidden widgets."""
+    window, title_bar, search, maximize, index = _make_window(qapp)
+    assert index.hitTest(380, 15) == HitRegion.MAXIMIZE_BUTTON
+
+    window.resize(600, 300)
+    title_bar.resize(600, 30)
+    qapp.processEvents()
+    assert index.hitTest(380, 15) == HitRegion.CAPTION
+    assert index.hitTest(580, 15) == HitRegion.MAXIMIZE_BUTTON
+
+    maximize.hide()
+    qapp.processEvents()
+    assert index.hitTest(580, 15) == HitRegion.CAPTION
@@ -0,0 +1,68 @@
+"""Tests for the process-wide icon cache."""
+
+import pytest
+from PySide6.QtCore import QSize
+
+from cutewindow.Icon import Icon
+from cutewindow.icon_cache import IconCache, icon_cache, resolutionVariants
+from cutewindow.platforms.windows.title_bar.TitleBar import (
+    MaximizeButtonIcon,
+    TitleBar,
+)
+from cutewindow.title_bar_resources import registerResources
+
+CLOSE = ":/icons/title-bar/close.png"
+MAXIMIZE = ":/icons/title-bar/maximize.png"
+RESTORE = ":/icons/title-bar/restore.png"
+
+
+@pytest.fixture(autouse=True)
+def resources(qapp):
+    """Register the title bar resources the icons are loaded from."""
+    registerResources()
+
+
+def test_lru_eviction_and_statistics(qapp):
+    """Test that the least recently used entry is evicted first."""
+    cache = IconCache(capacity=2)
+    cache.icon(CLOSE)
+    cache.icon(MAXIMIZE)
+    cache.icon(CLOSE)
+    cache.icon(RESTORE)
+    cache.icon(MAXIMIZE)
+
+    assert cache.statistics() == {
+        "hits": 1,
+        "misses": 4,
+        "evictions": 2,
+        "size": 2,
+        "capacity": 2,
+    }
+
+
+@pytest.mark.parametrize("ratio", [1.0, 2.0, 3.0])
+def test_icon_has_unscaled_variant_per_ratio(qapp, ratio):
+    """Test that icons hold a native pixmap for each shipped pixel ratio."""
+    icon = Icon(CLOSE)
+    pixmap = icon.pixmap(QSize(24, 24), ratio)
+
+    assert pixmap.devicePixelRatio() == ratio
+    assert pixmap.size() == QSize(24, 24) * ratio
+    assert len(resolutionVariants(CLOSE)) == 3
+
+
+def test_icons_and_title_bars_share_cache(qapp):
+    """Test that new title bars and state toggles reuse cached icons."""
+    icon_cache.invalidate()
+    Icon(CLOSE)
+    TitleBar(None)
+    misses = icon_cache.statistics()["misses"]
+
+    title_bar = TitleBar(None)
+    for _ in range(5):
+        title_bar.set_maximize_button_icon(MaximizeButtonIcon.RESTORE)
+        title_bar.set_maximize_button_icon(MaximizeButtonIcon.MAXIMIZE)
+
+    # Only the restore icon is new, toggling back reuses the cached icons
+    assert icon_cache.statistics()["misses"] == misses + 1
+    assert not Icon(CLOSE).isNull()
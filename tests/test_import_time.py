@@ -0,0 +1,105 @@
+"""Import-time checks for CuteWindow."""
+
+import os
+import subprocess
+import sys
+from typing import Dict
+
+import pytest
+
+PYWIN32_MODULES = {"win32con", "win32gui", "win32api", "pywintypes"}
+
+# Budget for ``import cutewindow`` in milliseconds
+IMPORT_BUDGET_MS = float(os.environ.get("CUTEWINDOW_IMPORT_BUDGET_MS", "20"))
+
+# Budget for importing the Windows native event path, Qt included, in milliseconds
+BACKEND_IMPORT_BUDGET_MS = float(
+    os.environ.get("CUTEWINDOW_BACKEND_IMPORT_BUDGET_MS", "500")
+)
+
+
+def _import_times(module: str) -> Dict[str, int]:
+    """
+    Import a module in a fresh interpreter with ``-X importtime``.
+
+    Returns:
+        Dict[str, int]: Cumulative import time in microseconds per module.
+    """
+    env = dict(os.environ, QT_QPA_PLATFORM="offscreen")
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+        capture_output=True,
+        text=True,
+        env=env,
+        check=True,
+    )
+    times = {}
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:") or "cumulative" in line:
+            continue
+        _, cumulative, name = line[len("import time:") :].split("|")
+        times[name.strip()] = int(cumulative)
+    return times
+
+
+def test_windows_backend_does_not_import_pywin32(record_property):
+    """Test that the Windows backend runs on ctypes without pywin32, in budget."""
+    module = "cutewindow.platforms.windows.native_event"
+    times = _import_times(module)
+
+    assert not PYWIN32_MODULES & times.keys()
+    elapsed_ms = times[module] / 1000
+    record_property("backend_import_ms", round(elapsed_ms, 1))
+    assert (
+        elapsed_ms <= BACKEND_IMPORT_BUDGET_MS
+    ), f"{module} imported in {elapsed_ms:.1f} ms"
+
+
+def test_title_bar_resources_registered_lazily():
+    """Test that importing the title bar does not register its resources."""
+    code = (
+        "from PySide6.QtCore import QFile\n"
+        "import cutewindow.platforms.windows.title_bar.TitleBar\n"
+        "assert not QFile.exists(':/icons/title-bar/close.png')\n"
+        "from cutewindow.title_bar_resources import "
+        "registerResources\n"
+        "registerResources()\n"
+        "assert QFile.exists(':/icons/title-bar/close.png')\n"
+    )
+    env = dict(os.environ, QT_QPA_PLATFORM="offscreen")
+    subprocess.run([sys.executable, "-c", code], env=env, check=True)
+
+
+def test_package_import_is_lazy():
+    """Test that importing the package loads no backend and stays in budget."""
+    times = _import_times("cutewindow")
+
+    assert not any(name.startswith("cutewindow.platforms") for name in times)
+    assert not any(name.startswith("PySide6") for name in times)
+    elapsed_ms = times["cutewindow"] / 1000
+    assert elapsed_ms <= IMPORT_BUDGET_MS, f"cutewindow imported in {elapsed_ms:.1f} ms"
+
+
+@pytest.fixture
+def windows_backend(qapp, monkeypatch):
+    """Force the Windows backend and forget its classes afterwards."""
+    from cutewindow.platform_factory import BACKEND_ENV, reset_backend_cache
+
+    monkeypatch.setenv(BACKEND_ENV, "windows")
+    reset_backend_cache()
+    yield
+    monkeypatch.delenv(BACKEND_ENV)
+    reset_backend_cache()
+
+
+def test_lazy_exports_resolve_to_backend_classes(windows_backend):
+    """Test that the lazy exports are the classes of the platform backend."""
+    import cutewindow
+    from cutewindow import platforms
+    from cutewindow.platforms.windows.CuteWindow import CuteWindow
+
+    assert cutewindow.CuteWindow is platforms.CuteWindow is CuteWindow
+    assert set(cutewindow.__all__) <= set(dir(cutewindow))
+    # Resolved classes stay in the factory cache, which the fixture resets
+    assert not set(cutewindow.__all__) & vars(cutewindow).keys()
+    assert not set(platforms.__all__) & vars(platforms).keys()
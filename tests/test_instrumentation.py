@@ -0,0 +1,73 @@
+"""Tests for the native message instrumentation."""
+
+from ctypes import addressof
+from ctypes.wintypes import MSG
+
+import pytest
+from PySide6.QtCore import QByteArray
+from PySide6.QtWidgets import QWidget
+
+from cutewindow.platforms.windows import instrumentation
+from cutewindow.platforms.windows.constants import WM_SIZE
+from cutewindow.platforms.windows.native_event import _nativeEvent
+
+WM_NULL = 0x0000
+EVENT_TYPE = QByteArray(b"windows_generic_MSG")
+
+
+@pytest.fixture
+def recording():
+    """Enable instrumentation for the duration of a test."""
+    instrumentation.reset()
+    instrumentation.setEnabled(True)
+    yield
+    instrumentation.setEnabled(False)
+    instrumentation.reset()
+
+
+def _send(widget, hWnd, message_id):
+    msg = MSG(hWnd, message_id, 0, 0)
+    return _nativeEvent(widget, EVENT_TYPE, addressof(msg))
+
+
+def test_records_messages_per_window(qapp, recording):
+    """Test that messages are counted per window and message id."""
+    widget = QWidget()
+    for _ in range(3):
+        _send(widget, 0x10, WM_SIZE)
+    _send(widget, 0x10, WM_NULL)
+    _send(widget, 0x20, WM_NULL)
+
+    snapshot = instrumentation.snapshot()
+    assert set(snapshot) == {0x10, 0x20}
+
+    size = snapshot[0x10][WM_SIZE]
+    assert size["name"] == "WM_SIZE"
+    assert size["count"] == 3
+    assert size["unhandled"] == 3
+    assert sum(size["histogram"]) == 3
+    assert len(size["histogram"]) == len(instrumentation.LATENCY_BUCKETS_US) + 1
+    assert snapshot[0x20][WM_NULL]["count"] == 1
+
+
+def test_disabled_records_nothing(qapp):
+    """Test that nothing is recorded while instrumentation is off."""
+    instrumentation.reset()
+    assert not instrumentation.isEnabled()
+
+    _send(QWidget(), 0x10, WM_SIZE)
+
+    assert instrumentation.snapshot() == {}
+
+
+def test_latency_buckets():
+    """Test that samples land in the first bucket that bounds them."""
+    stats = instrumentation.MessageStats()
+    stats.record(True, 10_000)
+    stats.record(False, 30_000)
+    stats.record(True, 60_000_000)
+
+    assert stats.histogram[0] == 1
+    assert stats.histogram[2] == 1
+    assert stats.histogram[-1] == 1
+    assert stats.asDict(WM_SIZE)["handled"] == 2
@@ -0,0 +1,110 @@
+"""Tests for the Linux backend under the offscreen or xcb Qt platform."""
+
+import os
+import subprocess
+import sys
+
+import pytest
+from PySide6.QtCore import QEvent, QPointF, Qt
+from PySide6.QtGui import QMouseEvent
+from PySide6.QtWidgets import QApplication
+
+from cutewindow.platform_factory import get_backend
+from cutewindow.platforms.linux import CuteDialog, CuteMainWindow, CuteWindow
+from cutewindow.platforms.linux.frame import RESIZE_BORDER, EdgeModel
+
+
+def _send(window, kind, x, y, buttons=Qt.NoButton):
+    button = Qt.LeftButton if kind == QEvent.MouseButtonPress else Qt.NoButton
+    pos = QPointF(x, y)
+    event = QMouseEvent(kind, pos, pos, button, buttons, Qt.NoModifier)
+    return QApplication.sendEvent(window.windowHandle(), event)
+
+
+def test_edge_model():
+    """Test that the cached edge model finds edges and corners."""
+    model = EdgeModel(border=6)
+    model.resize(400, 300)
+
+    assert model.edgesAt(200, 150) == Qt.Edge(0)
+    assert model.edgesAt(2, 150) == Qt.LeftEdge
+    assert model.edgesAt(397, 298) == Qt.RightEdge | Qt.BottomEdge
+    assert model.edgesAt(200, 0) == Qt.TopEdge
+    model.enabled = False
+    assert model.edgesAt(2, 2) == Qt.Edge(0)
+
+
+@pytest.mark.parametrize("cls", [CuteWindow, CuteMainWindow, CuteDialog])
+def test_edges_resize_through_window_manager(qapp, cls):
+    """Test that border presses start a system resize and set resize cursors."""
+    window = cls()
+    window.show()
+    frame = window.frameController()
+
+    _send(window, QEvent.MouseMove, 1, 400)
+    assert window.cursor().shape() == Qt.SizeHorCursor
+    _send(window, QEvent.MouseMove, 799, 799)
+    assert window.cursor().shape() == Qt.SizeFDiagCursor
+    _send(window, QEvent.MouseMove, 400, 400)
+    assert window.cursor().shape() == Qt.ArrowCursor
+
+    _send(window, QEvent.MouseButtonPress, 400, 400, Qt.LeftButton)
+    assert frame.statistics()["resizes"] == 0
+    _send(window, QEvent.MouseButtonPress, 800 - RESIZE_BORDER, 400, Qt.LeftButton)
+    assert frame.statistics()["resizes"] == 1
+    window.close()
+
+
+def test_window_cursor_restored_after_borders(qapp):
+    """Test that leaving the borders restores the cursor the window had."""
+    window = CuteWindow()
+    window.setCursor(Qt.PointingHandCursor)
+    window.show()
+
+    _send(window, QEvent.MouseMove, 1, 400)
+    assert window.cursor().shape() == Qt.SizeHorCursor
+    _send(window, QEvent.MouseMove, 1, 1)
+    assert window.cursor().shape() == Qt.SizeFDiagCursor
+    _send(window, QEvent.MouseMove, 400, 400)
+    assert window.cursor().shape() == Qt.PointingHandCursor
+
+    window.setCursor(Qt.IBeamCursor)
+    _send(window, QEvent.MouseMove, 799, 400)
+    window.setWindowState(Qt.WindowMaximized)
+    assert window.cursor().shape() == Qt.IBeamCursor
+    window.close()
+
+
+def test_linux_title_bar_does_not_import_windows_backend():
+    """Test that the Linux backend loads nothing of the Windows backend."""
+    code = (
+        "import sys\n"
+        "import cutewindow.platforms.linux\n"
+        "loaded = [m for m in sys.modules if m.startswith('cutewindow.platforms.')]\n"
+        "assert not [m for m in loaded if '.windows' in m], loaded\n"
+    )
+    env = dict(os.environ, QT_QPA_PLATFORM="offscreen")
+    subprocess.run([sys.executable, "-c", code], env=env, check=True)
+
+
+def test_maximized_and_non_resizable_windows_have_no_edges(qapp):
+    """Test that the borders are disabled when they cannot resize the window."""
+    window = CuteWindow()
+    window.show()
+    model = window.frameController().model
+
+    window.setWindowState(Qt.WindowMaximized)
+    assert not model.enabled
+    window.setWindowState(Qt.WindowNoState)
+    assert model.enabled
+
+    window.setNonResizable()
+    assert not window.isResizable()
+    assert not model.enabled
+    assert window.titleBar().maximize_button.isHidden()
+    window.close()
+
+
+def test_linux_backend_registered():
+    """Test that the platform factory knows the Linux backend."""
+    assert get_backend("linux").CuteWindow is CuteWindow
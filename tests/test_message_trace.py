@@ -0,0 +1,86 @@
+"""Tests for native message trace recording and replay."""
+
+import pytest
+
+from cutewindow.platforms.windows import CuteWindow, message_trace
+from cutewindow.platforms.windows.constants import WM_NCHITTEST
+from cutewindow.platforms.windows.native_api import IS_WINDOWS
+from cutewindow.platforms.windows.simulator import Win32Simulator
+
+pytestmark = pytest.mark.skipif(
+    IS_WINDOWS, reason="replay runs through the Win32 simulator"
+)
+
+
+@pytest.fixture
+def simulator():
+    """Install the Win32 simulator for the duration of a test."""
+    with Win32Simulator() as simulator:
+        yield simulator
+
+
+def _window(qapp, simulator):
+    window = CuteWindow()
+    window.show()
+    qapp.processEvents()
+    simulator.addWindow(window)
+    return window
+
+
+def test_record_and_replay(qapp, simulator, tmp_path):
+    """Test that a replayed trace reproduces the recorded results."""
+    path = tmp_path / "cutewindow.trace"
+    window = _window(qapp, simulator)
+    caption_y = window._title_bar.height() // 2
+
+    message_trace.startRecording(path)
+    try:
+        simulator.hitTestSweep(window, [(300, caption_y), (1, 400), (400, 400)])
+        simulator.maximize(window)
+        simulator.hitTestSweep(window, [(1, 400)])
+        simulator.restore(window)
+        simulator.move(window, 50, 60)
+    finally:
+        message_trace.stopRecording()
+    window.close()
+
+    replay_window = _window(qapp, simulator)
+    with message_trace.TraceReplayer(path) as replayer:
+        assert len(replayer) == 12
+        results = replayer.replay(replay_window, simulator)
+    replay_window.close()
+
+    assert len(results) == 12
+    for record, result in results:
+        assert result == (record.handled, record.result)
+    hit_tests = [record for record, _ in results if record.message == WM_NCHITTEST]
+    assert [record.maximized for record in hit_tests] == [False] * 3 + [True]
+
+
+def test_ring_buffer_keeps_newest_records(qapp, simulator, tmp_path):
+    """Test that a full ring buffer overwrites the oldest records."""
+    path = tmp_path / "cutewindow.trace"
+    window = _window(qapp, simulator)
+
+    message_trace.startRecording(path, capacity=4)
+    try:
+        simulator.hitTestSweep(window, [(x, 400) for x in range(10)])
+    finally:
+        message_trace.stopRecording()
+    window.close()
+
+    with message_trace.TraceReplayer(path) as replayer:
+        records = list(replayer)
+    assert replayer.count == 10
+    assert len(records) == 4
+    timestamps = [record.timestamp_ns for record in records]
+    assert timestamps == sorted(timestamps)
+
+
+def test_rejects_foreign_files(tmp_path):
+    """Test that files that are not traces are rejected."""
+    path = tmp_path / "not.trace"
+    path.write_bytes(b"x" * 64)
+
+    with pytest.raises(ValueError):
+        message_trace.TraceReplayer(path)
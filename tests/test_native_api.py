@@ -0,0 +1,26 @@
+"""Tests for the Windows native bindings."""
+
+import pytest
+
+from cutewindow.platforms.windows import native_api
+
+pytestmark = pytest.mark.skipif(
+    native_api.IS_WINDOWS, reason="stub loader is only used outside of Windows"
+)
+
+
+def test_stub_functions_keep_prototypes():
+    """Test that bound stub functions carry the declared prototypes."""
+    assert native_api.IsZoomed.argtypes == (native_api.wintypes.HWND,)
+    assert native_api.IsZoomed.restype is native_api.wintypes.BOOL
+
+
+def test_stub_implementation():
+    """Test that stub functions call installed implementations."""
+    assert native_api.GetDpiForWindow(1) == 0
+
+    native_api.stub_loader.implement("user32", "GetDpiForWindow", lambda hWnd: 144)
+    try:
+        assert native_api.GetDpiForWindow(1) == 144
+    finally:
+        native_api.stub_loader.implement("user32", "GetDpiForWindow", None)
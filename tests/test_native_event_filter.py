@@ -0,0 +1,95 @@
+"""Tests for the application-wide native event filter."""
+
+from ctypes import addressof
+from ctypes.wintypes import MSG
+
+import pytest
+from PySide6.QtCore import QByteArray
+from PySide6.QtWidgets import QWidget
+
+from cutewindow.platforms.windows import CuteWindow, native_event_filter
+from cutewindow.platforms.windows.constants import (
+    HTCAPTION,
+    WM_NCDESTROY,
+    WM_NCHITTEST,
+)
+from cutewindow.platforms.windows.native_api import IS_WINDOWS
+from cutewindow.platforms.windows.simulator import Win32Simulator, _packPoint
+
+pytestmark = pytest.mark.skipif(
+    IS_WINDOWS, reason="messages are simulated outside of Windows"
+)
+
+WINDOW_MESSAGE = QByteArray(b"windows_generic_MSG")
+
+
+@pytest.fixture
+def event_filter(qapp):
+    """Install the application filter for the duration of a test."""
+    with Win32Simulator() as simulator:
+        yield native_event_filter.installNativeEventFilter(), simulator
+    native_event_filter.removeNativeEventFilter()
+
+
+def _filter(event_filter, hWnd, message_id, lParam=0, event_type=WINDOW_MESSAGE):
+    msg = MSG(hWnd, message_id, 0, lParam)
+    return event_filter.nativeEventFilter(event_type, addressof(msg))
+
+
+def test_overrides_detached_per_window(qapp, event_filter):
+    """Test that only windows taken over by the filter lose their override."""
+    event_filter, simulator = event_filter
+    window = CuteWindow()
+    other = CuteWindow()
+    window.show()
+    other.show()
+    qapp.processEvents()
+    hWnd = simulator.addWindow(window)
+
+    assert event_filter.registerWindow(hWnd) is window
+    assert type(window).nativeEvent is QWidget.nativeEvent
+    assert isinstance(window, CuteWindow)
+    assert CuteWindow.nativeEvent is not QWidget.nativeEvent
+    assert type(other) is CuteWindow
+
+    native_event_filter.removeNativeEventFilter()
+    assert type(window) is CuteWindow
+    assert native_event_filter.nativeEventFilter() is None
+    window.close()
+    other.close()
+
+
+def test_unmapped_handles_are_not_remembered(event_filter):
+    """Test that a handle Qt does not know yet is looked up again later."""
+    event_filter, _ = event_filter
+    assert event_filter.registerWindow(0x7FFF0000) is None
+    assert 0x7FFF0000 not in event_filter.windows
+
+
+def test_filter_dispatches_to_cute_windows(qapp, event_filter):
+    """Test that the filter handles messages of registered windows only."""
+    event_filter, simulator = event_filter
+    window = CuteWindow()
+    window.show()
+    qapp.processEvents()
+    hWnd = simulator.addWindow(window)
+    other = QWidget()
+    other.show()
+    caption = _packPoint(window.x() + 300, window.y() + 10, 1.0)
+
+    assert _filter(event_filter, hWnd, WM_NCHITTEST, caption) == (True, HTCAPTION)
+    assert event_filter.windows[hWnd] is window
+    assert _filter(event_filter, int(other.winId()), WM_NCHITTEST) == (False, 0)
+    assert event_filter.windows[int(other.winId())] is None
+
+    # Dispatcher passes are ignored, and handles are dropped on WM_NCDESTROY
+    dispatched = QByteArray(b"windows_dispatcher_MSG")
+    assert _filter(event_filter, hWnd, WM_NCHITTEST, caption, dispatched) == (
+        False,
+        0,
+    )
+    _filter(event_filter, hWnd, WM_NCDESTROY)
+    assert hWnd not in event_filter.windows
+    assert type(window) is CuteWindow
+    window.close()
+    other.close()
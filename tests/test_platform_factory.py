@@ -0,0 +1,88 @@
+"""Tests for the backend registry of the platform factory."""
+
+import sys
+import types
+from importlib.metadata import EntryPoint
+
+import pytest
+
+import cutewindow
+from cutewindow import platform_factory, platforms
+from cutewindow.platform_factory import (
+    BACKEND_ENV,
+    ENTRY_POINT_GROUP,
+    get_backend,
+    get_cute_window_class,
+    get_title_bar_class,
+    register_backend,
+    reset_backend_cache,
+)
+
+
+class _Window:
+    pass
+
+
+class _TitleBar:
+    pass
+
+
+@pytest.fixture
+def headless(monkeypatch):
+    """Register a fake headless backend and restore the registry afterwards."""
+    monkeypatch.setattr(platform_factory, "_backends", dict(platform_factory._backends))
+    module = types.ModuleType("headless_backend")
+    module.CuteWindow = _Window  # type: ignore[attr-defined]
+    module.TitleBar = _TitleBar  # type: ignore[attr-defined]
+    monkeypatch.setitem(sys.modules, "headless_backend", module)
+    register_backend("headless", "headless_backend")
+    yield module
+    reset_backend_cache()
+
+
+def test_backend_forced_by_environment(headless, monkeypatch):
+    """Test that CUTEWINDOW_BACKEND selects a registered backend."""
+    monkeypatch.setenv(BACKEND_ENV, "headless")
+    reset_backend_cache()
+
+    assert get_backend() is headless
+    assert get_cute_window_class() is _Window
+    assert get_title_bar_class() is _TitleBar
+
+
+def test_classes_resolved_once(headless, monkeypatch):
+    """Test that classes are cached after the first lookup."""
+    monkeypatch.setenv(BACKEND_ENV, "headless")
+    reset_backend_cache()
+    get_cute_window_class()
+
+    monkeypatch.setenv(BACKEND_ENV, "missing")
+    assert get_cute_window_class() is _Window
+
+
+def test_lazy_exports_follow_backend_cache_reset(headless, monkeypatch):
+    """Test that the package exports are resolved again after a cache reset."""
+    other = types.ModuleType("other_backend")
+    other.CuteWindow = type("_OtherWindow", (), {})  # type: ignore[attr-defined]
+    monkeypatch.setitem(sys.modules, "other_backend", other)
+    register_backend("other", "other_backend")
+    monkeypatch.setenv(BACKEND_ENV, "headless")
+    reset_backend_cache()
+    assert cutewindow.CuteWindow is platforms.CuteWindow is _Window
+
+    monkeypatch.setenv(BACKEND_ENV, "other")
+    reset_backend_cache()
+    assert cutewindow.CuteWindow is platforms.CuteWindow is other.CuteWindow
+
+
+def test_backend_from_entry_point(headless, monkeypatch):
+    """Test that backends declared as entry points are found on first use."""
+    entry_point = EntryPoint("plugin", "headless_backend", ENTRY_POINT_GROUP)
+    monkeypatch.setattr(platform_factory, "_entry_points_loaded", False)
+    monkeypatch.setattr(
+        platform_factory, "entry_points", lambda: {ENTRY_POINT_GROUP: [entry_point]}
+    )
+
+    assert get_backend("plugin") is headless
+    with pytest.raises(NotImplementedError):
+        get_backend("missing")
@@ -0,0 +1,44 @@
+"""Tests for the cached nine-slice drop shadow."""
+
+from PySide6.QtCore import Qt
+from PySide6.QtGui import QColor, QImage, QPainter
+
+from cutewindow.shadow import NineSliceShadow, shadowCacheStatistics
+
+
+def _render(shadow, width, height):
+    image = QImage(width, height, QImage.Format_ARGB32_Premultiplied)
+    image.fill(Qt.transparent)
+    painter = QPainter(image)
+    content = image.rect().marginsRemoved(shadow.margins())
+    shadow.paint(painter, content)
+    painter.end()
+    return image
+
+
+def test_shadow_frame_around_content(qapp):
+    """Test that the shadow fades outwards and leaves the content alone."""
+    shadow = NineSliceShadow(radius=12, color=QColor(0, 0, 0, 160))
+    image = _render(shadow, 200, 120)
+
+    assert image.pixelColor(100, 60).alpha() == 0
+    assert image.pixelColor(13, 60).alpha() == 0
+    alphas = [image.pixelColor(x, 60).alpha() for x in range(12)]
+    assert alphas == sorted(alphas) and alphas[-1] > alphas[0]
+    # Edges and corners are symmetric, up to the rounding of the blur
+    for a, b in [((5, 60), (194, 60)), ((100, 5), (100, 114)), ((8, 8), (191, 111))]:
+        alpha = image.pixelColor(*a).alpha()
+        assert alpha > 0
+        assert abs(alpha - image.pixelColor(*b).alpha()) <= 2
+
+
+def test_resizing_reuses_the_template(qapp):
+    """Test that the template is blurred once and only re-tiled on resize."""
+    shadow = NineSliceShadow(radius=10, color=QColor(20, 30, 40, 120))
+    _render(shadow, 100, 100)
+    misses = shadowCacheStatistics()["misses"]
+
+    for size in range(100, 600, 25):
+        _render(shadow, size, size // 2 + 50)
+
+    assert shadowCacheStatistics()["misses"] == misses
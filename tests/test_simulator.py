@@ -0,0 +1,85 @@
+"""Tests for the simulated Win32 layer."""
+
+import pytest
+from PySide6.QtCore import Qt
+
+from cutewindow.platforms.windows import CuteDialog, CuteWindow
+from cutewindow.platforms.windows.constants import HTCAPTION, HTLEFT
+from cutewindow.platforms.windows.native_api import IS_WINDOWS
+from cutewindow.platforms.windows.simulator import Win32Simulator
+
+pytestmark = pytest.mark.skipif(
+    IS_WINDOWS, reason="the Win32 simulator replaces the stub loader"
+)
+
+
+def test_simulated_hit_test_and_maximize(qapp):
+    """Test that simulated messages drive the real native event handlers."""
+    with Win32Simulator() as simulator:
+        window = CuteWindow()
+        window.show()
+        qapp.processEvents()
+        simulator.addWindow(window)
+
+        caption_y = window._title_bar.height() // 2
+        caption, left = simulator.hitTestSweep(window, [(300, caption_y), (1, 400)])
+        assert caption == (True, HTCAPTION)
+        assert left == (True, HTLEFT)
+
+        simulator.maximize(window)
+        qapp.processEvents()
+        assert window._window_state.maximized
+        state = window._window_state
+        assert state.window_rect == state.monitor_rect
+        assert simulator.stats.calls["SetWindowPos"] == 1
+        window.close()
+
+
+def test_drag_within_monitor_makes_no_monitor_queries(qapp):
+    """Test that the monitor is only queried when the window may leave it."""
+    with Win32Simulator() as simulator:
+        window = CuteWindow()
+        window.show()
+        qapp.processEvents()
+        simulator.addWindow(window, (100, 100, 900, 900))
+        simulator.move(window, 100, 100)
+        queries = simulator.stats.calls["MonitorFromWindow"]
+
+        for x in range(100, 600, 10):
+            simulator.move(window, x, 100)
+        assert simulator.stats.calls["MonitorFromWindow"] == queries
+
+        simulator.move(window, 1700, 100)
+        assert simulator.stats.calls["MonitorFromWindow"] == queries + 1
+        window.close()
+
+
+@pytest.mark.parametrize("cls", [CuteWindow, CuteDialog])
+def test_native_parts_created_on_first_show(qapp, cls):
+    """Test that hidden windows have no native handle, styling or title bar."""
+    with Win32Simulator() as simulator:
+        window = cls()
+        window.setNonResizable()
+        assert window._title_bar is None
+        assert not window.isResizable()
+        assert not window.testAttribute(Qt.WA_WState_Created)
+        assert "DwmExtendFrameIntoClientArea" not in simulator.stats.calls
+
+        window.show()
+        assert window.testAttribute(Qt.WA_WState_Created)
+        assert simulator.stats.calls["DwmExtendFrameIntoClientArea"] == 1
+        assert window.titleBar().width() == window.width()
+        assert window.titleBar().maximize_button.isHidden()
+
+        window.hide()
+        window.show()
+        assert simulator.stats.calls["DwmExtendFrameIntoClientArea"] == 1
+        window.close()
+
+
+def test_title_bar_created_on_demand(qapp):
+    """Test that asking for the title bar does not create the native handle."""
+    window = CuteWindow()
+    title_bar = window.titleBar()
+    assert window.titleBar() is title_bar
+    assert not window.testAttribute(Qt.WA_WState_Created)
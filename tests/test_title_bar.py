@@ -0,0 +1,133 @@
+"""Tests for the Windows title bar widgets."""
+
+from PySide6.QtCore import Qt
+from PySide6.QtGui import QColor, QImage
+from PySide6.QtWidgets import QApplication
+from shiboken6 import delete as shiboken_delete
+
+from cutewindow.glyphs import Glyph
+from cutewindow.platforms.windows import CuteWindow
+from cutewindow.platforms.windows.title_bar.TitleBar import (
+    MaximizeButton,
+    MaximizeButtonState,
+    TitleBar,
+)
+from cutewindow.title_bar_theme import (
+    TitleBarTheme,
+    compiledTitleBarTheme,
+    compileTitleBarTheme,
+    setTitleBarTheme,
+)
+
+
+def test_maximize_button_ignores_redundant_states(qapp):
+    """Test that repeated hover states do not count as transitions."""
+    button = MaximizeButton(None)
+    stylesheet = button.styleSheet()
+
+    for _ in range(10):
+        button.setState(MaximizeButtonState.HOVER)
+    button.setState(MaximizeButtonState.NORMAL)
+
+    assert button.state() == MaximizeButtonState.NORMAL
+    assert button.stateStatistics() == {"transitions": 2, "redundant": 9}
+    assert button.styleSheet() == stylesheet
+
+
+def test_buttons_styled_by_one_application_stylesheet(qapp):
+    """Test that the theme is one application stylesheet, not one per button."""
+    title_bar = TitleBar(None)
+    buttons = [title_bar.minimize_button, title_bar.maximize_button]
+    buttons.append(title_bar.close_button)
+    assert [button.styleSheet() for button in buttons] == ["", "", ""]
+    stylesheet = qapp.styleSheet()
+    assert stylesheet.count(compiledTitleBarTheme().stylesheet) == 1
+
+    theme = compiledTitleBarTheme()
+    title_bar.maximize_button.setState(MaximizeButtonState.HOVER)
+    title_bar.close_button.setDown(True)
+    assert _cornerColor(title_bar.maximize_button) == theme.hover_color
+    assert _cornerColor(title_bar.close_button) == theme.close_pressed_color
+    assert _cornerColor(title_bar.minimize_button) != theme.hover_color
+
+    TitleBar(None)
+    assert qapp.styleSheet() == stylesheet
+
+
+def test_application_stylesheets_win_over_theme(qapp):
+    """Test that stylesheets set by the application still style the buttons."""
+    title_bar = TitleBar(None)
+    title_bar.setStyleSheet("#CloseButton { background-color: #00ff00; }")
+    title_bar.close_button.setObjectName("CloseButton")
+    title_bar.minimize_button.setStyleSheet("background-color: #0000ff;")
+
+    assert _cornerColor(title_bar.close_button) == QColor("#00ff00")
+    assert _cornerColor(title_bar.minimize_button) == QColor("#0000ff")
+
+
+def test_replaced_application_stylesheet_keeps_theme(qapp):
+    """Test that the theme is installed again next to a new app stylesheet."""
+    stylesheet = qapp.styleSheet()
+    try:
+        qapp.setStyleSheet("QLabel { color: red; }")
+        title_bar = TitleBar(None)
+        assert qapp.styleSheet().endswith("QLabel { color: red; }")
+        assert compiledTitleBarTheme().stylesheet in qapp.styleSheet()
+        assert title_bar.close_button.styleSheet() == ""
+    finally:
+        qapp.setStyleSheet(stylesheet)
+
+
+def test_set_title_bar_theme(qapp, monkeypatch):
+    """Test that a new theme is compiled once and applied to existing title bars."""
+    title_bar = TitleBar(None)
+    theme = TitleBarTheme(height=32, button_width=46, hover_color="#3A3A44")
+    # Themed widgets are tracked, not searched for
+    monkeypatch.setattr(QApplication, "allWidgets", None)
+    try:
+        setTitleBarTheme(theme)
+        assert "#3A3A44" in qapp.styleSheet()
+        assert compileTitleBarTheme(theme) is compiledTitleBarTheme()
+        assert title_bar.height() == 32
+        assert title_bar.close_button.width() == 46
+    finally:
+        setTitleBarTheme(TitleBarTheme())
+    assert title_bar.height() == 28
+
+
+def _cornerColor(button):
+    image = QImage(button.size(), QImage.Format_ARGB32)
+    image.fill(Qt.transparent)
+    button.render(image)
+    return image.pixelColor(1, 1)
+
+
+def test_window_state_changes_reach_title_bar(qapp):
+    """Test that the window notifies its title bar of state changes directly."""
+    window = CuteWindow()
+    title_bar = window.titleBar()
+    states = []
+    window.addWindowStateListener(states.append)
+
+    window.setWindowState(Qt.WindowMaximized)
+    assert title_bar.maximize_button.glyph() == Glyph.RESTORE
+    window.setWindowState(Qt.WindowNoState)
+    assert title_bar.maximize_button.glyph() == Glyph.MAXIMIZE
+    assert states == [Qt.WindowMaximized, Qt.WindowNoState]
+
+    window.removeWindowStateListener(states.append)
+    window.setWindowState(Qt.WindowMaximized)
+    assert len(states) == 2
+
+
+def test_replaced_title_bar_stops_listening(qapp):
+    """Test that a deleted title bar is no longer notified."""
+    window = CuteWindow()
+    title_bar = window.titleBar()
+    title_bar.setParent(None)
+    shiboken_delete(title_bar)
+    assert window._window_state_listeners == []
+    window.setTitleBar(TitleBar(window))
+
+    window.setWindowState(Qt.WindowMaximized)
+    assert window.titleBar().maximize_button.glyph() == Glyph.RESTORE
@@ -0,0 +1,99 @@
+"""Tests for cached window shapes."""
+
+import pytest
+from PySide6.QtCore import QPoint, QSize, Qt
+from PySide6.QtGui import QPainterPath
+
+from cutewindow.platforms.linux import CuteWindow as LinuxCuteWindow
+from cutewindow.platforms.windows import CuteWindow as WindowsCuteWindow
+from cutewindow.platforms.windows.native_api import IS_WINDOWS
+from cutewindow.platforms.windows.simulator import Win32Simulator
+from cutewindow.window_shape import PathShape, RoundedCorners, WindowShape
+
+
+def test_rounded_corners_region():
+    """Test that the corners are cut off and the edges are kept."""
+    region = RoundedCorners(10).region(QSize(200, 100))
+
+    for corner in (QPoint(0, 0), QPoint(199, 0), QPoint(0, 99), QPoint(199, 99)):
+        assert not region.contains(corner)
+    for inside in (QPoint(10, 0), QPoint(0, 50), QPoint(199, 50), QPoint(100, 99)):
+        assert region.contains(inside)
+    assert region.contains(QPoint(3, 3))
+
+
+def test_masks_are_cached_per_size():
+    """Test that a size seen before reuses its mask."""
+    shape = RoundedCorners(8, capacity=2)
+    first = shape.region(QSize(300, 200))
+    assert shape.region(QSize(300, 200)) is first
+    shape.region(QSize(301, 200))
+    shape.region(QSize(302, 200))
+
+    assert shape.statistics() == {"hits": 1, "misses": 3, "size": 2}
+
+
+def test_window_shape_is_abstract():
+    """Test that shapes without a build method cannot be created."""
+    with pytest.raises(TypeError):
+        WindowShape()  # type: ignore[abstract]
+
+
+def test_cost_does_not_grow_with_window_size():
+    """Test that a mask is as complex at 2000 pixels as at 200 pixels."""
+    small = RoundedCorners(12).region(QSize(200, 200))
+    large = RoundedCorners(12).region(QSize(2000, 2000))
+
+    assert small.rectCount() == large.rectCount()
+
+
+def test_path_shape():
+    """Test that a path shape masks everything outside of its outline."""
+
+    def ellipse(width, height):
+        path = QPainterPath()
+        path.addEllipse(0, 0, width, height)
+        return path
+
+    region = PathShape(ellipse).region(QSize(100, 100))
+    assert region.contains(QPoint(50, 50))
+    assert not region.contains(QPoint(2, 2))
+
+
+def test_mask_follows_resize_and_maximize(qapp):
+    """Test that a masked window is remasked on resize and unmasked maximized."""
+    window = LinuxCuteWindow()
+    window.resize(400, 300)
+    window.show()
+    shape = RoundedCorners(10)
+    window.setWindowShape(shape)
+    assert window.windowShape() is shape
+    assert not window.mask().contains(QPoint(0, 0))
+
+    window.resize(500, 300)
+    qapp.processEvents()
+    assert window.mask().boundingRect().width() == 500
+
+    window.setWindowState(Qt.WindowMaximized)
+    assert window.mask().isEmpty()
+    window.setWindowState(Qt.WindowNoState)
+    assert not window.mask().isEmpty()
+
+    window.setWindowShape(None)
+    assert window.mask().isEmpty()
+    window.close()
+
+
+@pytest.mark.skipif(IS_WINDOWS, reason="the Win32 simulator replaces the stub loader")
+def test_windows_rounds_corners_through_dwm(qapp):
+    """Test that DWM radii skip the mask and other radii fall back to it."""
+    with Win32Simulator() as simulator:
+        window = WindowsCuteWindow()
+        window.show()
+        window.setWindowShape(RoundedCorners(8))
+        assert window.mask().isEmpty()
+        assert simulator.stats.calls["DwmSetWindowAttribute"] == 1
+
+        window.setWindowShape(RoundedCorners(12))
+        assert not window.mask().isEmpty()
+        window.close()